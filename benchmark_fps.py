@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 import argparse
+from contextlib import contextmanager
 import statistics
 import time
 
 import mqdm as M
+import mqdm.bar as mqdm_bar
 
 try:
     import tqdm
@@ -127,21 +129,34 @@ def _bench_tqdm_manual(*, seconds: float, disable: bool) -> dict:
     }
 
 
-def _bench_iter(*, seconds: float, disable: bool, fast_fps_delta: float, transient: bool) -> dict:
+@contextmanager
+def _clock_skip(max_skip: int | None):
+    """Temporarily bound fast-advance clock sampling (``1`` = read the clock every call)."""
+    prev = mqdm_bar.MAX_CLOCK_SKIP
+    if max_skip is not None:
+        mqdm_bar.MAX_CLOCK_SKIP = max_skip
+    try:
+        yield
+    finally:
+        mqdm_bar.MAX_CLOCK_SKIP = prev
+
+
+def _bench_iter(*, seconds: float, disable: bool, fast_fps_delta: float, transient: bool, max_skip: int | None = None) -> dict:
     count = 0
     start = time.perf_counter()
     deadline = start + seconds
 
-    for _ in M.mqdm(
-        range(10**9),
-        disable=disable,
-        fast_fps_delta=fast_fps_delta,
-        leave=not transient,
-        desc=f"iter disable={disable} delta={fast_fps_delta}",
-    ):
-        count += 1
-        if time.perf_counter() >= deadline:
-            break
+    with _clock_skip(max_skip):
+        for _ in M.mqdm(
+            range(10**9),
+            disable=disable,
+            fast_fps_delta=fast_fps_delta,
+            leave=not transient,
+            desc=f"iter disable={disable} delta={fast_fps_delta}",
+        ):
+            count += 1
+            if time.perf_counter() >= deadline:
+                break
 
     elapsed = time.perf_counter() - start
     return {
@@ -177,6 +192,53 @@ def _bench_manual(*, seconds: float, disable: bool, fast_fps_delta: float, trans
     }
 
 
+def _bench_advance(*, seconds: float, disable: bool, transient: bool, max_skip: int | None = None) -> dict:
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+
+    with _clock_skip(max_skip), M.mqdm(
+        total=10**9,
+        disable=disable,
+        leave=not transient,
+        desc=f"advance disable={disable} max_skip={max_skip}",
+    ) as bar:
+        while True:
+            bar.advance()
+            count += 1
+            if time.perf_counter() >= deadline:
+                break
+
+    elapsed = time.perf_counter() - start
+    return {
+        "count": count,
+        "elapsed": elapsed,
+        "fps": count / elapsed if elapsed else 0.0,
+    }
+
+
+def _bench_construct(*, seconds: float, disable: bool) -> dict:
+    # short inner loops: per-bar setup dominates, e.g. a disabled bar per request
+    count = 0
+    items = list(range(8))
+    start = time.perf_counter()
+    deadline = start + seconds
+
+    while True:
+        for _ in M.mqdm(items, disable=disable, leave=False, desc="construct"):
+            pass
+        count += 1
+        if time.perf_counter() >= deadline:
+            break
+
+    elapsed = time.perf_counter() - start
+    return {
+        "count": count,
+        "elapsed": elapsed,
+        "fps": count / elapsed if elapsed else 0.0,
+    }
+
+
 BENCHES = {
     "vanilla-iter": lambda seconds: _bench_vanilla_iter(seconds=seconds),
     "enumerate-iter": lambda seconds: _bench_enum_iter(seconds=seconds),
@@ -189,9 +251,14 @@ BENCHES = {
     "iter-disabled": lambda seconds: _bench_iter(seconds=seconds, disable=True, fast_fps_delta=0.05, transient=True),
     "iter-direct": lambda seconds: _bench_iter(seconds=seconds, disable=False, fast_fps_delta=0.0, transient=True),
     "iter-batched": lambda seconds: _bench_iter(seconds=seconds, disable=False, fast_fps_delta=0.05, transient=True),
+    # before/after adaptive clock sampling: max_skip=1 reads the clock on every item
+    "iter-batched-clock-every": lambda seconds: _bench_iter(seconds=seconds, disable=False, fast_fps_delta=0.05, transient=True, max_skip=1),
     "manual-disabled": lambda seconds: _bench_manual(seconds=seconds, disable=True, fast_fps_delta=0.05, transient=True),
     "manual-direct": lambda seconds: _bench_manual(seconds=seconds, disable=False, fast_fps_delta=0.0, transient=True),
     "manual-batched": lambda seconds: _bench_manual(seconds=seconds, disable=False, fast_fps_delta=0.05, transient=True),
+    "manual-advance": lambda seconds: _bench_advance(seconds=seconds, disable=False, transient=True),
+    "manual-advance-clock-every": lambda seconds: _bench_advance(seconds=seconds, disable=False, transient=True, max_skip=1),
+    "construct-disabled": lambda seconds: _bench_construct(seconds=seconds, disable=True),
 }
 
 
@@ -252,6 +319,7 @@ def main() -> None:
             "tqdm-iter-enabled",
             "iter-disabled",
             "iter-batched",
+            "iter-batched-clock-every",
             "iter-direct",
             "vanilla-manual",
             "tqdm-manual-disabled",
@@ -259,6 +327,9 @@ def main() -> None:
             "manual-disabled",
             "manual-batched",
             "manual-direct",
+            "manual-advance",
+            "manual-advance-clock-every",
+            "construct-disabled",
         ],
         choices=sorted(BENCHES),
         help="Benchmark case(s) to run.",
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Measure ``import mqdm`` cost with ``python -X importtime``.
+
+Each run is a fresh interpreter. Pass ``--output`` to append the result to a
+JSON-lines file, so import time can be tracked across releases.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+# Heavy modules that ``import mqdm`` should not load on its own.
+WATCHED = ("rich", "asyncio", "concurrent.futures", "multiprocessing", "mqdm.events", "mqdm.parallel.pool")
+
+_PROBE = "import sys; {stmt}; print(' '.join(m for m in {watched!r} if m in sys.modules))"
+
+
+def _import_once(stmt: str, root: str) -> tuple[dict[str, int], list[str]]:
+    """Time one fresh import; return cumulative µs of ``root`` and what it pulled in."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(stmt=stmt, watched=WATCHED)],
+        capture_output=True, text=True, check=True,
+    )
+    # importtime prints children (indented) before their parent, so everything
+    # since the previous top-level import belongs to the next top-level one.
+    pending: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = line.split(":", 1)[1].split("|")
+        if not cum.strip().isdigit():
+            continue
+        pending[name.strip()] = int(cum)
+        if not name.startswith("  ") and name.strip() == root:
+            return pending, proc.stdout.split()
+        if not name.startswith("  "):
+            pending = {}
+    return {}, proc.stdout.split()
+
+
+def _run(stmt: str, *, repeats: int, top: int) -> dict:
+    root = stmt.split()[-1]
+    _import_once(stmt, root)  # warm the bytecode cache
+    runs = [_import_once(stmt, root) for _ in range(repeats)]
+    totals = [cum.get(root, 0) for cum, _ in runs]
+    children: dict[str, list[int]] = {}
+    for cum, _ in runs:
+        for name, us in cum.items():
+            if name != root:
+                children.setdefault(name, []).append(us)
+    slowest = sorted(((statistics.median(v), k) for k, v in children.items()), reverse=True)[:top]
+    return {
+        "stmt": stmt,
+        "median_ms": statistics.median(totals) / 1000,
+        "min_ms": min(totals) / 1000,
+        "loaded": runs[-1][1],
+        "slowest": [(name, us / 1000) for us, name in slowest],
+    }
+
+
+def _version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("mqdm")
+    except Exception:
+        return "unknown"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark mqdm import time.")
+    parser.add_argument("--stmt", default="import mqdm", help="Import statement to time (its last word is the module).")
+    parser.add_argument("--repeats", type=int, default=10, help="Number of fresh interpreters to time.")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest (cumulative) imports to list.")
+    parser.add_argument("--output", help="Append the result as one JSON line to this file.")
+    args = parser.parse_args()
+
+    result = _run(args.stmt, repeats=args.repeats, top=args.top)
+    print(f'{result["stmt"]}: {result["median_ms"]:.1f} ms median, {result["min_ms"]:.1f} ms min ({args.repeats} runs)')
+    print(f'heavy modules loaded: {", ".join(result["loaded"]) or "none"}')
+    print()
+    width = max((len(name) for name, _ in result["slowest"]), default=6)
+    print(f'{"module":{width}}  cumulative(ms)')
+    print(f'{"-" * width}  --------------')
+    for name, ms in result["slowest"]:
+        print(f"{name:{width}}  {ms:.2f}")
+
+    if args.output:
+        record = {"time": time.time(), "version": _version(), "python": sys.version.split()[0], **result}
+        with open(args.output, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
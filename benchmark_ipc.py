@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Benchmark process-mode command round trips between a worker and the owner.
+
+A child process drives a promoted (queue-backed) progress proxy the way a pool
+worker does and times each request, e.g. ``add_task`` / ``dump_task`` /
+``pop_task``, which block until the owner's dispatch thread replies.
+
+The ``wire`` cases time encoding + decoding one command in the compact format
+against pickling the plain tuple, and the ``throughput`` cases stream
+fire-and-forget commands from a worker to report commands per second. The
+``channels`` case runs the fan-in test for the queue, pipe and shared-memory
+ring channels at 1, 8 and 64 workers.
+"""
+import argparse
+import multiprocessing as mp
+import pickle
+import statistics
+import time
+
+import mqdm as M
+from mqdm.utils import wire
+from mqdm.utils.proxy import QueueTransport
+
+# Representative worker commands: (method, args, kwargs).
+_COMMANDS = {
+    "advances": ("apply_updates", ([(i, {"advance": 1}) for i in range(8)],), {}),
+    "updates": ("apply_updates", ([(1, {"advance": 3, "description": "step 2"}), (2, {"completed": 10, "total": 20})],), {}),
+    "insert_task": ("insert_task", (12, "download", True, 100, 0, True), {"transient": False}),
+    "write": ("write", ("processed item 12",), {}),
+}
+
+
+def _request_worker(proxy, method: str, count: int, out) -> None:
+    task_id = proxy.add_task(description="bench", total=count)
+    call = {
+        "add_task": lambda: proxy.add_task(description="x", total=1),
+        "dump_task": lambda: proxy.dump_task(task_id),
+        "pop_task": lambda: proxy.pop_task(proxy.add_task(description="x"), remove=True),
+    }[method]
+    call()  # open this thread's reply channel outside the measurement
+    samples = []
+    for _ in range(count):
+        t0 = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - t0)
+    out.put(samples)
+
+
+def _bench_requests(method: str, *, count: int, backend: str, channel: str) -> dict:
+    runtime = M.Runtime(create_backend=backend, transport_options={"channel": channel})
+    proxy = runtime.get_pbar(pool_mode="process")
+    out = mp.Queue()
+    try:
+        proc = mp.Process(target=_request_worker, args=(proxy, method, count, out))
+        proc.start()
+        samples = out.get()
+        proc.join()
+    finally:
+        runtime.clear_pbar(force=True)
+    samples.sort()
+    return {
+        "name": method,
+        "count": count,
+        "mean_us": statistics.mean(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p99_us": samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6,
+    }
+
+
+def _bench_idle_wakeups(*, seconds: float, backend: str, channel: str) -> dict:
+    """Process CPU time per second while the dispatch runs but nobody sends anything."""
+    runtime = M.Runtime(create_backend=backend, transport_options={"channel": channel})
+    runtime.get_pbar(pool_mode="process")
+    try:
+        cpu0 = time.process_time()
+        time.sleep(seconds)
+        cpu = time.process_time() - cpu0
+    finally:
+        runtime.clear_pbar(force=True)
+    return {
+        "name": "idle (cpu us/s)",
+        "count": 0,
+        "mean_us": cpu / seconds * 1e6,
+        "p50_us": float("nan"),
+        "p99_us": float("nan"),
+    }
+
+
+def _bench_wire(command: str, *, count: int, compact: bool) -> dict:
+    """Encode + decode one command per sample, including the queue's pickling of the payload."""
+    method, args, kwargs = _COMMANDS[command]
+    target_id = 140_000_000_000
+    if compact:
+        def roundtrip():
+            data = wire.encode("send", target_id, method, args, kwargs)
+            wire.decode(pickle.loads(pickle.dumps(data)))
+            return data
+    else:
+        def roundtrip():
+            data = pickle.dumps(("send", target_id, method, args, kwargs))
+            pickle.loads(data)
+            return data
+    size = len(pickle.dumps(roundtrip()))
+    samples = []
+    for _ in range(count):
+        t0 = time.perf_counter()
+        roundtrip()
+        samples.append(time.perf_counter() - t0)
+    samples.sort()
+    return {
+        "name": f'wire {command} ({"compact" if compact else "pickle"}, {size}B)',
+        "count": count,
+        "mean_us": statistics.mean(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p99_us": samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6,
+    }
+
+
+def _stream_worker(proxy, command: str, count: int, compact: bool, out) -> None:
+    QueueTransport.compact_methods = frozenset(wire.METHODS if compact else ())
+    method, args, kwargs = _COMMANDS[command]
+    if method == "insert_task":
+        args = (proxy.reserve_task_ids(1), *args[1:])
+    transport = proxy._transport
+    proxy.dump_tasks()  # open the reply channel outside the measurement
+    t0 = time.perf_counter()
+    for _ in range(count):
+        transport.send(method, args, kwargs)
+    proxy.dump_tasks()  # barrier: returns once the owner replayed every command
+    out.put(time.perf_counter() - t0)
+
+
+def _bench_throughput(command: str, *, count: int, backend: str, channel: str, compact: bool) -> dict:
+    """Fire-and-forget commands per second from one worker, measured end to end."""
+    runtime = M.Runtime(create_backend=backend, transport_options={"channel": channel})
+    proxy = runtime.get_pbar(pool_mode="process")
+    out = mp.Queue()
+    try:
+        proc = mp.Process(target=_stream_worker, args=(proxy, command, count, compact, out))
+        proc.start()
+        elapsed = out.get()
+        proc.join()
+    finally:
+        runtime.clear_pbar(force=True)
+    return {
+        "name": f'throughput {command} ({"compact" if compact else "pickle"}, cmd/s)',
+        "count": count,
+        "mean_us": count / elapsed,
+        "p50_us": float("nan"),
+        "p99_us": float("nan"),
+    }
+
+
+def _flood_worker(proxy, stop) -> None:
+    transport = proxy._transport
+    updates = ([(0, {"advance": 1})],)
+    while not stop.is_set():
+        for _ in range(100):
+            transport.send("apply_updates", updates, {})
+        time.sleep(0.001)  # keep the backlog bounded on small machines
+
+
+def _bench_request_under_flood(*, count: int, backend: str, channel: str) -> dict:
+    """Request latency from one worker while another worker streams updates."""
+    runtime = M.Runtime(create_backend=backend, transport_options={"channel": channel})
+    proxy = runtime.get_pbar(pool_mode="process")
+    out, stop = mp.Queue(), mp.Event()
+    try:
+        flooder = mp.Process(target=_flood_worker, args=(proxy, stop))
+        flooder.start()
+        time.sleep(0.5)
+        proc = mp.Process(target=_request_worker, args=(proxy, "dump_task", count, out))
+        proc.start()
+        samples = out.get()
+        proc.join()
+        stop.set()
+        flooder.join()
+    finally:
+        runtime.clear_pbar(force=True)
+    samples.sort()
+    return {
+        "name": f"dump_task under update flood ({channel})",
+        "count": count,
+        "mean_us": statistics.mean(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p99_us": samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6,
+    }
+
+
+def _fanin_worker(proxy, count: int, start, out) -> None:
+    transport = proxy._transport
+    updates = ([(0, {"advance": 1})],)
+    proxy.dump_tasks()  # open this worker's channel outside the measurement
+    out.put("ready")
+    start.wait()
+    for _ in range(count):
+        transport.send("apply_updates", updates, {})
+    proxy.dump_tasks()  # barrier: returns once the owner replayed this worker's commands
+    out.put("done")
+
+
+def _bench_fanin(*, workers: int, count: int, backend: str, channel: str) -> dict:
+    """Commands per second the owner absorbs with ``workers`` processes sending at once.
+
+    Also reports the owner's CPU time per command (dispatch thread included).
+    """
+    runtime = M.Runtime(create_backend=backend, transport_options={"channel": channel})
+    proxy = runtime.get_pbar(pool_mode="process")
+    out, start = mp.Queue(), mp.Event()
+    try:
+        procs = [mp.Process(target=_fanin_worker, args=(proxy, count, start, out)) for _ in range(workers)]
+        for proc in procs:
+            proc.start()
+        for _ in procs:
+            out.get()
+        t0, cpu0 = time.perf_counter(), time.process_time()
+        start.set()
+        for _ in procs:
+            out.get()
+        wall, cpu = time.perf_counter() - t0, time.process_time() - cpu0
+        for proc in procs:
+            proc.join()
+    finally:
+        runtime.clear_pbar(force=True)
+    return {
+        "name": f"fan-in x{workers} {channel} (cmd/s, owner cpu {cpu / (count * workers) * 1e6:.1f}us/cmd)",
+        "count": count * workers,
+        "mean_us": count * workers / wall,
+        "p50_us": float("nan"),
+        "p99_us": float("nan"),
+    }
+
+
+def _bench_channels(*, count: int, backend: str) -> list[dict]:
+    """Fan-in throughput of each worker channel across worker counts."""
+    return [
+        _bench_fanin(workers=workers, count=count, backend=backend, channel=channel)
+        for workers in (1, 8, 64) for channel in ("queue", "pipe", "ring")
+    ]
+
+
+BENCHES = {
+    "add_task": lambda args: _bench_requests("add_task", count=args.count, backend=args.backend, channel=args.channel),
+    "dump_task": lambda args: _bench_requests("dump_task", count=args.count, backend=args.backend, channel=args.channel),
+    "pop_task": lambda args: _bench_requests("pop_task", count=args.count, backend=args.backend, channel=args.channel),
+    "idle": lambda args: _bench_idle_wakeups(seconds=args.seconds, backend=args.backend, channel=args.channel),
+    "flood": lambda args: _bench_request_under_flood(count=args.count // 10, backend=args.backend, channel=args.channel),
+    "fanin": lambda args: _bench_fanin(workers=args.workers, count=args.count, backend=args.backend, channel=args.channel),
+    "channels": lambda args: _bench_channels(count=args.count, backend=args.backend),
+    **{
+        f"wire-{command}{suffix}": (lambda args, c=command, compact=compact: _bench_wire(c, count=args.count, compact=compact))
+        for command in _COMMANDS for suffix, compact in (("", True), ("-pickle", False))
+    },
+    **{
+        f"throughput-{command}{suffix}": (lambda args, c=command, compact=compact: _bench_throughput(
+            c, count=args.count * 10, backend=args.backend, channel=args.channel, compact=compact))
+        for command in ("advances", "write") for suffix, compact in (("", True), ("-pickle", False))
+    },
+}
+
+
+def _print_results(results: list[dict]) -> None:
+    headers = ("benchmark", "calls", "mean(us)", "p50(us)", "p99(us)")
+    rows = [
+        (r["name"], f'{r["count"]:,}', f'{r["mean_us"]:,.1f}', f'{r["p50_us"]:,.1f}', f'{r["p99_us"]:,.1f}')
+        for r in results
+    ]
+    widths = [max(len(row[i]) for row in [headers, *rows]) for i in range(len(headers))]
+    fmt = "  ".join(f"{{:{w}}}" for w in widths)
+    print(fmt.format(*headers))
+    print(fmt.format(*("-" * w for w in widths)))
+    for row in rows:
+        print(fmt.format(*row))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark mqdm process-mode IPC latency.")
+    parser.add_argument("--bench", nargs="+", default=list(BENCHES), choices=sorted(BENCHES), help="Benchmark case(s) to run.")
+    parser.add_argument("--count", type=int, default=2000, help="Requests per case.")
+    parser.add_argument("--seconds", type=float, default=2.0, help="Duration of the idle case.")
+    parser.add_argument("--backend", default="headless", help="Progress backend name (headless or rich).")
+    parser.add_argument("--channel", default="queue", choices=["queue", "pipe", "lanes", "socket", "ring"], help="Worker-to-owner command channel.")
+    parser.add_argument("--workers", type=int, default=8, help="Worker processes for the fan-in case.")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.bench:
+        result = BENCHES[name](args)
+        results.extend(result if isinstance(result, list) else [result])
+    _print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Measure the memory held per mqdm bar object with tracemalloc."""
+import argparse
+import gc
+import tracemalloc
+
+import mqdm as M
+
+
+def _make_disabled(i: int):
+    return M.mqdm(disable=True, total=10)
+
+
+def _make_disabled_iter(i: int):
+    bar = M.mqdm(range(10), disable=True)
+    iter(bar)
+    return bar
+
+
+def _make_detached(i: int):
+    # the shape of a transient worker bar restored from a task snapshot
+    return M.mqdm(task_id={'id': i, 'description': 'task', 'completed': 0, 'total': 10}, disable=True)
+
+
+BENCHES = {
+    "disabled": _make_disabled,
+    "disabled-iter": _make_disabled_iter,
+    "detached": _make_detached,
+}
+
+
+def _run_case(name: str, *, count: int) -> dict:
+    make = BENCHES[name]
+    make(-1)  # warm up caches/lazy imports outside the measurement
+    gc.collect()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    bars = [make(i) for i in range(count)]
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    bars_size = count * 8  # the list's own pointer array, not the bars
+    del bars
+    return {
+        "name": name,
+        "count": count,
+        "bytes_per_bar": (after - before - bars_size) / count,
+        "peak_per_bar": (peak - before - bars_size) / count,
+    }
+
+
+def _print_results(results: list[dict]) -> None:
+    headers = ("benchmark", "bars", "bytes/bar", "peak/bar")
+    rows = [
+        (r["name"], f'{r["count"]:,}', f'{r["bytes_per_bar"]:,.0f}', f'{r["peak_per_bar"]:,.0f}')
+        for r in results
+    ]
+    widths = [max(len(row[i]) for row in [headers, *rows]) for i in range(len(headers))]
+    fmt = "  ".join(f"{{:{w}}}" for w in widths)
+    print(fmt.format(*headers))
+    print(fmt.format(*("-" * w for w in widths)))
+    for row in rows:
+        print(fmt.format(*row))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark mqdm per-bar memory.")
+    parser.add_argument(
+        "--bench",
+        nargs="+",
+        default=list(BENCHES),
+        choices=sorted(BENCHES),
+        help="Benchmark case(s) to run.",
+    )
+    parser.add_argument("--count", type=int, default=100_000, help="Number of bars to keep alive per case.")
+    args = parser.parse_args()
+
+    _print_results([_run_case(name, count=args.count) for name in args.bench])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Measure mqdm's per-task pool overhead and process-pool worker utilization.
+
+Each case maps a no-op function over ``--count`` items with 8, 64 or 512
+thread workers and reports the wall time per task, so what is left is the cost
+of the pool loop itself: submitting, waiting for completions, and updating the
+bar.
+
+The ``prefetch`` cases run short (sleeping) tasks on a process pool with
+``prefetch_`` equal to ``n_workers`` versus the default ``2 * n_workers`` and
+report worker utilization: the time the tasks themselves account for over
+``n_workers * wall``. The ``shared-kw`` case passes a large keyword argument
+to every task of a process pool, which workers receive once rather than per task.
+"""
+import argparse
+import time
+from functools import partial
+
+import mqdm as M
+
+
+def _noop(x):
+    return x
+
+
+def _measure(x, table=b""):
+    return x + len(table)
+
+
+def _nap(seconds, x):
+    time.sleep(seconds)
+    return x
+
+
+def _bench_pool(*, workers: int, count: int, backend: str) -> dict:
+    runtime = M.Runtime(create_backend=backend)
+    M.pool(_noop, range(workers), pool_mode='thread', n_workers=workers, runtime=runtime)  # start-up outside the measurement
+    samples = []
+    for _ in range(3):
+        t0 = time.perf_counter()
+        M.pool(_noop, range(count), pool_mode='thread', n_workers=workers, runtime=runtime)
+        samples.append(time.perf_counter() - t0)
+    return {
+        "name": f"thread pool x{workers}",
+        "count": count,
+        "best_us": min(samples) / count * 1e6,
+        "mean_us": sum(samples) / len(samples) / count * 1e6,
+        "utilization": float("nan"),
+    }
+
+
+def _bench_prefetch(*, prefetch: int | None, workers: int, count: int, task_s: float, backend: str) -> dict:
+    runtime = M.Runtime(create_backend=backend)
+    fn = partial(_nap, task_s)
+    t0 = time.perf_counter()
+    M.pool(fn, range(count), pool_mode='process', n_workers=workers, prefetch_=prefetch, runtime=runtime)
+    wall = time.perf_counter() - t0
+    return {
+        "name": f"process x{workers} {task_s * 1e3:g}ms tasks, prefetch_={prefetch or 2 * workers}",
+        "count": count,
+        "best_us": wall / count * 1e6,
+        "mean_us": wall / count * 1e6,
+        "utilization": count * task_s / (workers * wall),
+    }
+
+
+def _bench_shared_kw(*, workers: int, count: int, kw_bytes: int, backend: str) -> dict:
+    runtime = M.Runtime(create_backend=backend)
+    table = bytes(kw_bytes)
+    t0 = time.perf_counter()
+    M.pool(_measure, range(count), pool_mode='process', n_workers=workers, table=table, runtime=runtime)
+    wall = time.perf_counter() - t0
+    return {
+        "name": f"process x{workers} with a {kw_bytes // 1024}KiB shared kwarg",
+        "count": count,
+        "best_us": wall / count * 1e6,
+        "mean_us": wall / count * 1e6,
+        "utilization": float("nan"),
+    }
+
+
+BENCHES = {
+    f"thread-{workers}": (lambda args, w=workers: _bench_pool(workers=w, count=args.count, backend=args.backend))
+    for workers in (8, 64, 512)
+}
+BENCHES.update({
+    f"prefetch-{name}": (lambda args, p=prefetch: _bench_prefetch(
+        prefetch=p(args.workers), workers=args.workers, count=args.count // 10, task_s=args.task_ms / 1e3, backend=args.backend))
+    for name, prefetch in (("1x", lambda w: w), ("default", lambda w: None))
+})
+BENCHES["shared-kw"] = lambda args: _bench_shared_kw(
+    workers=args.workers, count=args.count // 10, kw_bytes=256 * 1024, backend=args.backend)
+
+
+def _print_results(results: list[dict]) -> None:
+    headers = ("benchmark", "tasks", "best(us/task)", "mean(us/task)", "utilization")
+    rows = [
+        (r["name"], f'{r["count"]:,}', f'{r["best_us"]:,.1f}', f'{r["mean_us"]:,.1f}', f'{r["utilization"]:.0%}' if r["utilization"] == r["utilization"] else "-")
+        for r in results
+    ]
+    widths = [max(len(row[i]) for row in [headers, *rows]) for i in range(len(headers))]
+    fmt = "  ".join(f"{{:{w}}}" for w in widths)
+    print(fmt.format(*headers))
+    print(fmt.format(*("-" * w for w in widths)))
+    for row in rows:
+        print(fmt.format(*row))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark mqdm pool per-task overhead.")
+    parser.add_argument("--bench", nargs="+", default=list(BENCHES), choices=list(BENCHES), help="Benchmark case(s) to run.")
+    parser.add_argument("--count", type=int, default=20000, help="Tasks per run.")
+    parser.add_argument("--workers", type=int, default=4, help="Process workers for the prefetch cases.")
+    parser.add_argument("--task-ms", type=float, default=1.0, help="Duration of each prefetch-case task.")
+    parser.add_argument("--backend", default="headless", help="Progress backend name (headless or rich).")
+    args = parser.parse_args()
+
+    _print_results([BENCHES[name](args) for name in args.bench])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .runtime import Runtime, _current_runtime, _runtime, configure, using
 
 
@@ -116,27 +119,67 @@ def uninstall_logging(*, logger=None):
 # ----------------------------------- Utils ---------------------------------- #
 
 from . import utils
-from .parallel.executor import T_POOL_MODE, get_executor, Initializer
 from .utils import args, fn, fopen, ratelimit
-from .utils._logging import MQDMHandler
-
-# --------------------------------- Columns ---------------------------------- #
-# Progress columns for customizing bar layout via ``backend_options["columns"]``.
-from .utils import columns
-
-# ---------------------------------- Events ---------------------------------- #
-
-from . import events
 
 # ----------------------------------- Core ----------------------------------- #
 
 from .bar import mqdm
-from .parallel.pool import ipool, pool, PoolError, Result
-from .parallel.apool import aipool, apool
 
-# ----------------------------- Development utils ---------------------------- #
+# ------------------------------- Lazy exports ------------------------------- #
+# Pools (concurrent.futures / asyncio), Rich columns, events, logging and the
+# dev utils load on first attribute access, so ``import mqdm`` stays cheap for
+# scripts that never draw a bar.
+
+_LAZY_EXPORTS = {
+    # name: (module, attribute or None for the module itself)
+    'T_POOL_MODE': ('.parallel.executor', 'T_POOL_MODE'),
+    'get_executor': ('.parallel.executor', 'get_executor'),
+    'Initializer': ('.parallel.executor', 'Initializer'),
+    'MQDMHandler': ('.utils._logging', 'MQDMHandler'),
+    # Progress columns for customizing bar layout via ``backend_options["columns"]``.
+    'columns': ('.utils.columns', None),
+    'events': ('.events', None),
+    'ipool': ('.parallel.pool', 'ipool'),
+    'pool': ('.parallel.pool', 'pool'),
+    'Pool': ('.parallel.pool', 'Pool'),
+    'PoolError': ('.parallel.pool', 'PoolError'),
+    'Result': ('.parallel.pool', 'Result'),
+    'shared': ('.utils.shared', 'shared'),
+    'aipool': ('.parallel.apool', 'aipool'),
+    'apool': ('.parallel.apool', 'apool'),
+    'bp': ('.utils._dev', 'bp'),
+    'embed': ('.utils._dev', 'embed'),
+    'iex': ('.utils._dev', 'iex'),
+    'profile': ('.utils._dev', 'profile'),
+    'timeit': ('.utils._dev', 'timeit'),
+}
+
+if TYPE_CHECKING:
+    from . import events
+    from .parallel.executor import T_POOL_MODE, get_executor, Initializer
+    from .utils._logging import MQDMHandler
+    from .utils import columns
+    from .parallel.pool import ipool, pool, Pool, PoolError, Result
+    from .parallel.apool import aipool, apool
+    from .utils.shared import shared
+    from .utils._dev import bp, embed, iex, profile, timeit
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = import_module(module_name, __name__)
+    if attr is not None:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_EXPORTS})
 
-from .utils._dev import bp, embed, iex, profile, timeit
 
 __all__ = [
     'mqdm',
@@ -144,10 +187,12 @@ __all__ = [
     'ipool',
     'apool',
     'aipool',
+    'Pool',
     'print',
     'sustain',
     'pause',
     'args',
+    'shared',
     'PoolError',
     'configure',
     'using',
@@ -7,6 +7,7 @@ from .protocols import (
     ProgressBackendFactory,
     ProxyConvertibleBackend,
     RichTaskState,
+    SharedCounterBackend,
     TaskState,
 )
 from .protocols import ProgressBackendFactory as _PF  # noqa: F401 — re-export
@@ -22,3 +23,32 @@ def create_backend(
 
     return rich.Progress(**kw)
 
+
+def create_headless_backend(
+    *,
+    runtime: Any,
+    **kw: Any,
+) -> ProgressBackend:
+    from . import headless
+
+    return headless.HeadlessProgress(**kw)
+
+
+#: Built-in backend factories, selectable by name via ``create_backend=``.
+BACKENDS: dict[str, ProgressBackendFactory] = {
+    'rich': create_backend,
+    'headless': create_headless_backend,
+}
+
+
+def get_backend_factory(create_backend: str | ProgressBackendFactory) -> ProgressBackendFactory:
+    """Resolve a built-in backend name (see :data:`BACKENDS`) or pass a factory through."""
+    if not isinstance(create_backend, str):
+        return create_backend
+    try:
+        return BACKENDS[create_backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown progress backend {create_backend!r}; expected one of {sorted(BACKENDS)} or a callable."
+        ) from None
+
@@ -0,0 +1,274 @@
+"""A progress backend that only keeps counters — no rendering, no Rich.
+
+Meant for services and CI jobs where nobody watches a terminal: tasks are plain
+slotted records, nothing refreshes in the background, and ``write`` falls back
+to the builtin ``print``. Select it with ``Runtime(create_backend='headless')``
+or ``mqdm.configure(create_backend='headless')``.
+"""
+from __future__ import annotations
+
+import builtins
+import threading
+from time import monotonic
+from typing import Any
+
+from .protocols import TaskState
+from .proxy import BackendProxy, SharedCounterOwner
+from ..utils.proxy import proxymethod
+
+# Rich console keywords that have no meaning for a plain ``print``.
+_PRINT_KEYS = ('sep', 'end', 'file', 'flush')
+
+
+class HeadlessTask:
+    """Counters, timestamps and fields of one task."""
+
+    __slots__ = (
+        'id', 'description', 'total', 'completed', 'visible', 'fields',
+        'start_time', 'stop_time', 'finished_time',
+    )
+
+    def __init__(
+        self,
+        id: int,
+        description: str = '',
+        total: float | None = None,
+        completed: float = 0,
+        visible: bool = True,
+        fields: dict[str, Any] | None = None,
+        start_time: float | None = None,
+        stop_time: float | None = None,
+        finished_time: float | None = None,
+    ) -> None:
+        self.id = id
+        self.description = description
+        self.total = total
+        self.completed = completed
+        self.visible = visible
+        self.fields = fields if fields is not None else {}
+        self.start_time = start_time
+        self.stop_time = stop_time
+        self.finished_time = finished_time
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_time is not None
+
+    def to_dict(self) -> TaskState:
+        return {k: getattr(self, k) for k in self.__slots__}  # type: ignore[return-value]
+
+
+class HeadlessProgress(SharedCounterOwner):
+    """Counter-only :class:`~mqdm.backend.ProgressBackend`.
+
+    Accepts (and ignores) the Rich display options mqdm forwards from
+    ``backend_options``, so switching backends doesn't require changing them.
+    """
+
+    multiprocess = False
+
+    def __init__(self, *, refresh_per_second: float = 8, shared_counters: int = 0, get_time=None, **kw: Any) -> None:
+        self.refresh_per_second = refresh_per_second
+        self.get_time = get_time or monotonic
+        self._shared_counters = shared_counters
+        self._lock = threading.RLock()
+        self._tasks: dict[int, HeadlessTask] = {}
+        self._task_index = 0
+        self.started = False
+
+    @property
+    def tasks(self) -> list[HeadlessTask]:
+        with self._lock:
+            return list(self._tasks.values())
+
+    # ---------------------------------- Control --------------------------------- #
+
+    def start(self) -> None:
+        self.started = True
+
+    def stop(self) -> None:
+        self.started = False
+
+    def refresh(self) -> None:
+        self._sync_counters()
+
+    # ---------------------------------- Output ---------------------------------- #
+
+    def write(self, *args: Any, **kw: Any) -> None:
+        builtins.print(*args, **{k: kw[k] for k in _PRINT_KEYS if k in kw})
+
+    # ------------------------------ Task Management ----------------------------- #
+
+    def add_task(
+        self,
+        description: str = '',
+        start: bool = True,
+        total: float | None = None,
+        completed: int = 0,
+        visible: bool = True,
+        **fields: Any,
+    ) -> int:
+        with self._lock:
+            task = HeadlessTask(self._task_index, description or '', total, completed, visible, fields)
+            if start:
+                task.start_time = self.get_time()
+            self._tasks[task.id] = task
+            self._task_index += 1
+        return task.id
+
+    def reserve_task_ids(self, count: int) -> int:
+        """Reserve ``count`` consecutive task ids (for :meth:`insert_task`); returns the first."""
+        with self._lock:
+            first = self._task_index
+            self._task_index += count
+        return first
+
+    def insert_task(
+        self,
+        task_id: int,
+        description: str = '',
+        start: bool = True,
+        total: float | None = None,
+        completed: int = 0,
+        visible: bool = True,
+        **fields: Any,
+    ) -> None:
+        """Add a task under an id the caller already holds (see :meth:`reserve_task_ids`)."""
+        with self._lock:
+            task = HeadlessTask(task_id, description or '', total, completed, visible, fields)
+            if start:
+                task.start_time = self.get_time()
+            self._tasks[task_id] = task
+            if task_id >= self._task_index:
+                self._task_index = task_id + 1
+
+    def update(
+        self,
+        task_id: int,
+        *,
+        total: float | None = None,
+        completed: float | None = None,
+        advance: float | None = None,
+        description: str | None = None,
+        visible: bool | None = None,
+        refresh: bool = False,
+        **fields: Any,
+    ) -> None:
+        with self._lock:
+            task = self._tasks[task_id]
+            if total is not None and total != task.total:
+                task.total = total
+                task.finished_time = None
+            if advance is not None:
+                task.completed += advance
+            if completed is not None:
+                task.completed = completed
+            if description is not None:
+                task.description = description
+            if visible is not None:
+                task.visible = visible
+            task.fields.update(fields)
+            if task.total is not None and task.completed >= task.total and task.finished_time is None:
+                task.finished_time = self.get_time() - (task.start_time or 0)
+
+    def try_update(self, task_id: int, **kw: Any) -> None:
+        try:
+            self.update(task_id, **kw)
+        except KeyError:
+            pass
+
+    update_ = try_update
+
+    def apply_updates(self, updates) -> None:
+        """Apply a batch of ``(task_id, update)`` pairs under one lock acquisition."""
+        with self._lock:
+            for task_id, kw in updates:
+                self.try_update(task_id, **kw)
+
+    def start_task(self, task_id: int) -> None:
+        with self._lock:
+            task = self._tasks[task_id]
+            if task.start_time is None:
+                task.start_time = self.get_time()
+
+    def stop_task(self, task_id: int) -> None:
+        with self._lock:
+            task = self._tasks[task_id]
+            current_time = self.get_time()
+            if task.start_time is None:
+                task.start_time = current_time
+            task.stop_time = current_time
+
+    def remove_task(self, task_id: int) -> None:
+        with self._lock:
+            del self._tasks[task_id]
+
+    # ------------------------------ Task Snapshots ------------------------------ #
+
+    def dump_tasks(self) -> dict[int, TaskState]:
+        self._sync_counters()
+        with self._lock:
+            return {task_id: task.to_dict() for task_id, task in self._tasks.items()}
+
+    def dump_task(self, task_id: int) -> TaskState:
+        self._sync_counters()
+        with self._lock:
+            return self._tasks[task_id].to_dict()
+
+    def load_task(self, task: TaskState, start: bool = True) -> None:
+        # Snapshots from other backends may carry extra keys (e.g. Rich's
+        # progress samples); only the fields tracked here are restored.
+        data = {k: task[k] for k in HeadlessTask.__slots__ if k in task}
+        with self._lock:
+            loaded = HeadlessTask(**data)
+            if start and loaded.start_time is None:
+                loaded.start_time = self.get_time()
+            self._tasks[loaded.id] = loaded
+            if loaded.id >= self._task_index:
+                self._task_index = loaded.id + 1
+
+    def pop_task(self, task_id: int, remove: bool | None = None) -> TaskState | None:
+        """Close a task and return its serialized data."""
+        try:
+            self.stop_task(task_id)
+            data = self.dump_task(task_id)
+            if remove is None:
+                remove = self._tasks[task_id].fields.get('transient', False)
+            if remove:
+                self.remove_task(task_id)
+            return data
+        except KeyError:
+            return None
+        finally:
+            self._release_counter(task_id)
+
+    # ------------------------- Multiprocessing Upgrade -------------------------- #
+
+    def convert_proxy(self, command_dispatch=None) -> HeadlessProgressProxy:
+        """Convert to a multiprocessing-safe proxy object."""
+        proxy = HeadlessProgressProxy.from_target(self, command_dispatch=command_dispatch)
+        self._attach_counters(proxy, command_dispatch)
+        return proxy
+
+
+class HeadlessProgressProxy(BackendProxy[HeadlessProgress]):
+    start = proxymethod(HeadlessProgress.start, expect_reply=False, owner_only=True)
+    stop = proxymethod(HeadlessProgress.stop, expect_reply=False, owner_only=True)
+    refresh = proxymethod(HeadlessProgress.refresh, expect_reply=False, owner_only=True)
+
+    write = proxymethod(HeadlessProgress.write, expect_reply=False)
+
+    insert_task = proxymethod(HeadlessProgress.insert_task, expect_reply=False)
+    reserve_task_ids = proxymethod(HeadlessProgress.reserve_task_ids)
+    apply_updates = proxymethod(HeadlessProgress.apply_updates, expect_reply=False)
+    dump_task = proxymethod(HeadlessProgress.dump_task)
+    load_task = proxymethod(HeadlessProgress.load_task, expect_reply=False)
+    pop_task = proxymethod(HeadlessProgress.pop_task)
+    claim_counter = proxymethod(HeadlessProgress.claim_counter, expect_reply=False, worker_only=True)
+    dump_tasks = proxymethod(HeadlessProgress.dump_tasks)
+
+    @classmethod
+    def from_target(cls, target: HeadlessProgress, *, command_dispatch=None) -> HeadlessProgressProxy:
+        proxy = super().from_target(target, command_dispatch=command_dispatch)
+        proxy.update_interval = 1 / target.refresh_per_second
+        return proxy
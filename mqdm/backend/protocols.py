@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Protocol, TypedDict, runtime_checkable
+from typing import TYPE_CHECKING, Any, Callable, Protocol, TypedDict, runtime_checkable
+
+if TYPE_CHECKING:
+    from ..utils.counters import CounterSlot
 
 
 class TaskState(TypedDict, total=False):
@@ -69,3 +72,10 @@ class ProxyConvertibleBackend(Protocol):
     """Optional capability for backends that can promote themselves for IPC."""
 
     def convert_proxy(self, command_dispatch=None) -> ProgressBackend: ...
+
+
+@runtime_checkable
+class SharedCounterBackend(Protocol):
+    """Optional capability for backends that let workers write counts to shared memory."""
+
+    def counter(self, task_id: int) -> CounterSlot | None: ...
@@ -0,0 +1,173 @@
+"""Backend-independent pieces of process-mode progress proxies.
+
+Both the Rich and the headless backends promote themselves to a
+:class:`BackendProxy` for process pools. This module holds what they share —
+worker-side update batching, shared-memory counters, and the owner-side counter
+bookkeeping — without importing any rendering library.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from typing import Generic
+from multiprocessing import util as mp_util
+
+from ..utils.counters import CounterSlot, SharedCounterTable
+from ..utils.proxy import TRef, TransportProxy, UpdateBuffer
+
+
+class SharedCounterOwner:
+    """Owner-side shared-memory counters for a backend.
+
+    Expects ``self._lock``, a ``self._tasks`` mapping of objects with
+    ``completed``/``total`` attributes, and an ``update(task_id, **kw)`` method.
+    """
+
+    # Number of shared-memory counter slots to offer process workers once
+    # promoted to a proxy (0 disables the table; every update uses the queue).
+    _shared_counters: int = 0
+    _counters: SharedCounterTable | None = None
+
+    def claim_counter(self, task_id) -> None:
+        """Give a task a shared counter slot, if the table has room for it."""
+        table = self._counters
+        if table is None:
+            return
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is not None:
+                table.claim(task_id)
+
+    def _release_counter(self, task_id) -> None:
+        if self._counters is not None:
+            self._counters.release(task_id)
+
+    def _sync_counters(self) -> None:
+        table = self._counters
+        if table is None or not table.claimed:
+            return
+        with self._lock:
+            for task_id, slot in list(table.claimed.items()):
+                task = self._tasks.get(task_id)
+                if task is None:
+                    table.release(task_id)
+                    continue
+                completed, total = table.read(slot)
+                if completed is None:  # the worker still sends regular updates
+                    continue
+                if completed != task.completed or (total is not None and total != task.total):
+                    self.update(task_id, completed=completed, total=total)
+
+    def _attach_counters(self, proxy: BackendProxy, command_dispatch) -> None:
+        if self._shared_counters and command_dispatch is not None:
+            if self._counters is None:
+                self._counters = SharedCounterTable(self._shared_counters)
+            proxy.counters = self._counters
+
+
+class BackendProxy(TransportProxy[TRef], Generic[TRef]):
+    """Process-mode proxy base that batches worker updates per frame.
+
+    Subclasses declare the forwarded backend methods with ``proxymethod`` and
+    must expose ``claim_counter`` for :meth:`counter` and ``reserve_task_ids`` /
+    ``insert_task`` for :meth:`add_task`.
+    """
+
+    multiprocess = True
+    # Seconds between coalesced update batches sent from a worker; from_target
+    # matches it to the owner's refresh rate so each frame gets one batch.
+    update_interval: float = 0.1
+    # Shared counter table, when the owner enabled ``shared_counters``.
+    counters: SharedCounterTable | None = None
+    # Task ids a worker reserves per round trip; see add_task.
+    task_id_block: int = 64
+
+    def __init__(self, transport):
+        super().__init__(transport)
+        self._updates: UpdateBuffer | None = None
+        self._task_ids: Iterator[int] | None = None
+        self._task_ids_lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_updates'] = None  # buffered updates (and their thread) stay in this process
+        state['_task_ids'] = None  # reserved ids belong to this process
+        del state['_task_ids_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._task_ids_lock = threading.Lock()
+
+    # ------------------------------ Task creation ------------------------------- #
+    #  a worker takes task ids from a block reserved with one request, then      #
+    #  creates each task fire-and-forget, so starting a bar never waits on the   #
+    #  owner. Later commands for the task follow it through the same queue.     #
+
+    def add_task(self, description='', start=True, total=None, completed=0, visible=True, **fields):
+        if self._proxy_is_owner():
+            return self.target.add_task(description, start, total, completed, visible, **fields)
+        task_id = self._next_task_id()
+        self.insert_task(task_id, description, start, total, completed, visible, **fields)
+        return task_id
+
+    def _next_task_id(self) -> int:
+        with self._task_ids_lock:
+            task_id = next(self._task_ids, None) if self._task_ids is not None else None
+            if task_id is None:
+                first = self.reserve_task_ids(self.task_id_block)
+                self._task_ids = iter(range(first + 1, first + self.task_id_block))
+                task_id = first
+            return task_id
+
+    # ------------------------------ Update batching ----------------------------- #
+    #  worker updates are merged per task and shipped as one ``apply_updates``    #
+    #  batch per frame. Every other command flushes the buffer first, so the      #
+    #  owner still sees updates in order relative to output and task lifecycle.   #
+
+    def try_update(self, task_id, **kw):
+        if self._proxy_is_owner():
+            return self.target.try_update(task_id, **kw)
+        updates = self._updates
+        if updates is None:
+            updates = self._updates = UpdateBuffer(self._send_updates, self.update_interval)
+            mp_util.Finalize(self, _flush_quietly, args=(updates,), exitpriority=10)
+        updates.add(task_id, kw)
+
+    update_ = try_update
+
+    def counter(self, task_id) -> CounterSlot | None:
+        """Return a shared counter slot for a worker's task, or ``None`` to use updates.
+
+        The slot becomes writable once the owner processes the claim; until
+        then :meth:`CounterSlot.set` returns ``False`` and callers fall back to
+        :meth:`try_update`.
+        """
+        if self.counters is None or self._proxy_is_owner():
+            return None
+        self.claim_counter(task_id)
+        return self.counters.slot(task_id)
+
+    def flush_updates(self) -> None:
+        """Send any buffered worker updates now."""
+        if self._updates is not None:
+            self._updates.flush()
+
+    def _send_updates(self, updates):
+        self._transport.send('apply_updates', (updates,), {})
+
+    def _proxy_send(self, method, args, kwargs):
+        self.flush_updates()
+        super()._proxy_send(method, args, kwargs)
+
+    def _proxy_request(self, method, args, kwargs):
+        self.flush_updates()
+        return super()._proxy_request(method, args, kwargs)
+
+
+def _flush_quietly(updates: UpdateBuffer) -> None:
+    """Exit-time flush for worker processes; the owner may already be gone."""
+    try:
+        updates.flush()
+    except Exception:
+        pass
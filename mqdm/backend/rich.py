@@ -8,7 +8,8 @@ from rich import progress
 import mqdm as M
 
 from .protocols import RichTaskState, TaskState
-from ..utils.proxy import TransportProxy, proxymethod
+from .proxy import BackendProxy, SharedCounterOwner
+from ..utils.proxy import proxymethod
 
 
 class _DiscardFile:
@@ -80,7 +81,7 @@ class TaskSnapshot:
         return cls(**data)
 
 
-class Progress(progress.Progress):
+class Progress(SharedCounterOwner, progress.Progress):
     multiprocess = False
 
     # ---------------------------------------------------------------------------- #
@@ -89,10 +90,11 @@ class Progress(progress.Progress):
     #  process-safe proxy promotion independent of Rich's in-process-only state.   #
     # ---------------------------------------------------------------------------- #
 
-    def __init__(self, *, columns=None, _tasks=None, _task_index=None, _pause_event=None, silent=False, **kw):
+    def __init__(self, *, columns=None, _tasks=None, _task_index=None, _pause_event=None, silent=False, shared_counters=0, **kw):
         if columns is None:
             columns = self.default_progress_columns()
         self._init_options = dict(kw)
+        self._shared_counters = shared_counters
         if silent:
             self._init_options['silent'] = True
             kw.setdefault('console', Console(file=_DiscardFile(), force_terminal=True))
@@ -124,6 +126,10 @@ class Progress(progress.Progress):
 
     # -------------------------------- Rich API --------------------------------- #
 
+    def get_renderable(self):
+        self._sync_counters()
+        return super().get_renderable()
+
     def write(self, *args, **kw):
         """Print above the live progress display.
 
@@ -148,6 +154,12 @@ class Progress(progress.Progress):
 
     update_ = try_update
 
+    def apply_updates(self, updates):
+        """Apply a batch of ``(task_id, update)`` pairs under one lock acquisition."""
+        with self._lock:
+            for task_id, kw in updates:
+                self.try_update(task_id, **kw)
+
     # ---------------------------------------------------------------------------- #
     #                           Task Lifecycle / Mutation                          #
     #  these overrides funnel task creation and lifecycle through mqdm-owned       #
@@ -165,8 +177,13 @@ class Progress(progress.Progress):
                   completed: int = 0,
                   visible: bool = True,
                   **fields):
+        task = self._make_task(self._task_index, description, start, total, completed, visible, **fields)
+        self._task_index = progress.TaskID(int(self._task_index) + 1)
+        return task
+
+    def _make_task(self, task_id, description, start, total, completed, visible, **fields):
         task = Task(
-            self._task_index,
+            task_id,
             description,
             total,
             completed,
@@ -176,7 +193,6 @@ class Progress(progress.Progress):
             _lock=self._lock,
         )
         start and self._start_task(task)
-        self._task_index = progress.TaskID(int(self._task_index) + 1)
         return task
 
     def add_task(
@@ -194,6 +210,31 @@ class Progress(progress.Progress):
         self.refresh()
         return task.id
 
+    def reserve_task_ids(self, count: int) -> int:
+        """Reserve ``count`` consecutive task ids (for :meth:`insert_task`); returns the first."""
+        with self._lock:
+            first = int(self._task_index)
+            self._task_index = progress.TaskID(first + count)
+        return first
+
+    def insert_task(
+        self,
+        task_id: int,
+        description: str='',
+        start: bool = True,
+        total: float|None = None,
+        completed: int = 0,
+        visible: bool = True,
+        **fields,
+    ) -> None:
+        """Add a task under an id the caller already holds (see :meth:`reserve_task_ids`)."""
+        with self._lock:
+            task = self._make_task(progress.TaskID(task_id), description or '', start, total, completed, visible, **fields)
+            self._tasks[task.id] = task
+            if task.id >= self._task_index:
+                self._task_index = progress.TaskID(task.id+1)
+        self.refresh()
+
     def start_task(self, task_id: progress.TaskID) -> None:
         with self._lock:
             self._start_task(self._tasks[task_id])
@@ -219,6 +260,7 @@ class Progress(progress.Progress):
             return {task_id: self._dump_task(self._tasks[task_id]).to_dict() for task_id in self._tasks}
 
     def dump_task(self, task_id) -> RichTaskState:
+        self._sync_counters()
         with self._lock:
             return self._dump_task(self._tasks[task_id]).to_dict()
 
@@ -258,6 +300,8 @@ class Progress(progress.Progress):
             return data
         except KeyError as e:
             pass
+        finally:
+            self._release_counter(task_id)
 
     # ---------------------------------------------------------------------------- #
     #                        Multiprocessing Backend Upgrade                       #
@@ -267,34 +311,51 @@ class Progress(progress.Progress):
 
     def convert_proxy(self, command_dispatch=None) -> 'ProgressProxy':
         """Convert to a multiprocessing-safe proxy object."""
-        return ProgressProxy.from_target(self, command_dispatch=command_dispatch)
+        proxy = ProgressProxy.from_target(self, command_dispatch=command_dispatch)
+        self._attach_counters(proxy, command_dispatch)
+        return proxy
 
 
-class ProgressProxy(TransportProxy[Progress]):
-    multiprocess = True
-
+class ProgressProxy(BackendProxy[Progress]):
     start = proxymethod(Progress.start, expect_reply=False, owner_only=True)
     stop = proxymethod(Progress.stop, expect_reply=False, owner_only=True)
     refresh = proxymethod(Progress.refresh, expect_reply=False, owner_only=True)
 
     write = proxymethod(Progress.write, expect_reply=False)
 
-    add_task = proxymethod(Progress.add_task)
-    try_update = proxymethod(Progress.try_update, expect_reply=False)
+    insert_task = proxymethod(Progress.insert_task, expect_reply=False)
+    reserve_task_ids = proxymethod(Progress.reserve_task_ids)
+    apply_updates = proxymethod(Progress.apply_updates, expect_reply=False)
     dump_task = proxymethod(Progress.dump_task)
     load_task = proxymethod(Progress.load_task, expect_reply=False)
     pop_task = proxymethod(Progress.pop_task)
+    claim_counter = proxymethod(Progress.claim_counter, expect_reply=False, worker_only=True)
     
     # Unused methods (to deprecate) - not defined on ProgressBackend
     
     new_task = proxymethod(Progress.new_task)
     update = proxymethod(Progress.update, expect_reply=False)
-    update_ = try_update
     start_task = proxymethod(Progress.start_task, expect_reply=False)
     stop_task = proxymethod(Progress.stop_task, expect_reply=False)
     remove_task = proxymethod(Progress.remove_task, expect_reply=False)
     dump_tasks = proxymethod(Progress.dump_tasks)
 
+    @classmethod
+    def from_target(cls, target: Progress, *, command_dispatch=None) -> 'ProgressProxy':
+        proxy = super().from_target(target, command_dispatch=command_dispatch)
+        proxy.update_interval = 1 / target.live.refresh_per_second
+        return proxy
+
+    @wraps(Progress.add_task)
+    def add_task(self, *args, **kw):
+        return super().add_task(*args, **kw)
+
+    @wraps(Progress.try_update)
+    def try_update(self, task_id, **kw):
+        return super().try_update(task_id, **kw)
+
+    update_ = try_update
+
     def __rich_console__(self, console, options):
         target = self.target
         if target is None:
@@ -2,31 +2,49 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
+import weakref
+from operator import length_hint
 from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
-from time import monotonic
+from time import monotonic, sleep
 from typing import TYPE_CHECKING, Any, Generic, TypeAlias, TypeVar
 
-from multiprocessing.managers import RemoteError
-
 from .runtime import Runtime
 from . import utils
-from .parallel.executor import _get_local
+from .utils._local import _get_local
 from .utils.proxy import CommandTransportClosed
 import mqdm as M
 
+from .backend import SharedCounterBackend
+
 if TYPE_CHECKING:
     from .backend import ProgressBackend, TaskState
+    from .utils.counters import CounterSlot
+
+
+def _backend_closed_errors() -> tuple[type[BaseException], ...]:
+    """Errors raised when the shared progress manager/proxy is already gone.
+
+    E.g. a worker finalizing its bars as the pool shuts down after an error.
+    Updates to it are best-effort at that point, so these are swallowed during
+    teardown. ``RemoteError`` can only occur once ``multiprocessing.managers``
+    is loaded, so it isn't imported just to be caught.
+    """
+    managers = sys.modules.get('multiprocessing.managers')
+    remote = (managers.RemoteError,) if managers is not None else ()
+    return (*remote, EOFError, OSError, CommandTransportClosed)
 
-# Raised when the shared progress manager/proxy is already gone — e.g. a worker
-# finalizing its bars as the pool shuts down after an error. Updates to it are
-# best-effort at that point, so these are swallowed during teardown.
-_BACKEND_GONE = (RemoteError, EOFError, OSError)
-_BACKEND_CLOSED = _BACKEND_GONE + (CommandTransportClosed,)
 
 # Globally disable mqdm using environment variable. 
 DISABLED = (os.getenv("MQDM_DISABLED") or "").lower() in ("1", "true", "yes", "y")
 
 DEFAULT_REFRESH_PER_SECOND = 8
+# Fast-advance clock sampling: aim for this many clock reads per refresh frame,
+# and never let more than MAX_CLOCK_SKIP calls pass between reads (1 = read the
+# clock on every call). A loop that slows down mid-way still flushes within about
+# a frame: _ClockWatch cuts the skip short once a frame passes without a read.
+CLOCK_SAMPLES_PER_FRAME = 4
+MAX_CLOCK_SKIP = 1024
 
 T = TypeVar('T')
 TaskId: TypeAlias = int
@@ -73,25 +91,37 @@ class mqdm(Generic[T]):
                 bar.advance()
         ```
     """
+    # Slotted: transient per-task worker bars are created by the hundred thousand,
+    # so skip the per-instance __dict__. Defaults are assigned in __init__.
+    __slots__ = (
+        '_n', '_iter', '_aiter', '_disabled_it', '_disabled_left', '_total', '_desc',
+        'disable', 'entered', 'started', 'task_id', '_task_dict',
+        'get_desc', '_fast_advance', '_counter', 'runtime',
+        '__weakref__',
+    )
+
     # internal state
-    _n: int = 0                       # the number of items completed
-    _iter: Iterator[T] | None = None  # the item iterator
-    _aiter: AsyncIterator[T] | None = None  # the async item iterator
-    _total: float | None = None       # the total number of items to iterate over
-    _desc: str | None = None          # the description of the progress bar
+    _n: int                           # the number of items completed
+    _iter: Iterator[T] | None         # the item iterator
+    _aiter: AsyncIterator[T] | None   # the async item iterator
+    _disabled_it: Iterator[T] | None  # bare iterator handed out by a disabled bar
+    _disabled_left: int               # its remaining length when ``_n`` was last synced
+    _total: float | None              # the total number of items to iterate over
+    _desc: str | None                 # the description of the progress bar
 
     # lifecycle state
-    disable: bool = DISABLED          # whether to disable the progress bar
-    entered: bool = False             # whether the progress bar has called __enter__()
-    started: bool = False             # whether the progress bar has beed started (for lazy start)
+    disable: bool                     # whether to disable the progress bar
+    entered: bool                     # whether the progress bar has called __enter__()
+    started: bool                     # whether the progress bar has beed started (for lazy start)
     
     # task state
-    task_id: TaskId | None = None     # stable task identity
-    _task_dict: TaskState | None = None  # detached serialized task state
+    task_id: TaskId | None            # stable task identity
+    _task_dict: TaskState | None      # detached serialized task state
 
     # methods
-    get_desc: DescFunc[T] | None = None  # a function to get the description
-    _fast_advance: Callable[..., None] | None = None  # a function to update the progress bar in fast loops
+    get_desc: DescFunc[T] | None      # a function to get the description
+    _fast_advance: _FastAdvance | _DisabledAdvance | None  # batched update state for fast loops
+    _counter: CounterSlot | None      # shared-memory counter slot (process workers only)
     runtime: Runtime                  # runtime that owns this bar's state
 
     def __init__(
@@ -117,9 +147,16 @@ class mqdm(Generic[T]):
             # refresh: bool = False,
             **fields: Any,
         ) -> None:
+        self._init_defaults()
         if isinstance(it, str) and desc is None:  # infer string as description
             it, desc = None, it
 
+        if (self.disable if disable is None else disable) and not task_kw and not _get_local('defaults', None):
+            # Disabled bars only keep local counters, so skip argument
+            # normalization and runtime/backend plumbing entirely.
+            self._init_disabled_fast(it, desc, runtime=runtime, task_id=task_id, total=total, completed=completed, start=start)
+            return
+
         self._init_runtime(
             runtime=runtime,
             disable=disable,
@@ -142,6 +179,16 @@ class mqdm(Generic[T]):
 
         self(it, desc=..., **bind_kw)  # bind iterable and update progress bar
 
+    def _init_defaults(self) -> None:
+        self._n = 0
+        self._iter = self._aiter = self._disabled_it = None
+        self._disabled_left = 0
+        self._total = self._desc = None
+        self.disable = DISABLED
+        self.entered = self.started = False
+        self.task_id = self._task_dict = None
+        self.get_desc = self._fast_advance = self._counter = None
+
     def _init_runtime(
             self, *,
             runtime: Runtime | None,
@@ -177,6 +224,30 @@ class mqdm(Generic[T]):
 
         return bind_kw
 
+    def _init_disabled_fast(
+        self,
+        it: Iterable[T] | int | None,
+        desc: str | DescFunc[T] | None,
+        *,
+        runtime: Runtime | None,
+        task_id: TaskId | TaskState | None,
+        total: float | None,
+        completed: int,
+        start: bool,
+    ) -> None:
+        self.runtime = runtime or M._current_runtime()
+        self.disable = True
+        self._total = total
+        self._n = int(completed)
+        if callable(desc):
+            self.get_desc = desc
+        elif desc is not None:
+            self._desc = desc
+        self._init_disabled(task_id, start)
+        self._fast_advance = self._get_fast_advance()
+        if it is not None:
+            self(it)
+
     def _init_disabled(self, task_id: TaskId | TaskState | None, start: bool) -> None:
         if isinstance(task_id, dict):
             self._task_dict = task_id
@@ -223,17 +294,26 @@ class mqdm(Generic[T]):
     # ------------------------------ Dunder methods ------------------------------ #
 
     def __repr__(self) -> str:
+        self._sync_disabled_n()
         return f'<mqdm[{self.task_id}]({self._n}/{self._total}, {self._desc or ""!r})>'
 
     def __getstate__(self):
-        state: dict[str, Any] = self.__dict__.copy()
+        self._sync_disabled_n()
+        state: dict[str, Any] = {k: getattr(self, k) for k in _STATE_SLOTS}
         state['get_desc'] = None  # cannot pickle lambda functions
         state['_fast_advance'] = None  # cannot pickle closures
+        state['_counter'] = None  # bound to this process's view of the shared table
         # state['_items'] = None  # cannot pickle iterators
         state['_iter'] = None  # cannot pickle iterators
         state['_aiter'] = None  # cannot pickle async iterators
+        state['_disabled_it'] = None
         return state
 
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._init_defaults()
+        for k, v in state.items():
+            setattr(self, k, v)
+
     # def __getitem__(self, i: int):
     #     """Get an item at index."""
     #     return self._items[i]
@@ -332,64 +412,22 @@ class mqdm(Generic[T]):
 
     # ----------------------------- Iteration methods ---------------------------- #
 
-    def _get_fast_advance(self) -> Callable[..., None]:
-        D: dict[str, Any] = self.__dict__
-        disable = self.disable
-        ttl_pause_wait = utils.fn_throttle(self.runtime.pause_event.wait, self.runtime.pause_wait_ttl_seconds)
-        delta = 1 / (self.runtime.backend_options.get('refresh_per_second') or DEFAULT_REFRESH_PER_SECOND)
-        runtime = self.runtime
-        task_id = self.task_id
-
-        def disabled_update(n: int=1, arg: T | object=..., flush: bool=False, wait: bool=True) -> None:
-            D['_n'] += n
-            return
-
-        n_acc = 0
-        t_last = 0
-        def update(n: int=1, arg: T | object=..., flush: bool=False, wait: bool=True) -> None:
-            nonlocal n_acc
-            n_acc += n
-
-            # If the time since the last increment is less than some delta, increment a local counter
-            # The only time this fails is if the iterations are highly irregular 
-            # (e.g. a bunch of 1000fps followed by a 100 second iteration
-            #       - could happen with overwrite=False type scenarios)
-            t = monotonic()
-            if t - t_last >= delta or flush:
-                do_flush(t, arg, wait)
-
-        def do_flush(t: float, arg: T | object, wait: bool) -> None:
-            nonlocal t_last, n_acc
-            D['_n'] += n_acc
-
-            pbar = runtime.pbar
-            if pbar is not None:
-                get_desc = self.get_desc
-                pbar.try_update(
-                    task_id, advance=n_acc, 
-                    description=get_desc(arg, D['_n']-1) if arg is not ... and get_desc is not None else None
-                )
-                if wait:
-                    ttl_pause_wait()
-            else:
-                task = self._task_dict
-                if task is not None:
-                    task['completed'] = D['_n']
-                    get_desc = self.get_desc
-                    if arg is not ... and get_desc is not None:
-                        task['description'] = get_desc(arg, D['_n']-1)
-
-            n_acc = 0
-            t_last = t
-
-        # return update
-        return disabled_update if disable else update
+    def _get_fast_advance(self) -> _FastAdvance | _DisabledAdvance:
+        if self.disable:
+            return _DisabledAdvance(self)
+        return _FastAdvance(self)
     
     def _reset_fast_advance(self) -> Callable[..., None]:
         if self._fast_advance is not None:
             self._fast_advance(n=0, flush=True, wait=False)
-        self._fast_advance = self._get_fast_advance()
-        return self._fast_advance
+        pbar = self.runtime.pbar
+        self._counter = (
+            pbar.counter(self.task_id)
+            if not self.disable and self.task_id is not None and isinstance(pbar, SharedCounterBackend)
+            else None
+        )
+        self._fast_advance = fast_advance = self._get_fast_advance()
+        return fast_advance.update
 
     def _get_iter(self, it: Iterable[T]) -> Iterator[T]:
         with utils.noopcontext() if self.entered else self:
@@ -400,6 +438,35 @@ class mqdm(Generic[T]):
                 update(1, x)
             update(0, x, flush=True)
 
+    def _get_disabled_iter(self, it: Iterable[T]) -> Iterator[T]:
+        """Iterate without a wrapper when nothing is drawn.
+
+        Iterators that report their remaining length (lists, ranges, dicts, ...)
+        are returned as-is, and ``n`` is reconciled lazily from how far they have
+        advanced (see :meth:`_sync_disabled_n`) — the loop costs the same as a bare
+        ``for``. Other iterables get a minimal counting generator.
+        """
+        _iter = iter(it)
+        left = length_hint(_iter, -1)
+        if left < 0:
+            return self._get_counting_iter(_iter)
+        self._disabled_it = _iter
+        self._disabled_left = left
+        return _iter
+
+    def _get_counting_iter(self, it: Iterator[T]) -> Iterator[T]:
+        for x in it:
+            yield x
+            self._n += 1
+
+    def _sync_disabled_n(self) -> None:
+        """Fold items consumed from a bare disabled iterator into ``_n``."""
+        _iter = self._disabled_it
+        if _iter is not None:
+            left = length_hint(_iter)
+            self._n += self._disabled_left - left
+            self._disabled_left = left
+
     async def _get_aiter(self, it: AsyncIterable[T]) -> AsyncIterator[T]:
         with utils.noopcontext() if self.entered else self:
             update = self._reset_fast_advance()
@@ -445,11 +512,18 @@ class mqdm(Generic[T]):
             iter = range(iter)
 
         total = utils.try_len(iter, self._total) if total is None else total
-        self.update(0, total=total, description=desc, **kw)
+        if self.disable and not kw and desc in (None, ...):
+            self._total = total
+        else:
+            self.update(0, total=total, description=desc, **kw)
+        self._sync_disabled_n()
         self._iter = None
         self._aiter = None
+        self._disabled_it = None
         if isinstance(iter, AsyncIterable):
             self._aiter = self._get_aiter(iter)
+        elif self.disable:
+            self._iter = self._get_disabled_iter(iter)
         else:
             self._iter = self._get_iter(iter)
         return self
@@ -480,7 +554,7 @@ class mqdm(Generic[T]):
                 self._task_dict = pbar.pop_task(self.task_id, remove=remove)
             self.runtime.remove_instance(self)
             self.runtime.clear_pbar(strict=False)
-        except _BACKEND_CLOSED:
+        except _backend_closed_errors():
             # Shared manager/proxy already torn down (e.g. worker shutdown after
             # a pool error). Detaching is best-effort, so drop it rather than
             # spewing "Exception ignored in" during generator finalization.
@@ -540,6 +614,7 @@ class mqdm(Generic[T]):
         if "total" in kw:
             self._total = kw["total"]
 
+        self._sync_disabled_n()
         if kw.get("advance") is not None:
             kw["advance"] = advance = int(kw["advance"])
             self._n += advance
@@ -562,6 +637,7 @@ class mqdm(Generic[T]):
     @property
     def n(self) -> int:
         """The number of items completed."""
+        self._sync_disabled_n()
         return self._n
     
     @n.setter
@@ -653,6 +729,9 @@ class mqdm(Generic[T]):
                     bar.update(len(chunk), description=f"read {chunk.name}")
             ```
         """
+        if self.disable and not kw:
+            self._n += int(advance)
+            return self
         return self.set(advance=advance, **kw)
 
     def advance(self, n: int=1, arg: Any=...) -> mqdm[T]:
@@ -680,7 +759,7 @@ class mqdm(Generic[T]):
                     bar.advance()
             ```
         """
-        self._fast_advance(n, arg)
+        self._fast_advance.update(n, arg)
         return self
 
     def set(self, **kw: Any) -> mqdm[T]:
@@ -715,9 +794,168 @@ class mqdm(Generic[T]):
 
         pbar = self.runtime.pbar
         if pbar is not None:
+            counter = self._counter
+            if counter is not None:
+                if 'advance' in kw:  # the shared slot holds absolute counts
+                    kw.pop('advance')
+                    kw['completed'] = self._n
+                if 'completed' in kw or 'total' in kw:
+                    counter.set(self._n, kw.get('total'))
             pbar.try_update(self.task_id, **kw)
             return self
         if self._task_dict is not None:
             self._set_task_dict(kw)
             return self
         raise RuntimeError("Cannot update mqdm bar without an attached progress bar or detached task state.")
+
+
+_STATE_SLOTS = tuple(k for k in mqdm.__slots__ if k != '__weakref__')
+
+
+class _DisabledAdvance:
+    """Fast-advance state for a disabled bar: only the local count moves."""
+
+    __slots__ = ('bar',)
+
+    def __init__(self, bar: mqdm[Any]) -> None:
+        self.bar = bar
+
+    def update(self, n: int=1, arg: Any=..., flush: bool=False, wait: bool=True) -> None:
+        self.bar._n += n
+
+    __call__ = update
+
+
+class _FastAdvance:
+    """Batched counts and throttled flushes behind :meth:`mqdm.advance`.
+
+    Counts accumulate in ``n_acc`` and reach the backend at most once per frame
+    (``delta`` seconds). The clock itself is only read every ``n_sample`` calls.
+    """
+
+    __slots__ = (
+        'bar', 'runtime', 'task_id', 'counter', 'delta', 'ttl_pause_wait',
+        'n_acc', 't_last', 't_sample', 'n_sample', 'n_left', 'watched', '__weakref__',
+    )
+
+    def __init__(self, bar: mqdm[Any]) -> None:
+        runtime = bar.runtime
+        self.bar = bar
+        self.runtime = runtime
+        self.task_id = bar.task_id
+        self.counter = bar._counter
+        self.ttl_pause_wait = utils.fn_throttle(runtime.pause_event.wait, runtime.pause_wait_ttl_seconds)
+        self.delta = 1 / (runtime.backend_options.get('refresh_per_second') or DEFAULT_REFRESH_PER_SECOND)
+        self.n_acc = 0
+        self.t_last = 0.
+        self.t_sample = 0.
+        self.n_sample = 1  # calls between clock reads, self-calibrated in sample()
+        self.n_left = 1    # calls left until the next clock read
+        self.watched = False  # registered with _CLOCK_WATCH
+
+    def update(self, n: int=1, arg: Any=..., flush: bool=False, wait: bool=True) -> None:
+        self.n_acc += n
+        n_left = self.n_left = self.n_left - 1
+        if n_left > 0 and not flush:
+            return
+        self.sample(arg, flush, wait)
+
+    __call__ = update
+
+    def sample(self, arg: Any, flush: bool, wait: bool) -> None:
+        # Reading the clock every call dominates tight loops, so only read it
+        # every ``n_sample`` calls, sized from the observed call rate to give
+        # ~CLOCK_SAMPLES_PER_FRAME reads per frame. Growth is capped (2x per
+        # read, MAX_CLOCK_SKIP overall) so a loop that suddenly slows down
+        # (e.g. 1000 fast items, then a slow one) can only overshoot a frame
+        # by a bounded number of calls before the rate is re-measured.
+        t = monotonic()
+        delta = self.delta
+        n_sample = self.n_sample
+        calls = n_sample - self.n_left
+        dt = t - self.t_sample
+        n_fit = int(calls * delta / (CLOCK_SAMPLES_PER_FRAME * dt)) if dt > 0 else 1
+        self.n_sample = self.n_left = max(1, min(n_fit, 2 * n_sample, MAX_CLOCK_SKIP))
+        self.t_sample = t
+        if not self.watched and self.n_sample > 1:
+            self.watched = True
+            _CLOCK_WATCH.add(self)
+        if t - self.t_last >= delta or flush:
+            self.flush(t, arg, wait)
+
+    def expire(self, t: float) -> None:
+        """Make the next call read the clock if a frame passed since the last read."""
+        n_left = self.n_left
+        if n_left > 1 and t - self.t_sample >= self.delta:
+            self.n_sample -= n_left - 1  # so sample() counts only the calls made
+            self.n_left = 1
+
+    def flush(self, t: float, arg: Any, wait: bool) -> None:
+        bar = self.bar
+        n_acc = self.n_acc
+        bar._n = n = bar._n + n_acc
+
+        pbar = self.runtime.pbar
+        if pbar is not None:
+            get_desc = bar.get_desc
+            desc = get_desc(arg, n-1) if arg is not ... and get_desc is not None else None
+            counter = self.counter
+            if counter is None:
+                pbar.try_update(self.task_id, advance=n_acc, description=desc)
+            elif not counter.set(n) or desc is not None:
+                # absolute counts, so they can't double up with the shared slot
+                pbar.try_update(self.task_id, completed=n, description=desc)
+            if wait:
+                self.ttl_pause_wait()
+        else:
+            task = bar._task_dict
+            if task is not None:
+                task['completed'] = n
+                get_desc = bar.get_desc
+                if arg is not ... and get_desc is not None:
+                    task['description'] = get_desc(arg, n-1)
+
+        self.n_acc = 0
+        self.t_last = t
+
+
+class _ClockWatch:
+    """Timer thread that bounds how long a :class:`_FastAdvance` goes without reading the clock.
+
+    The number of calls skipped between clock reads is sized from the recent
+    call rate. Once a frame has passed since a fast-advance's last read,
+    :meth:`_FastAdvance.expire` ends its countdown, so a loop that starts fast
+    and then slows down still reads the clock (and flushes) on its next call.
+    Fast-advances register the first time they skip calls.
+    """
+
+    def __init__(self) -> None:
+        self.advances: weakref.WeakSet[_FastAdvance] = weakref.WeakSet()
+        self.interval = 1 / DEFAULT_REFRESH_PER_SECOND
+        self._cond = threading.Condition(threading.Lock())
+        self._thread: threading.Thread | None = None
+
+    def add(self, advance: _FastAdvance) -> None:
+        with self._cond:
+            self.advances.add(advance)
+            self.interval = min(self.interval, advance.delta)
+            self._cond.notify()
+            if self._thread is None or not self._thread.is_alive():  # not inherited by forks
+                self._thread = threading.Thread(target=self._run, name="mqdm-clock-watch", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self.advances:
+                    self._cond.wait()
+                interval = self.interval
+            sleep(interval)
+            with self._cond:
+                advances = list(self.advances)
+            t = monotonic()
+            for advance in advances:
+                advance.expire(t)
+
+
+_CLOCK_WATCH = _ClockWatch()
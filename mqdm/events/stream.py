@@ -22,7 +22,6 @@ from __future__ import annotations
 import json
 import multiprocessing as mp
 import threading
-from queue import Empty
 from typing import Any, Callable, TextIO
 
 import mqdm as M
@@ -30,8 +29,6 @@ import mqdm as M
 from .events import EventEnvelope
 from ..runtime import Runtime
 
-_REQUEST_POLL_INTERVAL = 0.1
-
 
 class EventStream:
     """Transport + drain for the mqdm event stream.
@@ -97,13 +94,12 @@ class EventStream:
         self.stop()
 
     def _drain(self) -> None:
+        # Blocks until an event or stop()'s ``None`` sentinel arrives.
         while True:
             try:
-                event = self._queue.get(timeout=_REQUEST_POLL_INTERVAL)
-            except Empty:
-                if self._stop.is_set():
-                    return
-                continue
+                event = self._queue.get()
+            except (EOFError, OSError, ValueError):
+                return
             if event is None:
                 return
             try:
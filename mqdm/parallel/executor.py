@@ -1,5 +1,7 @@
 import os
+import pickle
 import threading
+import uuid
 import multiprocessing as mp
 from typing import Callable, Literal
 from concurrent.futures._base import FINISHED, RUNNING
@@ -8,6 +10,7 @@ from concurrent.futures.process import _RemoteTraceback  # used in bar.py
 import mqdm as M
 from ..utils import fn as fn_util
 from ..runtime import _current_runtime
+from ..utils._local import _thread_local_data, _get_local, _set_local, _clear_local
 
 # ----------- Process Pool Executor with KeyboardInterrupt Handling ---------- #
 
@@ -24,7 +27,7 @@ class SequentialFuture(Future):
         self._kwargs = kwargs
         self._evaluated = False
         self._processes = {}
-        with self._condition:  # so as_completed will return it
+        with self._condition:  # so as_completed and done callbacks see it at once
             self._state = FINISHED
 
     def _evaluate(self):
@@ -76,33 +79,15 @@ POOL_EXECUTORS = {
 }
 
 
-def get_executor(pool_mode: T_POOL_MODE='process', bar_kw: dict=None, runtime=None, **kw) -> Executor:
+def get_executor(pool_mode: T_POOL_MODE='process', bar_kw: dict=None, runtime=None, shared_calls: tuple=(), **kw) -> Executor:
     """Return the appropriate executor for the pool mode of the progress bar."""
-    return POOL_EXECUTORS[pool_mode](initializer=Initializer(pool_mode=pool_mode, defaults=bar_kw, runtime=runtime), **kw)
+    initializer = Initializer(pool_mode=pool_mode, defaults=bar_kw, runtime=runtime, shared_calls=shared_calls)
+    return POOL_EXECUTORS[pool_mode](initializer=initializer, **kw)
 
 
 # -------------------------------- Initializer ------------------------------- #
 
 
-_thread_local_data = threading.local()
-def _get_local(key, default=None):
-    """Get a thread-local variable."""
-    return getattr(_thread_local_data, key, default)
-
-
-def _set_local(**values):
-    """Set one or more thread-local variables."""
-    for key, value in values.items():
-        setattr(_thread_local_data, key, value)
-
-
-def _clear_local(*keys):
-    """Remove thread-local variables if present."""
-    for key in keys:
-        if hasattr(_thread_local_data, key):
-            delattr(_thread_local_data, key)
-
-
 def _worker_identity(pool_mode: T_POOL_MODE) -> dict:
     """Mode-correct worker identity for event context.
 
@@ -120,10 +105,12 @@ def _worker_identity(pool_mode: T_POOL_MODE) -> dict:
 
 
 class Initializer:
-    def __init__(self, fn: Callable=None, *a, pool_mode: T_POOL_MODE='process', defaults: dict=None, runtime=None, **kw):
+    def __init__(self, fn: Callable=None, *a, pool_mode: T_POOL_MODE='process', defaults: dict=None, runtime=None, shared_calls: tuple=(), **kw):
         self.fn = fn_util(fn, *a, **kw) if fn is not None else None
         self.defaults = defaults if defaults is not None else {}
         self.pool_mode = pool_mode
+        # Sent with the initializer so tasks only need their tokens (see SharedCall).
+        self.shared_calls = tuple(call.inline() for call in shared_calls)
         self.runtime = runtime or _current_runtime()
         self.runtime.prepare_pool_worker(pool_mode=pool_mode)
 
@@ -132,5 +119,157 @@ class Initializer:
         _set_local(runtime=self.runtime, defaults=self.defaults)
         self.runtime.install_pool_worker(pool_mode=self.pool_mode)
         self.runtime.set_base_context(**_worker_identity(self.pool_mode))
+        # Unpickling registered the shared calls already; this keeps the
+        # in-process executors (fork, threads) consistent with that.
+        for call in self.shared_calls:
+            _register_shared_call(call)
         if self.fn is not None:
             self.fn()
+
+
+# ------------------------------- Shared Calls ------------------------------- #
+
+
+class SharedCallMissing(RuntimeError):
+    """A task's :class:`SharedCall` hasn't reached the worker that got it yet."""
+
+
+# Worker-side SharedCalls by token, most recent last.
+_shared_calls: dict[str, 'SharedCall'] = {}
+_SHARED_CALL_LIMIT = 16
+
+
+class SharedCall:
+    """A pool's function together with the keyword arguments all its tasks share.
+
+    Pickled, it is just a token: each worker process gets the function and the
+    shared kwargs once — with its :class:`Initializer`, or inline in the first
+    task it receives (after a :class:`SharedCallMissing` round trip) — and
+    looks them up by token for every task after that. Per-item keyword
+    arguments override the shared ones.
+    """
+    def __init__(self, fn: Callable, kw: dict, *, token: str=None, _inline: bool=False):
+        self.fn = fn
+        self.kw = kw
+        self.token = token or uuid.uuid4().hex
+        self._inline = _inline
+
+    def inline(self) -> 'SharedCall':
+        """A copy that pickles with its function and kwargs."""
+        return SharedCall(self.fn, self.kw, token=self.token, _inline=True)
+
+    def __reduce__(self):
+        if self._inline:
+            return (_load_shared_call, (self.token, self.fn, self.kw))
+        return (_find_shared_call, (self.token,))
+
+    def __call__(self, *a, **kw):
+        _rich_traceback_omit = True
+        if self.fn is None:
+            raise SharedCallMissing(self.token)
+        return self.fn(*a, **{**self.kw, **kw})
+
+
+def _register_shared_call(call: SharedCall) -> SharedCall:
+    _shared_calls.pop(call.token, None)
+    _shared_calls[call.token] = call
+    while len(_shared_calls) > _SHARED_CALL_LIMIT:
+        del _shared_calls[next(iter(_shared_calls))]
+    return call
+
+
+def _load_shared_call(token: str, fn: Callable, kw: dict) -> SharedCall:
+    return _register_shared_call(SharedCall(fn, kw, token=token))
+
+
+def _find_shared_call(token: str) -> SharedCall:
+    # A miss decodes to a stub that raises SharedCallMissing when called.
+    return _shared_calls.get(token) or SharedCall(None, {}, token=token)
+
+
+# --------------------------- Bring-your-own Executor ------------------------- #
+
+
+_BOOTSTRAP_TOKEN = '_mqdm_bootstrap_token'
+# Thread-locals a bootstrapped task sets and puts back afterwards.
+_BOOTSTRAP_LOCALS = ('runtime', 'defaults')
+
+
+def executor_pool_mode(executor: Executor) -> T_POOL_MODE:
+    """The pool mode an executor mqdm didn't create runs its tasks in."""
+    if isinstance(executor, SequentialExecutor):
+        return 'sequential'
+    if isinstance(executor, ThreadPoolExecutor):
+        return 'thread'
+    return 'process'  # ProcessPoolExecutor, loky, and anything else out of process
+
+
+def get_bootstrap(pool_mode: T_POOL_MODE, bar_kw: dict=None, runtime=None) -> 'Bootstrap | None':
+    """Return the task wrapper that installs mqdm in the workers of a foreign executor.
+
+    Process workers weren't started by us, so they can't inherit the runtime's
+    queues; they reach the display by address, so the display's command
+    dispatch is started on the socket channel if it isn't running yet.
+    Sequential executors run tasks in this thread, which is set up already.
+    """
+    if pool_mode in ('sequential', None):
+        return None
+    runtime = runtime or _current_runtime()
+    if pool_mode == 'process':
+        channel = runtime._ensure_command_dispatch(channel='socket').channel
+        if channel != 'socket':
+            raise RuntimeError(
+                f"Process executors that mqdm didn't start reach the display by address, but it is "
+                f"already serving process workers over the {channel!r} channel: finish that pool first, "
+                f"or configure the runtime with transport_options={{'channel': 'socket'}}.")
+    return Bootstrap(Initializer(pool_mode=pool_mode, defaults=bar_kw, runtime=runtime))
+
+
+class Bootstrap:
+    """Run an :class:`Initializer` in a worker the first time it gets one of our tasks.
+
+    Tasks are submitted as ``executor.submit(bootstrap, fn, *args)``; later tasks
+    on the same worker thread/process only compare a token. The initializer is
+    pickled once per bootstrap and unpickled only by workers that miss.
+
+    The executor's threads may run other work too, so each task's thread gets
+    its previous runtime and bar defaults back once the task returns.
+    """
+    def __init__(self, initializer: Initializer):
+        self.initializer = initializer
+        self.token = uuid.uuid4().hex
+        self._payload = None
+        # Threads of an in-process executor that ran the initializer; remote
+        # copies are unpickled per task and keep this in mqdm's thread-locals.
+        self._local = threading.local()
+
+    def __reduce__(self):
+        if self._payload is None:
+            self._payload = pickle.dumps(self.initializer)
+        return (_remote_bootstrap, (self.token, self._payload))
+
+    def __call__(self, fn, /, *a, **kw):
+        _rich_traceback_omit = True
+        store = _thread_local_data if self.initializer is None else self._local
+        state = getattr(store, _BOOTSTRAP_TOKEN, None)
+        prev = {key: _get_local(key) for key in _BOOTSTRAP_LOCALS}
+        try:
+            if state is None or state[0] != self.token:
+                initializer = self.initializer if self.initializer is not None else pickle.loads(self._payload)
+                initializer()
+                setattr(store, _BOOTSTRAP_TOKEN, (self.token, initializer.runtime, initializer.defaults))
+            else:
+                _set_local(runtime=state[1], defaults=state[2])
+            return fn(*a, **kw)
+        finally:
+            for key, value in prev.items():
+                if value is None:
+                    _clear_local(key)
+                else:
+                    _set_local(**{key: value})
+
+
+def _remote_bootstrap(token: str, payload: bytes) -> Bootstrap:
+    bootstrap = Bootstrap.__new__(Bootstrap)
+    bootstrap.initializer, bootstrap.token, bootstrap._payload = None, token, payload
+    return bootstrap
@@ -1,21 +1,26 @@
 from __future__ import annotations
 
+import math
+import queue
 import re
 import traceback
+import weakref
 from collections.abc import Iterator
-from concurrent.futures import Executor, Future, as_completed
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import _ExceptionWithTraceback
 from contextlib import contextmanager
 from dataclasses import dataclass
-from functools import wraps
+from functools import partial, wraps
 from time import monotonic
 from typing import Any, TypeVar, Callable, Literal, TypeAlias
 
 import mqdm as M
 from .. import utils
+from ..utils.shared import unwrap
 
 from .. import Runtime
 from ..bar import mqdm
-from .executor import T_POOL_MODE
+from .executor import T_POOL_MODE, Bootstrap, SharedCall, SharedCallMissing, executor_pool_mode, get_bootstrap
 
 T = TypeVar('T')
 R = TypeVar('R')
@@ -26,6 +31,16 @@ DescFunc: TypeAlias = Callable[[utils.args, int], str]
 # ``KeyError('a')`` and ``KeyError('b')`` raised at the same line collapse into
 # one group.
 FailureKey: TypeAlias = tuple[type[BaseException], tuple[tuple[str, str], ...]]
+# ``chunksize_='auto'``: aim for this many chunks per worker, of at most
+# _AUTO_CHUNK_LIMIT items so the bar still moves steadily; iterables of unknown
+# length get _AUTO_CHUNK_UNSIZED.
+_AUTO_CHUNKS_PER_WORKER = 4
+_AUTO_CHUNK_LIMIT = 256
+_AUTO_CHUNK_UNSIZED = 16
+# Process pools keep this many submissions in flight per worker by default, so a
+# worker that finishes already has its next task queued while the parent loop
+# handles the result.
+_PROCESS_PREFETCH_PER_WORKER = 2
 
 
 class PoolError(Exception):
@@ -72,6 +87,11 @@ class _PoolPlan(_PoolPlanBase):
     pool_mode: T_POOL_MODE
     on_interrupt: Literal['terminate', 'kill']
     interrupt_grace: float
+    chunksize: int = 1
+    # Set when running on an executor mqdm didn't create (see Bootstrap).
+    bootstrap: Bootstrap | None = None
+    # Process mode: fn and fn_kw, sent to each worker once (see SharedCall).
+    shared: SharedCall | None = None
     submitted: int = 0
 
     @property
@@ -84,6 +104,9 @@ class _Task:
     index: int
     display_arg: utils.args
     future: Future[R]
+    # Position in the future's list of per-item outcomes when submitted as part
+    # of a chunk; ``None`` when the future resolves to this task's value.
+    offset: int | None = None
 
 
 @dataclass
@@ -175,13 +198,15 @@ def ipool(
         desc: str | DescFunc='',
         bar_kw: dict[str, Any] | None=None,
         n_workers: int=8,
-        pool_mode: T_POOL_MODE='process',
+        pool_mode: T_POOL_MODE | Executor='process',
         ordered_: bool=False,
         squeeze_: bool=True,
         as_result_: bool=False,
         on_error: Literal['finish', 'cancel', 'skip']='cancel',
         on_interrupt: Literal['terminate', 'kill']='terminate',
         interrupt_grace: float=2.0,
+        chunksize_: int | Literal['auto']=1,
+        prefetch_: int | None=None,
         runtime: Runtime | None=None,
         **kw: Any) -> Iterator[R]:
     """Run a function over an iterable with pooled workers and progress updates.
@@ -194,7 +219,13 @@ def ipool(
         bar_kw: Extra keyword arguments forwarded to the top-level progress bar.
         n_workers: Maximum number of workers to use.
         pool_mode: Execution mode: ``"process"``, ``"thread"``, or
-            ``"sequential"``.
+            ``"sequential"`` — or an already running
+            :class:`~concurrent.futures.Executor` to submit to instead of
+            starting one. Its workers get mqdm's :class:`~mqdm.Initializer`
+            on their first task, and it is left running afterwards (unless
+            interrupted). Workers of executors that run tasks in other
+            processes reach the display over a socket, which mqdm starts for
+            them.
         ordered_: Whether results should be yielded in input order.
         squeeze_: Whether to reduce worker count for very small inputs.
         as_result_: Yield a :class:`Result` per task (ok or error) instead of
@@ -209,6 +240,16 @@ def ipool(
             ``"kill"`` (SIGKILL) is uncatchable but guaranteed.
         interrupt_grace: Seconds to let still-running workers exit on their own
             (they received the same Ctrl-C) before force-signalling stragglers.
+        chunksize_: Items sent to a worker per submission. Batching many small
+            tasks saves a round trip (and, in process mode, a pickle and a
+            result message) per item; each item still gets its own outcome,
+            error handling and ``task_index``. ``"auto"`` picks a size from the
+            input length for process pools and keeps 1 for the others.
+        prefetch_: Submissions (items, or chunks with ``chunksize_``) kept in
+            flight at once. Anything beyond ``n_workers`` waits in the
+            executor's queue, so a worker never idles while the parent handles
+            the previous result. Defaults to ``2 * n_workers`` for process pools
+            and ``n_workers`` otherwise.
         runtime: Runtime that should own the progress display.
         **kw: Extra keyword arguments forwarded to ``fn`` for every item.
 
@@ -221,6 +262,11 @@ def ipool(
     See also:
         :func:`aipool` / :func:`apool` for the asyncio equivalents.
     """
+    executor = pool_mode if isinstance(pool_mode, Executor) else None
+    if executor is not None:
+        pool_mode = executor_pool_mode(executor)
+        n_workers = getattr(executor, '_max_workers', None) or n_workers
+        squeeze_ = False  # the executor's mode and size are already fixed
     plan = _make_pool_plan(
         fn=fn,
         iterable=iter,
@@ -233,79 +279,15 @@ def ipool(
         on_error=on_error,
         on_interrupt=on_interrupt,
         interrupt_grace=interrupt_grace,
+        chunksize=chunksize_,
+        prefetch=prefetch_,
         fn_kw=kw,
         runtime=runtime or M._current_runtime(),
     )
 
-    failed_results: list[Result] = []
-
-    try:
-        # Put the runtime on the right backend before the top bar so process
-        # workers forward updates to the parent-owned shared display.
-        executor = M.get_executor(plan.pool_mode, bar_kw=plan.worker_bar_kw, max_workers=plan.n_workers, runtime=plan.runtime)
-        with mqdm(
-            desc=plan.desc,
-            total=plan.total if plan.total >= 0 else None,
-            runtime=plan.runtime,
-            **plan.bar_kw,
-        ) as pbar:
-            shutdown_wait = True
-            shutdown_cancel_futures = False
-            executor.__enter__()
-            try:
-                try:
-                    indexed_iter = enumerate(plan.iterable)
-                    in_flight = {}
-                    ready = {}
-                    next_index = 0
-
-                    def _fill() -> None:
-                        while len(in_flight) < plan.max_in_flight:
-                            task = _submit_next(executor, plan, pbar, indexed_iter)
-                            if task is None:
-                                break
-                            in_flight[task.future] = task
-
-                    _fill()
-                    while in_flight:
-                        future = next(as_completed(in_flight))
-                        task = in_flight.pop(future)
-                        outcome = _task_outcome(task)
-                        pbar.update(arg=outcome.task.display_arg, i=outcome.task.index)
-
-                        if not as_result_ and not outcome.succeeded and plan.on_error == 'cancel':
-                            _annotate_exception(outcome.error, plan.fn, outcome.task.index, outcome.task.display_arg)
-                            _cancel_pending(list(in_flight.values()), executor)
-                            shutdown_wait = False
-                            shutdown_cancel_futures = True
-                            raise outcome.error
-
-                        if plan.ordered:
-                            ready[task.index] = outcome
-                            while next_index in ready:
-                                yield from _emit_outcome(ready.pop(next_index), plan, as_result_, failed_results)
-                                next_index += 1
-                        else:
-                            yield from _emit_outcome(outcome, plan, as_result_, failed_results)
-
-                        _fill()
-                except KeyboardInterrupt:
-                    plan.runtime.pause()
-                    _shutdown_for_interrupt(
-                        executor, plan.pool_mode, plan.runtime,
-                        op=plan.on_interrupt, grace=plan.interrupt_grace,
-                    )
-                    shutdown_wait = False
-                    shutdown_cancel_futures = True
-                    raise
-            finally:
-                executor.shutdown(wait=shutdown_wait, cancel_futures=shutdown_cancel_futures)
-    except:
-        plan.runtime.pause()
-        raise
-
-    if failed_results:
-        raise _build_pool_error(plan.fn, failed_results)
+    if executor is not None:
+        plan.bootstrap = get_bootstrap(plan.pool_mode, bar_kw=plan.worker_bar_kw, runtime=plan.runtime)
+    yield from _run_pool(plan, as_result_, executor)
 
 
 @wraps(ipool, ['__doc__'])
@@ -315,13 +297,15 @@ def pool(
         desc: str | DescFunc='',
         bar_kw: dict[str, Any] | None=None,
         n_workers: int=8,
-        pool_mode: T_POOL_MODE='process',
+        pool_mode: T_POOL_MODE | Executor='process',
         results_: list[R] | None=None,
         ordered_: bool=True,
         squeeze_: bool=True,
         as_result_: bool=False,
         on_interrupt: Literal['terminate', 'kill']='terminate',
         interrupt_grace: float=2.0,
+        chunksize_: int | Literal['auto']=1,
+        prefetch_: int | None=None,
         runtime: Runtime | None=None,
         **kw: Any) -> list[R]:
     """Collect ``ipool`` results into a list.
@@ -333,10 +317,14 @@ def pool(
         bar_kw: Extra keyword arguments forwarded to the top-level progress bar.
         n_workers: Maximum number of workers to use.
         pool_mode: Execution mode: ``"process"``, ``"thread"``, or
-            ``"sequential"``.
+            ``"sequential"``, or an :class:`~concurrent.futures.Executor` to
+            reuse (see :func:`ipool`).
         results_: Optional list to append results into.
         ordered_: Whether results should be returned in input order.
         squeeze_: Whether to reduce worker count for very small inputs.
+        chunksize_: Items sent to a worker per submission, or ``"auto"`` (see
+            :func:`ipool`).
+        prefetch_: Submissions kept in flight at once (see :func:`ipool`).
         runtime: Runtime that should own the progress display.
         **kw: Extra keyword arguments forwarded to ``fn`` for every item.
 
@@ -344,11 +332,167 @@ def pool(
         A list of collected results.
     """
     results_ = [] if results_ is None else results_
-    for x in ipool(fn, iter, desc=desc, bar_kw=bar_kw, n_workers=n_workers, pool_mode=pool_mode, ordered_=ordered_, squeeze_=squeeze_, as_result_=as_result_, on_interrupt=on_interrupt, interrupt_grace=interrupt_grace, runtime=runtime, **kw):
+    for x in ipool(fn, iter, desc=desc, bar_kw=bar_kw, n_workers=n_workers, pool_mode=pool_mode, ordered_=ordered_, squeeze_=squeeze_, as_result_=as_result_, on_interrupt=on_interrupt, interrupt_grace=interrupt_grace, chunksize_=chunksize_, prefetch_=prefetch_, runtime=runtime, **kw):
         results_.append(x)
     return results_
 
 
+class Pool:
+    """Workers that stay up across many ``map``/``imap``/``submit`` calls.
+
+    :func:`pool` starts and stops a fresh executor every call, so calling it in
+    a loop pays for worker start-up (and the :class:`~mqdm.Initializer`) each
+    time. A ``Pool`` starts its workers once and keeps the progress display
+    alive until it is closed (as :func:`mqdm.sustain` does); each call gets its
+    own top-level bar and the same ordering, ``on_error`` and ``as_result_``
+    handling as :func:`ipool`. A pool that is never closed shuts down when it
+    is garbage collected, or at interpreter exit.
+
+    Args:
+        n_workers: Number of workers to keep.
+        pool_mode: Execution mode: ``"process"``, ``"thread"``, or
+            ``"sequential"``.
+        bar_kw: Defaults for the bars created inside the workers.
+        on_interrupt: How to stop process workers on ``KeyboardInterrupt``
+            (see :func:`ipool`). An interrupt closes the pool.
+        interrupt_grace: Seconds to let workers exit on their own after an
+            interrupt before force-signalling them.
+        runtime: Runtime that should own the progress display.
+
+    Example:
+        ```python
+        with mqdm.Pool(8) as pool:
+            for batch in batches:
+                results = pool.map(process, batch, desc=f"batch {batch.id}")
+        ```
+    """
+
+    def __init__(
+            self,
+            n_workers: int=8,
+            pool_mode: T_POOL_MODE='process',
+            *,
+            bar_kw: dict[str, Any] | None=None,
+            on_interrupt: Literal['terminate', 'kill']='terminate',
+            interrupt_grace: float=2.0,
+            runtime: Runtime | None=None):
+        self.n_workers = max(n_workers, 1)
+        self.pool_mode = pool_mode
+        self.bar_kw = bar_kw or {}
+        self.on_interrupt = on_interrupt
+        self.interrupt_grace = interrupt_grace
+        self.runtime = runtime or M._current_runtime()
+        self._executor: Executor | None = None
+        # Shuts the workers down and releases the display if the pool is
+        # dropped without close().
+        self._finalizer: weakref.finalize | None = None
+        self._closed = False
+
+    def __enter__(self) -> Pool:
+        self._get_executor()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _get_executor(self) -> Executor:
+        if self._closed:
+            raise RuntimeError("Pool is closed.")
+        if self._executor is None:
+            # Hold the display (and in process mode its command dispatch) open
+            # so the workers' proxies stay valid between calls.
+            sustain = self.runtime.sustain()
+            sustain.__enter__()
+            executor = self._executor = M.get_executor(
+                self.pool_mode, bar_kw={'transient': True, **self.bar_kw},
+                max_workers=self.n_workers, runtime=self.runtime)
+            executor.__enter__()
+            self._finalizer = weakref.finalize(self, _release_pool, executor, sustain, wait=False)
+        return self._executor
+
+    def close(self, wait: bool=True) -> None:
+        """Shut the workers down and let the display close with its last bar."""
+        self._closed = True
+        self._executor = None
+        finalizer, self._finalizer = self._finalizer, None
+        released = finalizer.detach() if finalizer is not None else None
+        if released is not None:
+            _, _, (executor, sustain), _ = released
+            _release_pool(executor, sustain, wait=wait)
+
+    def submit(self, fn: Callable[..., R], /, *args: Any, **kw: Any) -> Future[R]:
+        """Run one call on a worker and return its future; no top-level bar."""
+        return self._get_executor().submit(fn, *args, **kw)
+
+    def imap(
+            self,
+            fn: Callable[..., R],
+            iter: Iterator[Any] | list[Any] | tuple[Any, ...] | set[Any] | range,
+            desc: str | DescFunc='',
+            bar_kw: dict[str, Any] | None=None,
+            ordered_: bool=False,
+            as_result_: bool=False,
+            on_error: Literal['finish', 'cancel', 'skip']='cancel',
+            chunksize_: int | Literal['auto']=1,
+            prefetch_: int | None=None,
+            **kw: Any) -> Iterator[R]:
+        """Like :func:`ipool`, on this pool's workers.
+
+        On ``on_error='cancel'`` (or if the iterator is closed early) the call's
+        queued tasks are cancelled; tasks already running finish in the
+        background and the pool stays usable.
+        """
+        executor = self._get_executor()
+        # Re-arm the display for this call: a failed earlier call pauses it.
+        self.runtime.prepare_pool_worker(pool_mode=self.pool_mode)
+        plan = _make_pool_plan(
+            fn=fn,
+            iterable=iter,
+            desc=desc,
+            bar_kw=bar_kw,
+            n_workers=self.n_workers,
+            pool_mode=self.pool_mode,
+            ordered=ordered_,
+            squeeze=False,
+            on_error=on_error,
+            on_interrupt=self.on_interrupt,
+            interrupt_grace=self.interrupt_grace,
+            chunksize=chunksize_,
+            prefetch=prefetch_,
+            fn_kw=kw,
+            runtime=self.runtime,
+        )
+        try:
+            yield from _run_pool(plan, as_result_, executor)
+        except KeyboardInterrupt:
+            self.close(wait=False)  # _run_pool already stopped the workers
+            raise
+
+    def map(
+            self,
+            fn: Callable[..., R],
+            iter: Iterator[Any] | list[Any] | tuple[Any, ...] | set[Any] | range,
+            desc: str | DescFunc='',
+            bar_kw: dict[str, Any] | None=None,
+            ordered_: bool=True,
+            as_result_: bool=False,
+            on_error: Literal['finish', 'cancel', 'skip']='cancel',
+            chunksize_: int | Literal['auto']=1,
+            prefetch_: int | None=None,
+            **kw: Any) -> list[R]:
+        """Like :func:`pool`, on this pool's workers."""
+        return list(self.imap(
+            fn, iter, desc=desc, bar_kw=bar_kw, ordered_=ordered_, as_result_=as_result_,
+            on_error=on_error, chunksize_=chunksize_, prefetch_=prefetch_, **kw))
+
+
+def _release_pool(executor: Executor, sustain: Any, wait: bool=True) -> None:
+    try:
+        executor.shutdown(wait=wait)
+    finally:
+        sustain.__exit__(None, None, None)
+
+
 
 
 # ---------------------------------------------------------------------------- #
@@ -357,6 +501,107 @@ def pool(
 
 
 
+# ----------------------------------- Run ------------------------------------ #
+
+
+def _run_pool(plan: _PoolPlan, as_result_: bool, executor: Executor | None=None) -> Iterator[Any]:
+    """Drive ``plan`` through ``executor`` under a top-level bar, yielding outputs.
+
+    Without an ``executor`` one is started for this run and shut down after
+    it. A shared executor (:class:`Pool`, or one passed to :func:`ipool`) is
+    left running; only this run's unfinished tasks are cancelled.
+    """
+    owned = executor is None
+    failed_results: list[Result] = []
+
+    try:
+        # Put the runtime on the right backend before the top bar so process
+        # workers forward updates to the parent-owned shared display.
+        if owned:
+            executor = M.get_executor(
+                plan.pool_mode, bar_kw=plan.worker_bar_kw, max_workers=plan.n_workers, runtime=plan.runtime,
+                shared_calls=(plan.shared,) if plan.shared is not None else ())
+        with mqdm(
+            desc=plan.desc,
+            total=plan.total if plan.total >= 0 else None,
+            runtime=plan.runtime,
+            **plan.bar_kw,
+        ) as pbar:
+            shutdown_wait = True
+            shutdown_cancel_futures = False
+            if owned:
+                executor.__enter__()
+            in_flight = {}
+            try:
+                try:
+                    indexed_iter = enumerate(plan.iterable)
+                    # futures report here as they finish, so each completion is O(1)
+                    done: queue.SimpleQueue[Future] = queue.SimpleQueue()
+                    ready = {}
+                    next_index = 0
+
+                    def _track(tasks: list[_Task]) -> None:
+                        in_flight[tasks[0].future] = tasks
+                        tasks[0].future.add_done_callback(done.put)
+
+                    def _fill() -> None:
+                        while len(in_flight) < plan.max_in_flight:
+                            tasks = _submit_next(executor, plan, pbar, indexed_iter)
+                            if not tasks:
+                                break
+                            _track(tasks)
+
+                    _fill()
+                    while in_flight:
+                        tasks = in_flight.pop(done.get())
+                        future = tasks[0].future
+                        # exception() raises on futures cancelled under us, e.g. by Pool.close()
+                        if plan.shared is not None and not future.cancelled() and isinstance(future.exception(), SharedCallMissing):
+                            # this worker hasn't seen fn yet: send it along this time
+                            _track(_resubmit_inline(executor, plan, tasks))
+                            continue
+                        for outcome in _task_outcomes(tasks):
+                            pbar.update(arg=outcome.task.display_arg, i=outcome.task.index)
+
+                            if not as_result_ and not outcome.succeeded and plan.on_error == 'cancel':
+                                _annotate_exception(outcome.error, plan.fn, outcome.task.index, outcome.task.display_arg)
+                                _cancel_pending([task for tasks in in_flight.values() for task in tasks], executor, shutdown=owned)
+                                shutdown_wait = False
+                                shutdown_cancel_futures = True
+                                raise outcome.error
+
+                            if plan.ordered:
+                                ready[outcome.task.index] = outcome
+                                while next_index in ready:
+                                    yield from _emit_outcome(ready.pop(next_index), plan, as_result_, failed_results)
+                                    next_index += 1
+                            else:
+                                yield from _emit_outcome(outcome, plan, as_result_, failed_results)
+
+                        _fill()
+                except KeyboardInterrupt:
+                    plan.runtime.pause()
+                    _shutdown_for_interrupt(
+                        executor, plan.pool_mode, plan.runtime,
+                        op=plan.on_interrupt, grace=plan.interrupt_grace,
+                    )
+                    shutdown_wait = False
+                    shutdown_cancel_futures = True
+                    raise
+            finally:
+                if owned:
+                    executor.shutdown(wait=shutdown_wait, cancel_futures=shutdown_cancel_futures)
+                else:
+                    _cancel_pending([task for tasks in in_flight.values() for task in tasks], executor, shutdown=False)
+    except:
+        plan.runtime.pause()
+        raise
+
+    if failed_results:
+        raise _build_pool_error(plan.fn, failed_results)
+
+
+
 # ----------------------------------- Plan ----------------------------------- #
 
 
@@ -374,7 +619,9 @@ def _make_pool_plan(
         on_interrupt: Literal['terminate', 'kill'],
         interrupt_grace: float,
         fn_kw: dict[str, Any],
-        runtime: Runtime) -> _PoolPlan:
+        runtime: Runtime,
+        chunksize: int | Literal['auto'] = 1,
+        prefetch: int | None = None) -> _PoolPlan:
     total = utils.try_len(iterable, -1)
     if squeeze and total >= 0 and n_workers > total:
         n_workers = total
@@ -382,6 +629,14 @@ def _make_pool_plan(
         pool_mode = 'sequential'
     if pool_mode == 'sequential':
         ordered = True
+    if chunksize == 'auto':
+        chunksize = _auto_chunksize(total, n_workers) if pool_mode == 'process' else 1
+    elif not isinstance(chunksize, int) or chunksize < 1:
+        raise ValueError(f"chunksize_ must be a positive int or 'auto', not {chunksize!r}.")
+    if prefetch is None:
+        prefetch = max(n_workers, 1) * (_PROCESS_PREFETCH_PER_WORKER if pool_mode == 'process' else 1)
+    elif not isinstance(prefetch, int) or prefetch < 1:
+        raise ValueError(f"prefetch_ must be a positive int, not {prefetch!r}.")
 
     return _PoolPlan(
         fn=fn,
@@ -398,31 +653,74 @@ def _make_pool_plan(
         fn_kw=fn_kw,
         total=total,
         discovered_total=max(total, 0),
-        max_in_flight=max(n_workers, 1),
+        max_in_flight=prefetch,
         runtime=runtime,
+        chunksize=chunksize,
+        shared=SharedCall(fn, fn_kw) if pool_mode == 'process' else None,
     )
 
 
+def _auto_chunksize(total: int, n_workers: int) -> int:
+    if total < 0:
+        return _AUTO_CHUNK_UNSIZED
+    size = math.ceil(total / (max(n_workers, 1) * _AUTO_CHUNKS_PER_WORKER))
+    return min(max(size, 1), _AUTO_CHUNK_LIMIT)
+
+
 # ------------------------------- Task Handling ------------------------------ #
 
 
-def _submit_next(executor: Executor, plan: _PoolPlan, pbar: mqdm, indexed_iter: Iterator[tuple[int, Any]]) -> _Task | None:
-    try:
-        index, item = next(indexed_iter)
-    except StopIteration:
-        return None
-
-    display_arg = utils.args.from_item(item)
-    call_arg = utils.args.from_item(item)
-    call_arg.kw = {**plan.fn_kw, **call_arg.kw}
-    future = executor.submit(_task_call, index, plan.fn, call_arg.a, call_arg.kw)
-    plan.submitted += 1
+def _submit_next(executor: Executor, plan: _PoolPlan, pbar: mqdm, indexed_iter: Iterator[tuple[int, Any]]) -> list[_Task]:
+    """Submit the next item, or the next chunk of ``plan.chunksize`` items, as one future."""
+    items = []
+    for index, item in indexed_iter:
+        display_arg = utils.args.from_item(item)
+        call_arg = utils.args.from_item(item)
+        if plan.shared is None:
+            call_arg.kw = {**plan.fn_kw, **call_arg.kw}
+        items.append((index, display_arg, call_arg))
+        if len(items) >= plan.chunksize:
+            break
+    if not items:
+        return []
+
+    tasks = _submit_items(executor, plan, plan.fn if plan.shared is None else plan.shared, items)
+    plan.submitted += len(tasks)
     set_kw: dict[str, Any] = {'started': plan.submitted}  # in-flight + done, for the two-tone bar
     if plan.total < 0:
-        plan.discovered_total += 1
+        plan.discovered_total += len(tasks)
         set_kw['total'] = plan.discovered_total
     pbar.set(**set_kw)
-    return _Task(index=index, display_arg=display_arg, future=future)
+    return tasks
+
+
+def _submit_items(executor: Executor, plan: _PoolPlan, fn: Callable[..., Any], items: list[tuple[int, utils.args, utils.args]]) -> list[_Task]:
+    """Submit ``(index, display_arg, call_arg)`` items as one future (a single task or a chunk)."""
+    submit = executor.submit if plan.bootstrap is None else partial(executor.submit, plan.bootstrap)
+    if plan.pool_mode != 'process':  # nothing is pickled, so mqdm.shared() has nothing to do
+        items = [(index, display_arg, _unwrap_args(call_arg)) for index, display_arg, call_arg in items]
+    if plan.chunksize == 1:
+        index, display_arg, call_arg = items[0]
+        return [_Task(index=index, display_arg=display_arg, future=submit(_task_call, index, fn, call_arg.a, call_arg.kw))]
+    calls = [(index, call_arg.a, call_arg.kw) for index, _, call_arg in items]
+    future = submit(_chunk_call, fn, calls, plan.pool_mode == 'process')
+    return [
+        _Task(index=index, display_arg=display_arg, future=future, offset=offset)
+        for offset, (index, display_arg, _) in enumerate(items)
+    ]
+
+
+def _unwrap_args(arg: utils.args) -> utils.args:
+    arg.a = tuple(unwrap(x) for x in arg.a)
+    arg.kw = {k: unwrap(x) for k, x in arg.kw.items()}
+    return arg
+
+
+def _resubmit_inline(executor: Executor, plan: _PoolPlan, tasks: list[_Task]) -> list[_Task]:
+    """Resubmit tasks that reached a worker without ``plan.shared``, carrying it this time."""
+    # Without shared kwargs merged in, the call args are the display args.
+    items = [(task.index, task.display_arg, task.display_arg) for task in tasks]
+    return _submit_items(executor, plan, plan.shared.inline(), items)
 
 
 def _task_call(index, fn, args, kw):
@@ -433,22 +731,62 @@ def _task_call(index, fn, args, kw):
     main process (which submitted them) and are correlated there, so large inputs
     are never re-serialized per event.
     """
+    _require_shared_call(fn)  # before any task events: a miss is retried, not a failure
     with _task_event_context(index):
         return fn(*args, **kw)
 
 
+def _require_shared_call(fn: Callable[..., Any]) -> None:
+    if isinstance(fn, SharedCall) and fn.fn is None:
+        raise SharedCallMissing(fn.token)
+
+
+def _chunk_call(fn, calls, remote):
+    """Run a chunk of ``(index, args, kw)`` calls in the worker, like :func:`_task_call` each.
+
+    Returns an ``(ok, value_or_error)`` pair per call, so one failing item
+    doesn't take the rest of the chunk with it. In process mode errors are
+    wrapped the way the executor wraps them, so they arrive with the remote
+    traceback attached.
+    """
+    _require_shared_call(fn)  # a miss retries the whole chunk, not each item
+    outcomes = []
+    for index, args, kw in calls:
+        try:
+            outcomes.append((True, _task_call(index, fn, args, kw)))
+        except Exception as error:
+            outcomes.append((False, _ExceptionWithTraceback(error, error.__traceback__) if remote else error))
+    return outcomes
+
+
 def _task_outcome(task: _Task) -> _TaskOutcome:
     try:
-        return _TaskOutcome(task=task, value=task.future.result())
+        return _TaskOutcome(task=task, value=unwrap(task.future.result()))
     except BaseException as error:
         return _TaskOutcome(task=task, error=error)
 
 
-def _cancel_pending(tasks: list[_Task], executor: Executor) -> None:
+def _task_outcomes(tasks: list[_Task]) -> list[_TaskOutcome]:
+    """Outcomes for the tasks sharing one finished future (a single task or a chunk)."""
+    if tasks[0].offset is None:
+        return [_task_outcome(tasks[0])]
+    try:
+        results = tasks[0].future.result()
+    except BaseException as error:  # the whole chunk failed, e.g. its worker died
+        return [_TaskOutcome(task=task, error=error) for task in tasks]
+    outcomes = []
+    for task in tasks:
+        ok, value = results[task.offset]
+        outcomes.append(_TaskOutcome(task=task, value=unwrap(value)) if ok else _TaskOutcome(task=task, error=value))
+    return outcomes
+
+
+def _cancel_pending(tasks: list[_Task], executor: Executor, shutdown: bool=True) -> None:
     for task in tasks:
         if not task.future.done():
             task.future.cancel()
-    executor.shutdown(wait=False, cancel_futures=True)
+    if shutdown:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def _shutdown_for_interrupt(
@@ -2,22 +2,21 @@ from __future__ import annotations
 
 import atexit
 from contextlib import contextmanager
+import itertools
 import logging
 import threading
 import time
 import weakref
-from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Callable, Literal, TypeAlias, TypedDict
 
 
-import rich
 
-from .backend import ProgressBackend, ProxyConvertibleBackend, create_backend as _default_create_backend
+from .backend import ProgressBackend, ProxyConvertibleBackend, create_backend as _default_create_backend, get_backend_factory
 from . import utils
+from .utils._local import _clear_local, _get_local, _set_local
 
 if TYPE_CHECKING:
     from logging import Formatter, Logger
-    from weakref import ReferenceType
 
     from .utils._logging import MQDMHandler
     from .bar import mqdm as MQDMBar
@@ -42,6 +41,111 @@ _LOCAL_EVENT_TYPE = type(threading.Event())
 _RUNTIME_CONTEXTS_KEY = "runtime_contexts"
 
 
+class _BarRef(weakref.ref):
+    __slots__ = ('key',)
+
+
+class InstanceRegistry:
+    """Insertion-ordered, weakly-referenced registry of the bars on a runtime.
+
+    Bars are keyed by ``hash(bar)``. Lookups by position index into a list, so
+    the most recent bar (``get(-1)``) is O(1), and so is ``get(i)`` while no bar
+    was removed from the middle. Removal leaves a hole in the list that is
+    trimmed from the end right away, and the list is compacted once holes
+    outnumber live bars, which keeps it amortized O(1).
+    Bars that are garbage collected without being removed drop out on their own.
+    """
+
+    def __init__(self) -> None:
+        self._refs: list[_BarRef | None] = []
+        self._pos: dict[int, int] = {}
+        self._holes = 0
+        # Reentrant: a bar's __del__ (run by GC mid-operation) removes itself.
+        self._lock = threading.RLock()
+        # Weakref callbacks can fire mid-operation (from GC), so they only queue
+        # the dead key; it is removed at the start of the next operation.
+        self._dead: list[int] = []
+        selfref = weakref.ref(self)
+
+        def _on_dead(ref: _BarRef) -> None:
+            registry = selfref()
+            if registry is not None:
+                registry._dead.append(ref.key)
+        self._on_dead = _on_dead
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge()
+            return len(self._pos)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._pos
+
+    def add(self, bar: MQDMBar) -> MQDMBar:
+        key = hash(bar)
+        with self._lock:
+            self._purge()
+            if key not in self._pos:
+                ref = _BarRef(bar, self._on_dead)
+                ref.key = key
+                self._pos[key] = len(self._refs)
+                self._refs.append(ref)
+        return bar
+
+    def remove(self, bar: MQDMBar) -> None:
+        with self._lock:
+            self._purge()
+            self._discard(hash(bar))
+
+    def get(self, i: int = -1) -> MQDMBar | None:
+        with self._lock:
+            self._purge()
+            if i == -1 or not self._holes:  # holes at the end are trimmed right away
+                return self._refs[i]()
+            refs = self._refs if i >= 0 else reversed(self._refs)
+            live = (ref for ref in refs if ref is not None)
+            ref = next(itertools.islice(live, i if i >= 0 else -i - 1, None), None)
+            if ref is None:
+                raise IndexError('bar index out of range')
+            return ref()
+
+    def bars(self) -> list[MQDMBar]:
+        """The live bars, oldest first."""
+        with self._lock:
+            self._purge()
+            return [bar for ref in self._refs if ref is not None and (bar := ref()) is not None]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._refs.clear()
+            self._pos.clear()
+            self._dead.clear()
+            self._holes = 0
+
+    def _purge(self) -> None:
+        dead = self._dead
+        while dead:
+            self._discard(dead.pop())
+
+    def _discard(self, key: int) -> None:
+        i = self._pos.pop(key, None)
+        if i is None:
+            return
+        refs = self._refs
+        refs[i] = None
+        self._holes += 1
+        while refs and refs[-1] is None:
+            refs.pop()
+            self._holes -= 1
+        if self._holes > len(self._pos):
+            self._compact()
+
+    def _compact(self) -> None:
+        refs = self._refs = [ref for ref in self._refs if ref is not None]
+        self._pos = {ref.key: i for i, ref in enumerate(refs)}
+        self._holes = 0
+
+
 class Runtime:
     """Owns progress, pause, and logging state for one mqdm session.
 
@@ -55,8 +159,9 @@ class Runtime:
         self,
         on_event: Callable[[EventEnvelope], Any] | None = None,
         *,
-        create_backend: Callable[..., ProgressBackend] | None = None,
+        create_backend: Callable[..., ProgressBackend] | str | None = None,
         backend_options: dict[str, Any] | None = None,
+        transport_options: dict[str, Any] | None = None,
     ) -> None:
         self.pbar: ProgressBackend | None = None
         self.command_dispatch: QueueCommandDispatch | None = None
@@ -74,15 +179,21 @@ class Runtime:
         self.pause_event.set()
         self.shutdown_event: threading.Event = threading.Event()
         self.shutdown_event.set()
-        self.instances: OrderedDict[int, ReferenceType[MQDMBar]] = OrderedDict()
+        self.instances: InstanceRegistry = InstanceRegistry()
         self.logging_handlers: weakref.WeakSet[MQDMHandler] = weakref.WeakSet()
         self._sustain_depth: int = 0
         self._last_pause_exit: _pause_exit | None = None
         self.capture_warnings: bool = False
         self.logging_config: LoggingConfig | None = None
         self.pause_wait_ttl_seconds: float = 0.5
-        self._create_backend = create_backend or _default_create_backend
+        self._create_backend = get_backend_factory(create_backend or _default_create_backend)
         self._backend_options: dict[str, Any] = dict(backend_options or {})
+        # Forwarded to the process-mode command dispatch, e.g. ``channel='pipe'``.
+        self._transport_options: dict[str, Any] = dict(transport_options or {})
+        # Overflow counts of command dispatches already shut down (see overflow_stats).
+        self._overflow_totals: dict[str, int] = {"dropped": 0, "merged": 0}
+        # Final transport_stats() of the last command dispatch shut down.
+        self._last_transport_stats: dict[str, Any] | None = None
         _all_runtimes.add(self)
 
     @property
@@ -93,23 +204,35 @@ class Runtime:
     def configure(
         self,
         *,
-        create_backend: Callable[..., ProgressBackend] | None = None,
+        create_backend: Callable[..., ProgressBackend] | str | None = None,
         backend_options: dict[str, Any] | None = None,
+        transport_options: dict[str, Any] | None = None,
     ) -> Runtime:
         """Set display options for this runtime, before its first bar.
 
         ``backend_options`` are forwarded to the progress backend (Rich by default,
         e.g. ``refresh_per_second``, ``expand``, ``redirect_stdout``); ``create_backend``
-        swaps the backend factory entirely. Raises if the shared display already exists.
+        swaps the backend factory entirely — a callable, or a built-in name such as
+        ``'headless'`` (counters only, no rendering). ``transport_options`` configure
+        how process-pool workers reach this process, e.g. ``{'channel': 'pipe'}`` for
+        a pipe per worker thread instead of one shared queue, or ``'lanes'`` to keep
+        requests and output ahead of progress updates; ``{'maxsize': N}`` bounds the
+        queue so progress updates are merged (or, with ``'overflow': 'drop'``,
+        dropped) rather than piling up when this process falls behind;
+        ``{'stats': True}`` records worker traffic for :meth:`transport_stats`; and
+        ``{'channel': 'socket'}`` lets workers on other hosts connect (see :meth:`listen`).
+        Raises if the shared display already exists.
         """
-        if backend_options is None and create_backend is None:
+        if backend_options is None and create_backend is None and transport_options is None:
             return self
         if self.pbar is not None:
             raise RuntimeError("Cannot configure runtime options after the shared progress bar has been created.")
         if create_backend is not None:
-            self._create_backend = create_backend
+            self._create_backend = get_backend_factory(create_backend)
         if backend_options is not None:
             self._backend_options.update(backend_options)
+        if transport_options is not None:
+            self._transport_options.update(transport_options)
         return self
 
     def __getstate__(self) -> dict[str, Any]:
@@ -118,7 +241,7 @@ class Runtime:
         if pbar is not None and not getattr(pbar, 'multiprocess', False):
             state['pbar'] = None
         state['command_dispatch'] = None
-        state['instances'] = OrderedDict()
+        state['instances'] = None
         state['logging_handlers'] = None
         # Warning capture is process-local state and must be reinstalled in workers.
         state['capture_warnings'] = False
@@ -139,14 +262,12 @@ class Runtime:
         if self.shutdown_event is None:
             self.shutdown_event = threading.Event()
             (self.shutdown_event.set if shutdown_event_is_set else self.shutdown_event.clear)()
-        self.instances = OrderedDict()
+        self.instances = InstanceRegistry()
         self.logging_handlers = weakref.WeakSet()
         _all_runtimes.add(self)
 
     def _get_context_store(self) -> dict[str, dict[str, Any]]:
         """Return the thread-local per-runtime context mapping."""
-        from .parallel.executor import _get_local, _set_local
-
         contexts = _get_local(_RUNTIME_CONTEXTS_KEY)
         if contexts is None:
             contexts = {}
@@ -181,16 +302,43 @@ class Runtime:
     def new_pbar(self, **kw: Any) -> ProgressBackend:
         return self._create_backend(runtime=self, **kw)
 
-    def _ensure_command_dispatch(self) -> QueueCommandDispatch:
+    def _ensure_command_dispatch(self, channel: str | None = None) -> QueueCommandDispatch:
+        """Start the process-mode command dispatch if it isn't running.
+
+        ``channel`` overrides the configured channel for a dispatch started here
+        (it lasts until the display closes); a running dispatch is returned as is.
+        """
         from .utils.proxy import QueueCommandDispatch
 
         dispatch = self.command_dispatch
         if dispatch is not None:
             return dispatch
-        dispatch = self.command_dispatch = QueueCommandDispatch()
+        options = self._transport_options
+        if channel is not None and channel != options.get('channel', 'queue'):
+            options = {k: v for k, v in options.items() if k != 'maxsize'}  # not every channel is bounded
+            options['channel'] = channel
+        dispatch = self.command_dispatch = QueueCommandDispatch(**options)
+        if dispatch.stats:
+            dispatch.on_stats = self._emit_transport_stats
         dispatch.start()
         return dispatch
 
+    def listen(self) -> Any:
+        """Serve this runtime's display to socket workers and return their address.
+
+        Needs ``transport_options={'channel': 'socket'}`` (plus ``'address'``, e.g.
+        ``('0.0.0.0', 7700)``, to be reachable from other hosts, and an ``'authkey'``
+        shared with them). Any process can then report into the display with
+        ``ProgressProxy.connect(address, authkey=...)`` — or set it as its runtime's
+        ``pbar`` so its own ``mqdm`` bars report here. The display closes with
+        the last bar as usual; wrap the serving section in :meth:`sustain` to
+        keep it up in between.
+        """
+        if self._transport_options.get('channel') != 'socket':
+            raise RuntimeError("Runtime.listen() needs transport_options={'channel': 'socket'}.")
+        self.get_pbar(pool_mode='process').start()
+        return self._ensure_command_dispatch().address
+
     def _ensure_process_backend(self, pbar: ProgressBackend) -> ProgressBackend:
         """Promote a local backend when process mode requires IPC-safe access."""
         if pbar.multiprocess:
@@ -211,11 +359,9 @@ class Runtime:
 
     def clear_pbar(self, strict: bool = True, force: bool = False) -> None:
         if force:
-            for bar_ref in reversed(list(self.instances.values())):
-                bar = bar_ref()
-                if bar is not None:
-                    bar.close(remove=False)
-                    bar.disable = True
+            for bar in reversed(self.instances.bars()):
+                bar.close(remove=False)
+                bar.disable = True
             if self.pbar is not None:
                 self.pbar.stop()
             self.pbar = None
@@ -242,23 +388,20 @@ class Runtime:
             self.shutdown_command_dispatch()
 
     def add_instance(self, bar: MQDMBar) -> MQDMBar:
-        self.instances.setdefault(hash(bar), weakref.ref(bar))
-        return bar
+        return self.instances.add(bar)
 
     def remove_instance(self, bar: MQDMBar) -> None:
-        self.instances.pop(hash(bar), None)
+        self.instances.remove(bar)
 
     def get_instance(self, i: int = -1) -> MQDMBar:
         try:
-            return list(self.instances.values())[i]()
+            return self.instances.get(i)
         except IndexError:
             raise IndexError(f'No progress bar found at index {i} in list of length {len(self.instances)}')
 
     def close_instances(self) -> None:
-        for bar_ref in list(self.instances.values()):
-            bar = bar_ref()
-            if bar is not None:
-                bar.close()
+        for bar in self.instances.bars():
+            bar.close()
         self.instances.clear()
 
     def pause(self, paused: bool = True) -> _pause_exit:
@@ -312,8 +455,6 @@ class Runtime:
                 mqdm.print("scanning")   # event context includes phase="index"
             ```
         """
-        from .parallel.executor import _clear_local
-
         contexts = self._get_context_store()
         prev = self.get_context()
         contexts[self._context_key] = {**prev, **context}
@@ -350,6 +491,8 @@ class Runtime:
         pbar = self.pbar
         if pbar is not None:
             return pbar.write(*args, **kw)
+        import rich
+
         return rich.get_console().print(*args, **kw)
 
     def emit(self, event_type: str, **data: Any) -> Any:
@@ -454,6 +597,39 @@ class Runtime:
             _release_warnings(runtime=self)
         self.logging_config = None
 
+    def overflow_stats(self) -> dict[str, int]:
+        """Count process-worker updates that found a bounded command queue full.
+
+        Only non-zero with ``transport_options={'maxsize': N}``: ``merged`` updates
+        were held back and folded into a later batch, ``dropped`` ones were
+        discarded (``'overflow': 'drop'``). Totals cover every pool this runtime ran.
+        """
+        stats = dict(self._overflow_totals)
+        dispatch = self.command_dispatch
+        if dispatch is not None:
+            for key, value in dispatch.overflow_stats().items():
+                stats[key] += value
+        return stats
+
+    def transport_stats(self) -> dict[str, Any] | None:
+        """Summarize the IPC generated by process-pool workers.
+
+        Needs ``transport_options={'stats': True}`` (otherwise ``None``). Returns
+        per-method message counts and serialized bytes, request round-trip
+        latency (mean, max and a histogram), the owner's queue depth, and
+        overflow counts — for the running pool, or the last one once it has
+        finished. The same summary is emitted as a ``transport_stats`` event
+        every ``stats_interval`` seconds (default 5) while workers are sending,
+        and once when the pool shuts down.
+        """
+        dispatch = self.command_dispatch
+        if dispatch is not None and dispatch.stats:
+            return dispatch.transport_stats()
+        return self._last_transport_stats
+
+    def _emit_transport_stats(self, stats: dict[str, Any]) -> None:
+        self.emit("transport_stats", **stats)
+
     def shutdown_command_dispatch(self) -> None:
         dispatch = self.command_dispatch
         if dispatch is None:
@@ -463,6 +639,12 @@ class Runtime:
             dispatch.stop()
         finally:
             self.command_dispatch = None
+            for key, value in dispatch.overflow_stats().items():
+                self._overflow_totals[key] += value
+        stats = dispatch.transport_stats()
+        if stats is not None:
+            self._last_transport_stats = stats
+            self._emit_transport_stats(stats)
 
     def atexit(self) -> None:
         self.uninstall_logging()
@@ -478,8 +660,6 @@ _runtime = Runtime()
 
 def _current_runtime() -> Runtime:
     try:
-        from .parallel.executor import _get_local
-
         return _get_local('runtime', _runtime)
     except Exception:
         return _runtime
@@ -508,8 +688,6 @@ def using(runtime: Runtime):
                 ...
         ```
     """
-    from .parallel.executor import _get_local, _set_local, _clear_local
-
     prev = _get_local('runtime', None)
     _set_local(runtime=runtime)
     try:
@@ -529,6 +707,26 @@ def configure(**kw: Any) -> Runtime:
     ``speed_estimate_period``. Must run before any bar is created — it raises once the
     shared display exists.
 
+    ``shared_counters=N`` gives process pools a shared-memory table of ``N`` counter
+    slots: worker bars write their counts there instead of sending an update over
+    the command queue for every flush.
+
+    ``create_backend=`` swaps the backend: ``'headless'`` keeps task counters
+    without rendering anything (for services and CI), or pass a factory callable.
+
+    ``transport_options=`` configures the process-pool command channel, e.g.
+    ``{'channel': 'pipe'}`` gives every worker thread its own pipe to this
+    process instead of sharing one queue (less lock contention with many workers),
+    and ``{'channel': 'lanes'}`` sends progress updates on their own lane so
+    prints, logs and task round trips never wait behind them. Add
+    ``'maxsize': N`` to bound the queue when this process may fall behind (e.g. a
+    slow terminal): progress updates are then merged or dropped instead of
+    queuing up, and :meth:`Runtime.overflow_stats` counts them. ``'stats': True``
+    records message counts, bytes and request latency for
+    :meth:`Runtime.transport_stats`. ``{'channel': 'socket'}`` (with ``'address'``
+    and ``'authkey'``) serves the display over a Unix or TCP socket so workers in
+    other containers or on other hosts can report into it; see :meth:`Runtime.listen`.
+
     Example:
         ```python
         import mqdm as M
@@ -537,7 +735,9 @@ def configure(**kw: Any) -> Runtime:
             ...
         ```
     """
-    return _runtime.configure(backend_options=kw or None)
+    create_backend = kw.pop('create_backend', None)
+    transport_options = kw.pop('transport_options', None)
+    return _runtime.configure(create_backend=create_backend, backend_options=kw or None, transport_options=transport_options)
 
 
 class _pause_exit:
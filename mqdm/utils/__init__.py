@@ -1,7 +1,6 @@
 import os
 import time
 from time import monotonic
-import multiprocessing as mp
 import mqdm as M
 
 # ---------------------------------------------------------------------------- #
@@ -11,10 +10,14 @@ import mqdm as M
 
 def is_main_process():
     """Check if the current process is the main process."""
+    import multiprocessing as mp
+
     return mp.current_process().name == 'MainProcess'
 
 def process_name():
     """Get the name of the current process."""
+    import multiprocessing as mp
+
     return mp.current_process().name
 
 class args:
@@ -0,0 +1,26 @@
+"""Thread-local state shared by bars, runtimes, and pool workers.
+
+Kept separate from :mod:`mqdm.parallel.executor` so the core (bars and the
+runtime) can read it without importing ``concurrent.futures``.
+"""
+import threading
+
+_thread_local_data = threading.local()
+
+
+def _get_local(key, default=None):
+    """Get a thread-local variable."""
+    return getattr(_thread_local_data, key, default)
+
+
+def _set_local(**values):
+    """Set one or more thread-local variables."""
+    for key, value in values.items():
+        setattr(_thread_local_data, key, value)
+
+
+def _clear_local(*keys):
+    """Remove thread-local variables if present."""
+    for key in keys:
+        if hasattr(_thread_local_data, key):
+            delattr(_thread_local_data, key)
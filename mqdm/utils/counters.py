@@ -0,0 +1,138 @@
+"""Shared-memory counter table for process-mode bar advances.
+
+Worker bars write their completed/total counts straight into a slot of a
+``multiprocessing.shared_memory`` block instead of sending an update command
+per flush. The owning ``Progress`` claims slots for tasks on request and reads
+the table back each time it renders.
+"""
+from __future__ import annotations
+
+import math
+import sys
+import weakref
+from multiprocessing import shared_memory
+from typing import Any
+
+# Per slot: one int64 task key (``task_id + 1``; 0 marks a free slot), then two
+# float64 values (completed, total). NaN means "not written" by the worker yet.
+_KEY_SIZE = 8
+_VALUE_SIZE = 16
+
+
+class SharedCounterTable:
+    """Fixed-size table of per-task counters backed by shared memory.
+
+    The owner creates the table (and unlinks it once the table is garbage
+    collected); pickling sends only the block name, and unpickling in a worker
+    attaches to the same memory. A task's slot is ``task_id % size``, claimed by
+    the owner with :meth:`claim` — tasks whose slot is taken simply keep using
+    the regular command transport.
+    """
+
+    def __init__(self, size: int, *, name: str | None = None) -> None:
+        create = name is None
+        self.size = size
+        self._shm = _open_shared_memory(name, create, size * (_KEY_SIZE + _VALUE_SIZE))
+        buf = self._shm.buf
+        self.keys = buf[:size * _KEY_SIZE].cast('q')
+        self.values = buf[size * _KEY_SIZE:size * (_KEY_SIZE + _VALUE_SIZE)].cast('d')
+        # Owner-local: task id -> claimed slot, so syncing scans only live slots.
+        self.claimed: dict[Any, int] = {}
+        self._finalizer = weakref.finalize(self, _close_shared_memory, self._shm, self.keys, self.values, create)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def __reduce__(self):
+        return (_attach_table, (self.size, self.name))
+
+    def close(self) -> None:
+        self._finalizer()
+
+    # ---------------------------------- Owner ---------------------------------- #
+
+    def claim(self, task_id: int) -> bool:
+        """Reserve this task's slot, empty until the worker first writes to it.
+
+        Until then the task's counts still arrive as regular updates, which the
+        slot must not overwrite.
+        """
+        slot = task_id % self.size
+        key = task_id + 1
+        current = self.keys[slot]
+        if current == key:
+            return True
+        if current != 0:
+            return False
+        self.values[2 * slot] = self.values[2 * slot + 1] = math.nan
+        self.keys[slot] = key
+        self.claimed[task_id] = slot
+        return True
+
+    def release(self, task_id: int) -> None:
+        slot = self.claimed.pop(task_id, None)
+        if slot is not None:
+            self.keys[slot] = 0
+
+    def read(self, slot: int) -> tuple[float | None, float | None]:
+        """The slot's ``(completed, total)``, ``None`` for values not written yet.
+
+        Whole numbers come back as ``int``, as the queue path would deliver them.
+        """
+        return _value(self.values[2 * slot]), _value(self.values[2 * slot + 1])
+
+    # ---------------------------------- Worker --------------------------------- #
+
+    def slot(self, task_id: int) -> CounterSlot:
+        return CounterSlot(self, task_id)
+
+
+class CounterSlot:
+    """A worker's handle on one task's counters in a :class:`SharedCounterTable`."""
+
+    __slots__ = ('keys', 'values', 'index', 'key')
+
+    def __init__(self, table: SharedCounterTable, task_id: int) -> None:
+        self.keys = table.keys
+        self.values = table.values
+        self.index = task_id % table.size
+        self.key = task_id + 1
+
+    def set(self, completed: float, total: float | None = None) -> bool:
+        """Write the task's counts; returns ``False`` if the slot isn't ours (yet)."""
+        i = self.index
+        if self.keys[i] != self.key:
+            return False
+        if total is not None:
+            self.values[2 * i + 1] = total
+        self.values[2 * i] = completed
+        return True
+
+
+def _value(x: float) -> float | None:
+    if math.isnan(x):
+        return None
+    return int(x) if x.is_integer() else x
+
+
+def _attach_table(size: int, name: str) -> SharedCounterTable:
+    return SharedCounterTable(size, name=name)
+
+
+def _open_shared_memory(name: str | None, create: bool, size: int) -> shared_memory.SharedMemory:
+    if not create and sys.version_info >= (3, 13):
+        # Only the creating owner should be tracked for cleanup.
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name, create=create, size=size if create else 0)
+
+
+def _close_shared_memory(shm: shared_memory.SharedMemory, keys: memoryview, values: memoryview, unlink: bool) -> None:
+    keys.release()
+    values.release()
+    try:
+        shm.close()
+        if unlink:
+            shm.unlink()
+    except (FileNotFoundError, OSError):
+        pass
@@ -1,17 +1,34 @@
 from __future__ import annotations
 
 from functools import wraps
-import multiprocessing as mp
 import os
-from queue import Empty
+from queue import Empty, Full
 import threading
-from typing import Any, Generic, Protocol, TypeVar, runtime_checkable
+import time
+from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar, runtime_checkable
+
+from . import wire
+from .stats import TransportStats, merge_snapshots
+
+if TYPE_CHECKING:
+    from .ring import CommandRing
 
 
 TRef = TypeVar("TRef")
 TProxy = TypeVar("TProxy", bound="CommandProxyMixin[Any]")
 TTransportProxy = TypeVar("TTransportProxy", bound="TransportProxy[Any]")
-_REQUEST_POLL_INTERVAL = 0.1
+# How long a worker sleeps before retrying a write to its full command ring.
+_RING_FULL_WAIT = 0.0005
+# Replies (including the "transport closed" notice sent by ``stop()``) wake a
+# waiting request immediately; this poll only catches an owner that died
+# without stopping its dispatch.
+_REQUEST_SAFETY_POLL = 1.0
+# Fire-and-forget commands the dispatch may merge per task (see _handle_batch).
+_UPDATE_METHODS = frozenset({"try_update", "update_", "apply_updates"})
+# What a worker does with an update that finds a bounded queue full.
+_OVERFLOW_POLICIES = ("merge", "drop")
+# Slots of the shared overflow counters (see QueueTransport).
+_DROPPED, _MERGED = 0, 1
 
 
 class CommandTransportClosed(RuntimeError):
@@ -34,9 +51,17 @@ class CommandHandler(Generic[TRef]):
 
     def __init__(self, target: TRef) -> None:
         self.target = target
+        # Bound methods by name, so replaying a command skips the attribute lookup.
+        self._methods: dict[str, Any] = {}
+        # Whether the dispatch may merge queued updates into one apply_updates call.
+        self.coalesce = callable(getattr(target, "apply_updates", None))
 
     def invoke(self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
-        return getattr(self.target, method)(*args, **kwargs)
+        try:
+            func = self._methods[method]
+        except KeyError:
+            func = self._methods[method] = getattr(self.target, method)
+        return func(*args, **kwargs)
 
 
 class LocalTransport(Generic[TRef]):
@@ -59,6 +84,15 @@ class LocalTransport(Generic[TRef]):
 class QueueTransport(Generic[TRef]):
     """Command transport backed by a queue, with direct local fast-path."""
 
+    # Dispatch channel this transport speaks (see QueueCommandDispatch).
+    channel = "queue"
+
+    # Methods sent in the packed form from :mod:`mqdm.utils.wire` instead of as
+    # pickled tuples (the dispatch accepts either). Only update batches by
+    # default: they are the bulk of worker traffic and pack into a fixed layout
+    # that's cheaper for the owner to receive. Use ``wire.METHODS`` to pack all.
+    compact_methods: frozenset[str] = frozenset({'apply_updates'})
+
     def __init__(
         self,
         queue: Any,
@@ -67,23 +101,52 @@ class QueueTransport(Generic[TRef]):
         target_id: Any = None,
         owner_pid: int | None = None,
         closed: Any | None = None,
+        overflow: str | None = None,
+        overflow_counts: Any | None = None,
+        stats_interval: float | None = None,
     ) -> None:
+        import multiprocessing as mp
+
         self.queue = queue
         self.target = target
         self.target_id = target_id
         self.owner_pid = os.getpid() if owner_pid is None else owner_pid
         self.closed = mp.Event() if closed is None else closed
+        # Bounded progress lane only: what to do with an update that finds it
+        # full ("merge" or "drop"), and shared [dropped, merged] counters.
+        self.overflow = overflow
+        self.overflow_counts = overflow_counts
+        # Seconds between stats snapshots sent to the dispatch; None records nothing.
+        self.stats_interval = stats_interval
         # Persistent per-thread reply channel, created lazily on first request
         # (worker side only). Kept out of pickled state — it is process/thread
         # local, like multiprocessing.managers' thread-local connection.
         self._reply_tls: Any = None
+        self._state_pid: int | None = None
 
     def __getstate__(self) -> dict[str, Any]:
         state = self.__dict__.copy()
         state['target'] = None
         state['_reply_tls'] = None
+        state['_state_pid'] = None  # send lock and held updates are per process
+        for key in ('_send_lock', '_held', '_stats', '_stats_due'):
+            state.pop(key, None)
         return state
 
+    def _process_state(self) -> threading.RLock:
+        """Return the lock guarding this process's send-side state, resetting it after a fork."""
+        if self._state_pid != os.getpid():
+            self._state_pid = os.getpid()
+            self._reset_process_state()
+        return self._send_lock
+
+    def _reset_process_state(self) -> None:
+        self._send_lock = threading.RLock()
+        # Updates held back while the bounded queue was full, merged per task.
+        self._held: dict[Any, dict[str, Any]] | None = None
+        self._stats: TransportStats | None = None
+        self._stats_due = 0.0
+
     def _is_owner(self) -> bool:
         return self.target is not None and os.getpid() == self.owner_pid
 
@@ -97,10 +160,114 @@ class QueueTransport(Generic[TRef]):
             return
         try:
             self._ensure_open()
-            self.queue.put(("send", self.target_id, method, args, kwargs))
+            if self.overflow is not None and method in _UPDATE_METHODS:
+                self._offer_update(method, args, kwargs)
+            else:
+                message = self._message("send", method, args, kwargs)
+                self._put(message)
+                self._record(method, message)
         except (BrokenPipeError, EOFError, OSError, ValueError) as exc:
             raise CommandTransportClosed("Command transport is closed.") from exc
 
+    def _put(self, message: Any) -> None:
+        if self.overflow is None:
+            self.queue.put(message)
+            return
+        with self._process_state():
+            self._release_held()
+            self.queue.put(message)
+
+    def _put_update(self, message: Any, block: bool) -> bool:
+        """Queue an update message; ``False`` if the queue is full and ``block`` is off."""
+        try:
+            self.queue.put(message, block)
+        except Full:
+            return False
+        return True
+
+    # ---------------------------- Bounded backpressure --------------------------- #
+    #  with a bounded queue an update never blocks the worker: if the queue is   #
+    #  full it is merged into a held batch that goes out with the next update   #
+    #  that fits (or before the next control message), or dropped outright.    #
+    #  Output, task lifecycle and requests always wait for room instead.        #
+
+    def _offer_update(self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        with self._process_state():
+            held = self._held
+            if held is None:
+                message = self._message("send", method, args, kwargs)
+                if self._put_update(message, False):
+                    self._record(method, message)
+                    return
+                if self.overflow == "drop":
+                    self._count_overflow(_DROPPED)
+                    return
+                held = self._held = {}
+            if not _merge_update_command(held, method, args, kwargs):
+                self._count_overflow(_DROPPED)  # malformed; the dispatch would drop it too
+                return
+            self._count_overflow(_MERGED)
+            message = self._message("send", "apply_updates", (list(held.items()),), {})
+            if self._put_update(message, False):
+                self._held = None
+                self._record("apply_updates", message)
+
+    def _release_held(self) -> None:
+        """Send held updates, waiting for room, so they stay ahead of the next control message."""
+        held = self._held
+        if held:
+            message = self._message("send", "apply_updates", (list(held.items()),), {})
+            self._put_update(message, True)
+            self._record("apply_updates", message)
+        self._held = None
+
+    def _count_overflow(self, slot: int) -> None:
+        counts = self.overflow_counts
+        if counts is not None:
+            with counts.get_lock():
+                counts[slot] += 1
+
+    # ------------------------------ Instrumentation ------------------------------ #
+    #  with ``stats_interval`` set, sent messages and request round trips are    #
+    #  recorded here and a cumulative snapshot goes to the dispatch as a        #
+    #  ``("stats", sender, snapshot)`` control message every interval.          #
+
+    def _record(self, method: str, message: Any, latency: float | None = None) -> None:
+        if self.stats_interval is None:
+            return
+        with self._process_state():
+            stats = self._stats
+            if stats is None:
+                stats = self._stats = TransportStats()
+                # Same priority as the queue's own close (and BackendProxy's
+                # update flush); equal priorities run newest first, so this
+                # goes after the final update flush but before the queue's
+                # feeder stops, which registered when the first message was put.
+                from multiprocessing import util as mp_util
+
+                mp_util.Finalize(None, _ship_stats_quietly, args=(self,), exitpriority=10)
+            stats.record(method, message)
+            if latency is not None:
+                stats.record_latency(latency)
+            now = time.monotonic()
+            if now >= self._stats_due:
+                self._stats_due = now + self.stats_interval
+                self._ship_stats()
+
+    def _ship_stats(self) -> None:
+        with self._process_state():
+            if self._stats is not None:
+                self._put(("stats", (os.getpid(), id(self)), self._stats.snapshot()))
+
+    def _message(self, kind: str, method: str, args: tuple[Any, ...], kwargs: dict[str, Any], reply_id: Any = None) -> Any:
+        if method in self.compact_methods:
+            data = wire.encode(kind, self.target_id, method, args, kwargs, reply_id)
+            if data is not None:
+                return data
+        if kind == "request":
+            return (kind, self.target_id, method, args, kwargs, reply_id)
+        return (kind, self.target_id, method, args, kwargs)
+
     def _reply_channel(self) -> tuple[Any, Any]:
         """Return this thread's persistent ``(reply_id, recv_end)`` channel.
 
@@ -115,9 +282,11 @@ class QueueTransport(Generic[TRef]):
             tls = self._reply_tls = threading.local()
         chan = getattr(tls, "chan", None)
         if chan is None:
+            import multiprocessing as mp
+
             recv_end, send_end = mp.Pipe(duplex=False)
             reply_id = (os.getpid(), threading.get_ident(), id(self))
-            self.queue.put(("open_reply", reply_id, send_end))
+            self._put(("open_reply", reply_id, send_end))
             # Keep send_end referenced: the queue feeder pickles it
             # asynchronously, and the dispatch writes replies to its transferred
             # copy — we just must not GC/close ours out from under the feeder.
@@ -130,10 +299,13 @@ class QueueTransport(Generic[TRef]):
         self._ensure_open()  # check before touching the reply channel
         reply_id, recv_end = self._reply_channel()
         try:
-            self.queue.put(("request", self.target_id, method, args, kwargs, reply_id))
+            message = self._message("request", method, args, kwargs, reply_id)
+            t0 = time.perf_counter()
+            self._put(message)
             while True:
-                if recv_end.poll(_REQUEST_POLL_INTERVAL):
+                if recv_end.poll(_REQUEST_SAFETY_POLL):
                     ok, payload = recv_end.recv()
+                    self._record(method, message, time.perf_counter() - t0)
                     if ok:
                         return payload
                     raise payload
@@ -142,12 +314,341 @@ class QueueTransport(Generic[TRef]):
             raise CommandTransportClosed("Command transport is closed.") from exc
 
 
+class PipeTransport(QueueTransport[TRef]):
+    """Queue transport variant where each worker thread has its own duplex pipe.
+
+    The shared queue only carries a one-off ``open_pipe`` handshake per thread;
+    commands, requests and their replies then travel over that thread's pipe,
+    so workers never contend on the queue's shared write lock and the owner can
+    drain a worker's backlog in one wakeup.
+    """
+
+    channel = "pipe"
+
+    def _pipe(self) -> Any:
+        tls = self._reply_tls
+        if tls is None:
+            tls = self._reply_tls = threading.local()
+        conn = getattr(tls, "conn", None)
+        if conn is None:
+            import multiprocessing as mp
+
+            conn, owner_end = mp.Pipe(duplex=True)
+            self.queue.put(("open_pipe", owner_end))
+            # Keep owner_end referenced until the feeder has pickled it (see
+            # QueueTransport._reply_channel).
+            tls.conn, tls.owner_end = conn, owner_end
+        return conn
+
+    def send(self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        if self._is_owner():
+            getattr(self.target, method)(*args, **kwargs)
+            return
+        try:
+            self._ensure_open()
+            message = self._message("send", method, args, kwargs)
+            self._pipe().send(message)
+            self._record(method, message)
+        except (BrokenPipeError, EOFError, OSError, ValueError) as exc:
+            raise CommandTransportClosed("Command transport is closed.") from exc
+
+    def request(self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        if self._is_owner():
+            return getattr(self.target, method)(*args, **kwargs)
+        self._ensure_open()
+        try:
+            conn = self._pipe()
+            message = self._message("request", method, args, kwargs)
+            t0 = time.perf_counter()
+            conn.send(message)
+            while True:
+                if conn.poll(_REQUEST_SAFETY_POLL):
+                    ok, payload = conn.recv()
+                    self._record(method, message, time.perf_counter() - t0)
+                    if ok:
+                        return payload
+                    raise payload
+                self._ensure_open()
+        except (BrokenPipeError, EOFError, OSError, ValueError) as exc:
+            raise CommandTransportClosed("Command transport is closed.") from exc
+
+
+class SocketTransport(PipeTransport[TRef]):
+    """Pipe-style transport over Unix or TCP sockets, reachable by address.
+
+    Each worker thread opens its own authenticated
+    ``multiprocessing.connection.Client`` to the owner's listener (see the
+    ``"socket"`` channel of :class:`QueueCommandDispatch`) and sends commands,
+    requests and replies over it like a :class:`PipeTransport` pipe. Nothing
+    but the address, the auth key and the target id is needed to rebuild it, so
+    it works from processes mqdm did not start — other containers or hosts;
+    see :meth:`TransportProxy.connect`.
+    """
+
+    channel = "socket"
+
+    def __init__(self, queue: Any = None, *, address: Any, authkey: bytes | None = None, **kw: Any) -> None:
+        import multiprocessing as mp
+
+        super().__init__(queue, **kw)
+        self.address = address
+        # Plain bytes: the process's AuthenticationString only pickles while spawning.
+        self.authkey = bytes(mp.current_process().authkey if authkey is None else authkey)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        # Neither is shareable beyond child processes, and neither is needed:
+        # everything goes over the connection, which also reports a closed owner.
+        state['queue'] = state['closed'] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if self.closed is None:
+            self.closed = threading.Event()
+
+    def _pipe(self) -> Any:
+        tls = self._reply_tls
+        if tls is None:
+            tls = self._reply_tls = threading.local()
+        conn = getattr(tls, "conn", None)
+        if conn is None:
+            from multiprocessing.connection import Client
+
+            conn = tls.conn = Client(self.address, authkey=self.authkey)
+        return conn
+
+    def _put(self, message: Any) -> None:
+        self._pipe().send(message)
+
+
+class RingTransport(QueueTransport[TRef]):
+    """Queue transport whose fire-and-forget commands go through a shared-memory ring.
+
+    Each worker process writes its sends into its own :class:`CommandRing`
+    (created on first use and announced to the dispatch with one ``open_ring``
+    message), which the dispatch polls every ``poll_interval``: no pipe write,
+    lock or wakeup per command. Requests keep the queue and reply-pipe path;
+    the dispatch drains the rings before handling each one, so a request still
+    sees every command its worker sent before it. A full ring makes the sender
+    wait for the owner to catch up; a command too big for the ring goes as a
+    request instead, which keeps it in order.
+    """
+
+    channel = "ring"
+    # Ring size in bytes, per worker process.
+    ring_size: int = 1 << 20
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        state.pop('_ring', None)
+        return state
+
+    def _reset_process_state(self) -> None:
+        super()._reset_process_state()
+        self._ring: CommandRing | None = None
+
+    def send(self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        if self._is_owner():
+            getattr(self.target, method)(*args, **kwargs)
+            return
+        try:
+            self._ensure_open()
+            message = self._message("send", method, args, kwargs)
+            if message.__class__ is bytes:
+                data = message
+            else:
+                from multiprocessing.reduction import ForkingPickler
+
+                data = ForkingPickler.dumps(message)
+            if len(data) + 4 > self.ring_size:
+                self._send_oversized(method, args, kwargs)
+                return
+            with self._process_state():
+                ring = self._ring
+                if ring is None:
+                    from .ring import CommandRing  # shared memory only for the ring channel
+
+                    ring = self._ring = CommandRing(self.ring_size)
+                    self._put(("open_ring", ring))
+                while not ring.write(data):
+                    self._wait_for_owner()
+                self._record(method, message)
+        except (BrokenPipeError, EOFError, OSError, ValueError) as exc:
+            raise CommandTransportClosed("Command transport is closed.") from exc
+
+    def _send_oversized(self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        # The dispatch drains the rings before a request and we wait for its
+        # reply, so nothing sent before or after can overtake it.
+        try:
+            self.request(method, args, kwargs)
+        except CommandTransportClosed:
+            raise
+        except Exception:
+            pass  # the target raising is dropped, like any failed send
+
+    def _wait_for_owner(self) -> None:
+        self._ensure_open()
+        time.sleep(_RING_FULL_WAIT)
+
+
+class LaneTransport(QueueTransport[TRef]):
+    """Queue transport with a separate lane for progress updates.
+
+    Task updates go to ``progress_queue``, which the dispatch drains after the
+    control lane and coalesces; output, task lifecycle and requests go to
+    ``queue``, which it services first, so a flood of either kind can't stall
+    the other. Every message carries this sender's count of messages sent on
+    the other lane, letting the dispatch restore per-sender order across the
+    lanes: a request sees every update sent before it, and an update never
+    lands before the ``insert_task`` that created its task.
+    """
+
+    channel = "lanes"
+
+    def __init__(self, queue: Any, *, progress_queue: Any = None, **kw: Any) -> None:
+        super().__init__(queue, **kw)
+        self.progress_queue = progress_queue
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        for key in ('_sender', '_progress_sent', '_control_sent'):
+            state.pop(key, None)
+        return state
+
+    def _reset_process_state(self) -> None:
+        super()._reset_process_state()
+        self._sender = (os.getpid(), id(self))
+        self._progress_sent = self._control_sent = 0
+
+    def _put(self, message: Any) -> None:
+        with self._process_state():
+            self._release_held()
+            self._control_sent += 1
+            self.queue.put((self._sender, self._progress_sent, message))
+
+    def _put_update(self, message: Any, block: bool) -> bool:
+        # Caller holds the process state lock.
+        self._progress_sent += 1
+        try:
+            self.progress_queue.put((self._sender, self._progress_sent, self._control_sent, message), block)
+        except Full:
+            self._progress_sent -= 1
+            return False
+        return True
+
+    def send(self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        if method not in _UPDATE_METHODS or self.overflow is not None or self._is_owner():
+            return super().send(method, args, kwargs)
+        try:
+            self._ensure_open()
+            message = self._message("send", method, args, kwargs)
+            with self._process_state():
+                self._put_update(message, True)
+                self._record(method, message)
+        except (BrokenPipeError, EOFError, OSError, ValueError) as exc:
+            raise CommandTransportClosed("Command transport is closed.") from exc
+
+
+# Worker-side transport class for each dispatch ``channel``.
+_TRANSPORTS: dict[str, type[QueueTransport[Any]]] = {
+    "queue": QueueTransport, "pipe": PipeTransport, "lanes": LaneTransport, "socket": SocketTransport,
+    "ring": RingTransport,
+}
+# How long the dispatch waits for updates a control message depends on before
+# giving up on them (their sender most likely died mid-send).
+_LANE_BARRIER_TIMEOUT = 1.0
+
+
 class QueueCommandDispatch(Generic[TRef]):
-    """Drain queued commands and replay them onto registered local targets."""
+    """Drain queued commands and replay them onto registered local targets.
+
+    ``channel`` picks how workers reach the dispatch: ``"queue"`` (default)
+    sends everything through one shared ``multiprocessing.Queue``; ``"pipe"``
+    gives each worker thread its own pipe (see :class:`PipeTransport`), which
+    the dispatch multiplexes with ``multiprocessing.connection.wait``;
+    ``"lanes"`` splits the queue into a control lane that is serviced first and
+    a coalesced progress lane (see :class:`LaneTransport`); ``"socket"`` listens
+    on ``address`` (a Unix socket path or ``(host, port)``; default a fresh Unix
+    socket) and serves each connection like a worker pipe, so workers in any
+    process or on any host can connect (see :class:`SocketTransport`). Its
+    connections authenticate with ``authkey``, by default this process's
+    ``multiprocessing`` auth key. Commands with no target id go to the
+    registered target when there is only one. ``"ring"`` gives each worker
+    process a shared-memory ring for its fire-and-forget commands, polled every
+    ``poll_interval`` seconds (see :class:`RingTransport`); its rings are freed
+    when the dispatch stops.
 
-    def __init__(self, queue: Any | None = None, handler: CommandHandler[TRef] | None = None, *, target_id: Any = None, closed: Any | None = None) -> None:
-        self.queue = mp.Queue() if queue is None else queue
+    ``maxsize`` bounds the queue that carries progress updates (the shared queue,
+    or the progress lane), so an owner that falls behind can't make it grow
+    without limit. Workers never block on a full queue for an update: with
+    ``overflow="merge"`` (default) they hold it back, merged per task, until
+    there is room; with ``overflow="drop"`` they discard it. Output, task
+    lifecycle and requests wait for room instead, so they are never lost. See
+    :meth:`overflow_stats` for how often either happened.
+
+    ``stats=True`` turns on transport instrumentation (see :mod:`mqdm.utils.stats`
+    and :meth:`transport_stats`); workers report every ``stats_interval``
+    seconds, and ``on_stats`` — if set — is called with the summary about as
+    often while commands are flowing.
+    """
+
+    # Most messages replayed per batch, so a request queued behind a flood of
+    # updates still gets its turn promptly.
+    max_batch: int = 1024
+
+    def __init__(
+        self,
+        queue: Any | None = None,
+        handler: CommandHandler[TRef] | None = None,
+        *,
+        target_id: Any = None,
+        closed: Any | None = None,
+        channel: str = "queue",
+        progress_queue: Any | None = None,
+        maxsize: int = 0,
+        overflow: str = "merge",
+        overflow_counts: Any | None = None,
+        stats: bool = False,
+        stats_interval: float = 5.0,
+        address: Any = None,
+        authkey: bytes | None = None,
+        poll_interval: float = 0.02,
+    ) -> None:
+        import multiprocessing as mp
+
+        if channel not in _TRANSPORTS:
+            raise ValueError(f"Unknown command channel {channel!r}; expected one of {sorted(_TRANSPORTS)}.")
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow!r}; expected one of {list(_OVERFLOW_POLICIES)}.")
+        if maxsize and channel in ("pipe", "socket", "ring"):
+            raise ValueError(f"maxsize is not supported by the {channel} channel; it is bounded by the OS buffer.")
+        self.channel = channel
+        self.maxsize = maxsize
+        # Set when the progress queue is bounded: the policy workers apply to
+        # updates that find it full, and shared [dropped, merged] counters.
+        self.overflow = overflow if maxsize or overflow_counts is not None else None
+        if self.overflow is not None and overflow_counts is None:
+            overflow_counts = mp.Array('q', 2)
+        self.overflow_counts = overflow_counts
+        self.queue = mp.Queue(maxsize if channel == "queue" else 0) if queue is None else queue
         self.closed = mp.Event() if closed is None else closed
+        # Progress lane ("lanes" channel), plus per-sender bookkeeping that
+        # keeps each worker's order across the two lanes.
+        self.progress_queue = progress_queue
+        if channel == "lanes" and progress_queue is None:
+            self.progress_queue = mp.Queue(maxsize)
+        # Instrumentation: the latest cumulative snapshot from each worker
+        # transport, and queue depth sampled each time a batch is replayed.
+        self.stats = stats
+        self.stats_interval = stats_interval
+        self.on_stats: Any | None = None
+        self._worker_stats: dict[Any, dict[str, Any]] = {}
+        self._depth = {"last": 0, "max": 0, "samples": 0, "total": 0}
+        self._stats_due = time.monotonic() + stats_interval
+        self._progress_applied: dict[Any, int] = {}
+        self._control_seen: dict[Any, int] = {}
+        self._deferred: dict[Any, list[Any]] = {}
         self.handlers: dict[Any, CommandHandler[Any]] = {}
         if handler is not None:
             # An explicit single handler keeps whatever key it was given (``None``
@@ -156,6 +657,20 @@ class QueueCommandDispatch(Generic[TRef]):
         # Persistent reply ends, one per requesting worker-thread, keyed by the
         # reply_id sent in an ``open_reply`` message and reused for every reply.
         self._reply_ends: dict[Any, Any] = {}
+        # Owner ends of per-thread worker pipes ("pipe" channel) or accepted
+        # socket connections ("socket" channel).
+        self._pipes: list[Any] = []
+        self._listener: Any = None
+        # Worker command rings ("ring" channel), drained every poll_interval.
+        self._rings: list[CommandRing] = []
+        self.poll_interval = poll_interval
+        self.address = self.authkey = None
+        if channel == "socket":
+            from multiprocessing.connection import Listener
+
+            self.authkey = mp.current_process().authkey if authkey is None else authkey
+            self._listener = Listener(address, authkey=self.authkey)
+            self.address = self._listener.address
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
 
@@ -171,78 +686,560 @@ class QueueCommandDispatch(Generic[TRef]):
     def unregister(self, target_id: Any) -> None:
         self.handlers.pop(target_id, None)
 
+    def create_transport(self, target: TRef | None = None, target_id: Any = None) -> QueueTransport[TRef]:
+        """Return a worker-safe transport that reaches ``target_id`` through this dispatch."""
+        kw: dict[str, Any] = {}
+        if self.channel == "lanes":
+            kw["progress_queue"] = self.progress_queue
+        elif self.channel == "socket":
+            kw.update(address=self.address, authkey=self.authkey)
+        return _TRANSPORTS[self.channel](
+            self.queue, target=target, target_id=target_id, closed=self.closed,
+            overflow=self.overflow, overflow_counts=self.overflow_counts,
+            stats_interval=self.stats_interval if self.stats else None, **kw)
+
+    def overflow_stats(self) -> dict[str, int]:
+        """Return how many worker updates found the bounded queue full.
+
+        ``dropped`` were discarded (``overflow="drop"``); ``merged`` were held
+        back and folded into a later batch (``overflow="merge"``). Both stay 0
+        for an unbounded queue.
+        """
+        counts = self.overflow_counts
+        if counts is None:
+            return {"dropped": 0, "merged": 0}
+        with counts.get_lock():
+            return {"dropped": counts[_DROPPED], "merged": counts[_MERGED]}
+
+    def transport_stats(self) -> dict[str, Any] | None:
+        """Summarize worker traffic so far, or ``None`` unless ``stats`` is on.
+
+        On top of :func:`~mqdm.utils.stats.merge_snapshots` (per-method
+        ``messages``/``bytes`` and request latency as of each worker's last
+        report), adds ``queue_depth`` (``last``/``max``/``mean`` messages waiting
+        when a batch was taken), ``workers`` (transports that reported) and
+        ``overflow`` (see :meth:`overflow_stats`).
+        """
+        if not self.stats:
+            return None
+        summary = merge_snapshots(list(self._worker_stats.values()))
+        depth = self._depth
+        summary["queue_depth"] = {
+            "last": depth["last"],
+            "max": depth["max"],
+            "mean": depth["total"] / depth["samples"] if depth["samples"] else 0.0,
+        }
+        summary["workers"] = len(self._worker_stats)
+        summary["overflow"] = self.overflow_stats()
+        return summary
+
+    def _sample_depth(self, batch_size: int) -> None:
+        """Record how many messages were waiting, and hand out the periodic summary."""
+        depth = batch_size
+        try:
+            depth += self.queue.qsize()
+            if self.progress_queue is not None:
+                depth += self.progress_queue.qsize()
+        except (NotImplementedError, AttributeError):
+            pass  # no qsize() (e.g. macOS): the batch itself is the best estimate
+        stats = self._depth
+        stats["last"] = depth
+        stats["max"] = max(stats["max"], depth)
+        stats["samples"] += 1
+        stats["total"] += depth
+        now = time.monotonic()
+        if self.on_stats is not None and now >= self._stats_due:
+            self._stats_due = now + self.stats_interval
+            try:
+                self.on_stats(self.transport_stats())
+            except Exception:
+                pass  # a failing consumer must not stop the dispatch
+
     def _dispatch(self, target_id: Any, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
         try:
             handler = self.handlers[target_id]
         except KeyError as exc:
-            raise KeyError(f"No command dispatch target registered for {target_id!r}.") from exc
+            if target_id is not None or len(self.handlers) != 1:
+                raise KeyError(f"No command dispatch target registered for {target_id!r}.") from exc
+            # A worker that connected by address alone reaches the only target.
+            (handler,) = self.handlers.values()
         return handler.invoke(method, args, kwargs)
 
     def start(self) -> None:
         if self._thread is not None:
             return
         self.closed.clear()
-        thread = threading.Thread(target=self._run, name="mqdm-command-dispatch", daemon=True)
+        run = {
+            "pipe": self._run_pipes, "socket": self._run_pipes, "lanes": self._run_lanes, "ring": self._run_rings,
+        }.get(self.channel, self._run)
+        thread = threading.Thread(target=run, name="mqdm-command-dispatch", daemon=True)
         thread.start()
         self._thread = thread
+        if self._listener is not None:
+            threading.Thread(target=self._accept, name="mqdm-command-accept", daemon=True).start()
+
+    def _accept(self) -> None:
+        # Accept socket workers off the dispatch thread (the auth handshake
+        # waits on the client), then wake the dispatch to include them.
+        from multiprocessing import AuthenticationError
+
+        listener = self._listener
+        while not self._stop_event.is_set():
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, ConnectionError, EOFError):
+                continue  # a client failed the handshake; keep serving the others
+            except OSError:
+                return  # listener closed
+            if self._stop_event.is_set():
+                conn.close()
+                return
+            self._pipes.append(conn)
+            self.queue.put(("accepted",))
 
     def _run(self) -> None:
+        # Block until a command (or the ``None`` sentinel from stop()) arrives:
+        # no timeout, so an idle dispatch does no periodic work. Then take
+        # whatever else is already queued and replay it as one batch.
+        get = self.queue.get
+        reader = getattr(self.queue, "_reader", None)
+        ready = _ready_probe(reader) if reader is not None else None
         while not self._stop_event.is_set():
             try:
-                item = self.queue.get(timeout=0.1)
-            except Empty:
-                continue
+                item = get()
+            except (EOFError, OSError, ValueError):
+                break  # queue closed under us
             if item is None:
                 break
-            kind = item[0]
-            if kind == "send":
-                _, target_id, method, args, kwargs = item
+            batch = [item]
+            stopping = False
+            while len(batch) < self.max_batch:
                 try:
-                    self._dispatch(target_id, method, args, kwargs)
+                    if ready is None:
+                        item = get(False)
+                    elif ready():
+                        item = get()
+                    else:
+                        break
+                except Empty:
+                    break
+                except (EOFError, OSError, ValueError):
+                    stopping = True
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._handle_batch(batch)
+            if stopping:
+                break
+
+    def _run_pipes(self) -> None:
+        # Wait on the shared queue (handshakes and the stop sentinel) and every
+        # worker pipe at once, then drain each ready pipe as one batch.
+        from multiprocessing.connection import wait
+
+        reader = self.queue._reader
+        pipes = self._pipes
+        probes: dict[Any, Any] = {}
+        while not self._stop_event.is_set():
+            try:
+                ready = wait([reader, *pipes])
+            except (OSError, ValueError):
+                break
+            for conn in ready:
+                if conn is reader:
+                    try:
+                        item = self.queue.get()
+                    except (EOFError, OSError, ValueError):
+                        return
+                    if item is None:
+                        return
+                    self._handle_batch([item])
+                    continue
+                probe = probes.get(conn)
+                if probe is None:
+                    probe = probes[conn] = _ready_probe(conn)
+                batch = []
+                try:
+                    batch.append(conn.recv())  # wait() said it's readable
+                    while len(batch) < self.max_batch and probe():
+                        batch.append(conn.recv())
+                except (EOFError, OSError):
+                    # Worker thread or process gone.
+                    pipes.remove(conn)
+                    probes.pop(conn, None)
+                    conn.close()
+                self._handle_batch(batch, conn)
+
+    def _run_lanes(self) -> None:
+        # Wait on both lanes; then service what's buffered on the control lane
+        # (requests, output, task lifecycle) before one batch of progress.
+        from multiprocessing.connection import wait
+
+        control, progress = self.queue, self.progress_queue
+        readers = [control._reader, progress._reader]
+        control_ready, progress_ready = _ready_probe(readers[0]), _ready_probe(readers[1])
+        while not self._stop_event.is_set():
+            try:
+                wait(readers)
+                handled = 0
+                while handled < self.max_batch and control_ready():
+                    item = control.get()
+                    if item is None:
+                        return
+                    self._handle_control(item)
+                    handled += 1
+                batch: list[Any] = []
+                while len(batch) < self.max_batch and progress_ready():
+                    self._accept_progress(progress.get(), batch)
+            except (EOFError, OSError, ValueError):
+                break  # queue closed under us
+            if batch:
+                self._handle_batch(batch)
+
+    def _run_rings(self) -> None:
+        # Wake for queue messages (ring handshakes, requests, the stop
+        # sentinel) or every poll_interval, and drain the rings either way.
+        # Everything a worker sends before a request is in its ring by the
+        # time the request is queued, so draining first keeps them in order.
+        get = self.queue.get
+        ready = _ready_probe(self.queue._reader)
+        while not self._stop_event.is_set():
+            batch = []
+            try:
+                batch.append(get(timeout=self.poll_interval))
+                while len(batch) < self.max_batch and ready():
+                    batch.append(get())
+            except Empty:
+                pass
+            except (EOFError, OSError, ValueError):
+                break
+            for item in batch:
+                if item is None:
+                    self._drain_rings()
+                    return
+                if item[0] == "open_ring":
+                    self._rings.append(item[1])
+                    continue
+                self._drain_rings()
+                self._handle_batch([item])
+            self._drain_rings()
+
+    def _drain_rings(self) -> None:
+        import pickle
+
+        batch = []
+        for ring in self._rings:
+            for data in ring.read():
+                # Packed wire commands start with a flags byte; pickles with
+                # the PROTO opcode (0x80).
+                batch.append(pickle.loads(data) if data[0] == 0x80 else data)
+        if batch:
+            self._handle_batch(batch)
+
+    def _handle_control(self, item: tuple[Any, int, Any]) -> None:
+        sender, progress_mark, message = item
+        if self._progress_applied.get(sender, 0) < progress_mark:
+            self._await_progress(sender, progress_mark)
+        self._handle_batch([message])
+        self._control_seen[sender] = self._control_seen.get(sender, 0) + 1
+        deferred = self._deferred.get(sender)
+        if deferred:
+            self._release_deferred(sender, deferred)
+
+    def _await_progress(self, sender: Any, progress_mark: int) -> None:
+        """Apply progress-lane messages until ``sender``'s first ``progress_mark`` are in."""
+        deadline = time.monotonic() + _LANE_BARRIER_TIMEOUT
+        batch: list[Any] = []
+        while self._progress_applied.get(sender, 0) < progress_mark:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self.progress_queue.get(timeout=remaining)
+            except Empty:
+                break
+            self._accept_progress(item, batch)
+        if batch:
+            self._handle_batch(batch)
+
+    def _accept_progress(self, item: tuple[Any, int, int, Any], batch: list[Any]) -> None:
+        sender, seq, control_mark, message = item
+        deferred = self._deferred.get(sender)
+        if deferred is not None or self._control_seen.get(sender, 0) < control_mark:
+            # Sent after a control message (e.g. insert_task) that hasn't been
+            # handled yet: hold it until that message is.
+            self._deferred.setdefault(sender, []).append(item)
+            return
+        batch.append(message)
+        self._progress_applied[sender] = seq
+
+    def _release_deferred(self, sender: Any, deferred: list[Any]) -> None:
+        seen = self._control_seen[sender]
+        batch = []
+        while deferred and deferred[0][2] <= seen:
+            _, seq, _, message = deferred.pop(0)
+            batch.append(message)
+            self._progress_applied[sender] = seq
+        if not deferred:
+            del self._deferred[sender]
+        if batch:
+            self._handle_batch(batch)
+
+    def _handle_batch(self, items: list[Any], conn: Any = None) -> None:
+        """Replay drained messages, merging runs of task updates.
+
+        Consecutive update sends for a target that has ``apply_updates`` are
+        folded per task with :func:`merge_task_update` and applied in one call
+        (one backend lock acquisition), so owner work scales with the number of
+        tasks rather than the number of messages. Any other message flushes
+        the merged updates first, keeping their order relative to output, task
+        lifecycle and requests.
+        """
+        if self.stats:
+            self._sample_depth(len(items))
+        pending: dict[Any, dict[Any, dict[str, Any]]] = {}
+        for item in items:
+            if item.__class__ is bytes:
+                try:
+                    item = wire.decode(item)
                 except Exception:
-                    # A fire-and-forget send that fails (e.g. a late update for
-                    # an already-unregistered target, or the target method
-                    # raising) must not kill the dispatch thread — that would
-                    # silently drop every later command and hang any worker
-                    # waiting on a request. Best-effort: drop it and continue.
-                    pass
-                continue
-            if kind == "open_reply":
-                _, reply_id, reply = item
-                self._reply_ends[reply_id] = reply
-                continue
-            if kind == "request":
-                _, target_id, method, args, kwargs, reply_id = item
+                    continue  # malformed frame: drop it like a failed send
+            if item[0] == "send" and item[2] in _UPDATE_METHODS:
+                handler = self.handlers.get(item[1])
+                if handler is not None and handler.coalesce:
+                    merged = pending.get(item[1])
+                    if merged is None:
+                        merged = pending[item[1]] = {}
+                    if _merge_update_command(merged, item[2], item[3], item[4]):
+                        continue
+            if pending:
+                self._apply_merged(pending)
+                pending = {}
+            self._handle(item, conn)
+        if pending:
+            self._apply_merged(pending)
+
+    def _apply_merged(self, pending: dict[Any, dict[Any, dict[str, Any]]]) -> None:
+        for target_id, merged in pending.items():
+            if merged:
                 try:
-                    payload = (True, self._dispatch(target_id, method, args, kwargs))
-                except BaseException as exc:
-                    payload = (False, exc)
-                reply = self._reply_ends.get(reply_id)
-                if reply is not None:
-                    try:
-                        reply.send(payload)
-                    except (BrokenPipeError, EOFError, OSError):
-                        # Worker gone — drop its now-dead persistent reply end.
-                        end = self._reply_ends.pop(reply_id, None)
-                        if end is not None:
-                            end.close()
-                continue
+                    self._dispatch(target_id, "apply_updates", (list(merged.items()),), {})
+                except Exception:
+                    pass  # same best-effort policy as any failed send
+
+    def _handle(self, item: tuple[Any, ...], conn: Any = None) -> None:
+        """Replay one message; requests reply on ``conn`` when it came from a worker pipe."""
+        kind = item[0]
+        if kind == "send":
+            _, target_id, method, args, kwargs = item
+            try:
+                self._dispatch(target_id, method, args, kwargs)
+            except Exception:
+                # A fire-and-forget send that fails (e.g. a late update for
+                # an already-unregistered target, or the target method
+                # raising) must not kill the dispatch thread — that would
+                # silently drop every later command and hang any worker
+                # waiting on a request. Best-effort: drop it and continue.
+                pass
+            return
+        if kind == "open_reply":
+            _, reply_id, reply = item
+            self._reply_ends[reply_id] = reply
+            return
+        if kind == "open_pipe":
+            self._pipes.append(item[1])
+            return
+        if kind == "stats":
+            self._worker_stats[item[1]] = item[2]
+            return
+        if kind == "accepted":
+            return  # only wakes _run_pipes to wait on the new connection
+        if kind == "request":
+            _, target_id, method, args, kwargs, reply_id = item
+            try:
+                payload = (True, self._dispatch(target_id, method, args, kwargs))
+            except BaseException as exc:
+                payload = (False, exc)
+            reply = conn if conn is not None else self._reply_ends.get(reply_id)
+            if reply is not None:
+                try:
+                    reply.send(payload)
+                except (BrokenPipeError, EOFError, OSError):
+                    # Worker gone — drop its now-dead persistent reply end (a
+                    # dead pipe is dropped by the next read from it).
+                    end = self._reply_ends.pop(reply_id, None)
+                    if end is not None:
+                        end.close()
+            return
 
     def stop(self) -> None:
         if self._thread is None:
             return
         self.closed.set()
         self._stop_event.set()
-        self.queue.put(None)
+        try:
+            self.queue.put(None, timeout=1.0)
+        except Full:
+            pass  # bounded and full: the drain thread still sees the stop event
         self._thread.join(timeout=1.0)
         self._thread = None
-        # Safe to close reply ends now that the drain thread has stopped.
-        for end in self._reply_ends.values():
+        if self._listener is not None:
+            self._close_listener()
+        # Safe to close reply ends now that the drain thread has stopped. Tell any
+        # worker still waiting on a reply that the transport is gone first, so it
+        # fails right away instead of at its next safety poll.
+        closed = (False, CommandTransportClosed("Command transport is closed."))
+        for end in [*self._reply_ends.values(), *self._pipes]:
+            try:
+                end.send(closed)
+            except Exception:
+                pass
             try:
                 end.close()
             except Exception:
                 pass
         self._reply_ends.clear()
+        self._pipes.clear()
+        for ring in self._rings:
+            ring.close()
+        self._rings.clear()
+
+    def _close_listener(self) -> None:
+        from multiprocessing.connection import Client
+
+        # accept() doesn't return when its socket is closed under it; connect
+        # once so the accept thread sees the stop event and exits.
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except Exception:
+            pass
+        try:
+            self._listener.close()
+        except Exception:
+            pass
+
+
+# Task update keys where ``None`` means "leave unchanged" (mirrors Rich's
+# ``Progress.update`` signature) rather than a value to store.
+_NONE_MEANS_UNCHANGED = frozenset({'total', 'completed', 'advance', 'description', 'visible'})
+
+
+def merge_task_update(pending: dict[str, Any], update: dict[str, Any]) -> dict[str, Any]:
+    """Fold ``update`` into ``pending`` so applying it once equals applying both.
+
+    Advances are summed (or added onto a pending absolute ``completed``), an
+    absolute ``completed`` discards earlier advances, and every other field is
+    last-wins.
+    """
+    for key, value in update.items():
+        if value is None and key in _NONE_MEANS_UNCHANGED:
+            continue
+        if key == 'advance':
+            if 'completed' in pending:
+                pending['completed'] += value
+            else:
+                pending['advance'] = pending.get('advance', 0) + value
+        elif key == 'completed':
+            pending.pop('advance', None)
+            pending['completed'] = value
+        elif key == 'refresh':
+            pending['refresh'] = pending.get('refresh', False) or value
+        else:
+            pending[key] = value
+    return pending
+
+
+def _ready_probe(conn: Any) -> Any:
+    """Return a cheap "more data buffered?" check for a connection.
+
+    ``Connection.poll`` builds a selector on every call, which costs more than
+    reading a small message; a ``select.poll`` object registered once is a
+    single syscall.
+    """
+    import select
+
+    try:
+        poller = select.poll()
+        poller.register(conn.fileno(), select.POLLIN)
+    except (AttributeError, OSError, ValueError):  # e.g. no poll() on Windows
+        return conn.poll
+    return lambda: bool(poller.poll(0))
+
+
+def _merge_update_command(merged: dict[Any, dict[str, Any]], method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> bool:
+    """Fold an update command into ``merged`` (task id -> update); False if malformed."""
+    if method == "apply_updates":
+        if len(args) != 1 or kwargs:
+            return False
+        for task_id, update in args[0]:
+            merge_task_update(merged.setdefault(task_id, {}), update)
+        return True
+    if len(args) != 1:
+        return False
+    merge_task_update(merged.setdefault(args[0], {}), kwargs)
+    return True
+
+
+def _ship_stats_quietly(transport: QueueTransport[Any]) -> None:
+    """Exit-time stats report for worker processes; the owner may already be gone."""
+    try:
+        if not transport.closed.is_set():
+            transport._ship_stats()
+    except Exception:
+        pass
+
+
+class UpdateBuffer:
+    """Coalesce fire-and-forget task updates and ship them as one batch per frame.
+
+    Updates are merged per task id with :func:`merge_task_update` and handed to
+    ``flush_fn`` as a list of ``(task_id, update)`` pairs. A daemon thread flushes
+    pending updates ``interval`` seconds after the first one arrives, and sleeps
+    while the buffer is empty, so an idle buffer does no periodic work.
+    """
+
+    def __init__(self, flush_fn: Any, interval: float) -> None:
+        self.flush_fn = flush_fn
+        self.interval = interval
+        self._pending: dict[Any, dict[str, Any]] = {}
+        self._cond = threading.Condition(threading.Lock())
+        self._flush_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def add(self, task_id: Any, update: dict[str, Any]) -> None:
+        with self._cond:
+            pending = self._pending.get(task_id)
+            if pending is None:
+                pending = self._pending[task_id] = {}
+                self._cond.notify()
+            merge_task_update(pending, update)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="mqdm-update-buffer", daemon=True)
+                self._thread.start()
+
+    def flush(self) -> None:
+        # The flush lock keeps batches in order when a caller flushes while
+        # the timer thread is mid-send.
+        with self._flush_lock:
+            with self._cond:
+                batch, self._pending = self._pending, {}
+            if batch:
+                self.flush_fn(list(batch.items()))
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+            time.sleep(self.interval)
+            try:
+                self.flush()
+            except Exception:
+                # Owner gone or transport closed: nothing left to deliver to.
+                with self._cond:
+                    self._pending.clear()
 
 
 def proxymethod(func=None, *, expect_reply: bool = True, owner_only: bool = False, worker_only: bool = False):
@@ -332,17 +1329,29 @@ class TransportProxy(CommandProxyMixin[TRef], Generic[TRef]):
     def from_target(cls: type[TTransportProxy], target: TRef, *, command_dispatch=None) -> TTransportProxy:
         if command_dispatch is not None:
             target_id = command_dispatch.register(target)
-            return cls(QueueTransport(
-                command_dispatch.queue,
-                target=target,
-                target_id=target_id,
-                closed=command_dispatch.closed,
-            ))
+            return cls(command_dispatch.create_transport(target, target_id))
         # No dispatch: owner-local only. Use a direct transport rather than an
         # orphan queue that no dispatch drains (which would silently drop commands
         # if the proxy were ever sent to a worker).
         return cls(LocalTransport(CommandHandler(target)))
 
+    @classmethod
+    def connect(
+        cls: type[TTransportProxy],
+        address: Any,
+        *,
+        authkey: bytes | None = None,
+        target_id: Any = None,
+    ) -> TTransportProxy:
+        """Reach an owner's ``"socket"`` command dispatch from any process.
+
+        ``address`` and ``authkey`` are the dispatch's (see ``Runtime.listen``);
+        ``authkey`` defaults to this process's ``multiprocessing`` key, which
+        only matches in processes the owner started. ``target_id`` may be left
+        out while the owner serves a single display.
+        """
+        return cls(SocketTransport(address=address, authkey=authkey, target_id=target_id))
+
     @property
     def target(self) -> TRef | None:
         return self._transport.target
@@ -373,6 +1382,8 @@ class TransportProxy(CommandProxyMixin[TRef], Generic[TRef]):
                 f"{type(self).__name__} cannot create a command dispatch from "
                 f"{type(transport).__name__}."
             )
+        if isinstance(transport, SocketTransport):
+            raise TypeError(f"{type(self).__name__} cannot create a second dispatch for a socket listener.")
         target = transport.target
         if target is None:
             raise RuntimeError(
@@ -383,4 +1394,10 @@ class TransportProxy(CommandProxyMixin[TRef], Generic[TRef]):
             CommandHandler(target),
             target_id=transport.target_id,
             closed=transport.closed,
+            channel=transport.channel,
+            progress_queue=getattr(transport, "progress_queue", None),
+            overflow=transport.overflow or "merge",
+            overflow_counts=transport.overflow_counts,
+            stats=transport.stats_interval is not None,
+            stats_interval=transport.stats_interval or 5.0,
         )
@@ -0,0 +1,113 @@
+"""Shared-memory byte ring for a worker's fire-and-forget commands.
+
+One producer (a worker process) appends length-prefixed records and one
+consumer (the owner's dispatch) reads them back, without a syscall, lock or
+wakeup on either side: the two only share a pair of monotonically increasing
+byte counters at the start of the block — ``head`` (bytes written, advanced by
+the producer after the record is in place) and ``tail`` (bytes read, advanced by
+the consumer). The owner polls its rings on a timer instead of being woken.
+
+The worker creates the block and the owner attaches by name (pickling sends
+only the name); the owner unlinks it once it has drained the ring for good, so
+only the owner tracks it for cleanup.
+"""
+from __future__ import annotations
+
+import struct
+import sys
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+
+from .counters import _open_shared_memory
+
+_HEADER = 16  # head, tail: two uint64 counters
+_LEN = struct.Struct('<I')
+
+
+class CommandRing:
+    """Single-producer, single-consumer ring of byte records in shared memory."""
+
+    def __init__(self, capacity: int = 1 << 20, *, name: str | None = None) -> None:
+        create = name is None
+        self.capacity = capacity
+        self._shm = _create_shared_memory(_HEADER + capacity) if create else _open_shared_memory(name, False, 0)
+        buf = self._shm.buf
+        self._counters = buf[:_HEADER].cast('Q')
+        self._data = buf[_HEADER:_HEADER + capacity]
+        # The attaching owner unlinks; the creating worker may exit first.
+        self._finalizer = weakref.finalize(self, _close_ring, self._shm, self._counters, self._data, not create)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def __reduce__(self):
+        return (_attach_ring, (self.capacity, self.name))
+
+    def close(self) -> None:
+        self._finalizer()
+
+    def empty(self) -> bool:
+        return self._counters[0] == self._counters[1]
+
+    # -------------------------------- Producer -------------------------------- #
+
+    def write(self, data: bytes) -> bool:
+        """Append one record; ``False`` if it doesn't fit right now."""
+        record = _LEN.pack(len(data)) + data
+        size = len(record)
+        head = self._counters[0]
+        if self.capacity - (head - self._counters[1]) < size:
+            return False
+        pos = head % self.capacity
+        first = min(size, self.capacity - pos)
+        self._data[pos:pos + first] = record[:first]
+        if first < size:
+            self._data[:size - first] = record[first:]
+        self._counters[0] = head + size  # publish only once the bytes are in place
+        return True
+
+    # -------------------------------- Consumer -------------------------------- #
+
+    def read(self) -> list[bytes]:
+        """Take every complete record written so far."""
+        head = self._counters[0]
+        tail = self._counters[1]
+        records = []
+        while tail < head:
+            (n,) = _LEN.unpack(self._take(tail, _LEN.size))
+            records.append(self._take(tail + _LEN.size, n))
+            tail += _LEN.size + n
+        self._counters[1] = tail
+        return records
+
+    def _take(self, offset: int, n: int) -> bytes:
+        pos = offset % self.capacity
+        end = pos + n
+        if end <= self.capacity:
+            return bytes(self._data[pos:end])
+        return bytes(self._data[pos:]) + bytes(self._data[:end - self.capacity])
+
+
+def _create_shared_memory(size: int) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(create=True, size=size, track=False)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    # The worker may exit (and its tracker clean up) while the owner still reads.
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _attach_ring(capacity: int, name: str) -> CommandRing:
+    return CommandRing(capacity, name=name)
+
+
+def _close_ring(shm: shared_memory.SharedMemory, counters: memoryview, data: memoryview, unlink: bool) -> None:
+    counters.release()
+    data.release()
+    try:
+        shm.close()
+        if unlink:
+            shm.unlink()
+    except (FileNotFoundError, OSError):
+        pass
@@ -0,0 +1,194 @@
+"""Pass large buffers to and from process-pool workers through shared memory.
+
+``mqdm.shared(x)`` wraps a NumPy array or any bytes-like object. Pickled, as
+a process pool does with task arguments and results, it becomes the name of a
+``multiprocessing.shared_memory`` block. Unpickled, it is a view of that
+block: an ndarray for arrays, a writable ``memoryview`` of bytes otherwise.
+The data is copied into the block once instead of going through the pool's
+pipes.
+
+Who removes the block:
+
+- Wrapped in the main process (task arguments): the block is created the first
+  time the wrapper is pickled, reused by every task it is passed to, and
+  unlinked when the wrapper is garbage collected.
+- Wrapped in a worker (task results): the block is handed to the process that
+  unpickles it, which unlinks it as soon as it has attached.
+
+Unlinking only removes the name; views keep their mapping until the last of
+them is gone. NumPy is only needed to share arrays and is never imported here.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any
+
+from . import is_main_process
+
+
+class SharedBuffer:
+    """A buffer that pickles as a handle to shared memory; see :func:`shared`."""
+
+    def __init__(self, value: Any) -> None:
+        if _is_ndarray(value):
+            if value.dtype.hasobject:
+                raise TypeError("mqdm.shared() can't share arrays of Python objects.")
+            self.meta: tuple | None = (value.dtype, value.shape)
+            self.nbytes = value.nbytes
+        else:
+            try:
+                view = memoryview(value)
+            except TypeError:
+                raise TypeError(f"mqdm.shared() needs a NumPy array or a bytes-like object, not {type(value).__name__}.") from None
+            self.meta = None
+            self.nbytes = view.nbytes
+        self.value = value
+        # Worker-made buffers (results) go to whoever unpickles them first.
+        self.handoff = not is_main_process()
+        self._shm: shared_memory.SharedMemory | None = None
+        self._tracker: int | None = None
+        self._lock = threading.Lock()  # executors may pickle from several threads
+        self._finalizer: weakref.finalize | None = None
+
+    def __reduce__(self):
+        name = self._block_name()
+        return (_attach_buffer, (name, self.meta, self.nbytes, self.handoff, self._tracker))
+
+    def __repr__(self) -> str:
+        return f"shared({type(self.value).__name__}, {self.nbytes} bytes)"
+
+    def _block_name(self) -> str:
+        with self._lock:
+            if self._shm is None:
+                shm = _create_shared_memory(max(self.nbytes, 1), track=not self.handoff)
+                try:
+                    _copy_into(shm.buf, self.value, self.meta)
+                finally:
+                    shm.close()
+                self._shm = shm
+                if not self.handoff:
+                    self._tracker = _tracker_pid()
+                    self._finalizer = weakref.finalize(self, _unlink, shm)
+            return self._shm.name
+
+    def close(self) -> None:
+        """Unlink the block now instead of when the wrapper is collected."""
+        if self._finalizer is not None:
+            self._finalizer()
+
+
+def shared(value: Any) -> SharedBuffer:
+    """Send ``value`` to (or back from) process-pool workers through shared memory.
+
+    ``value`` is a NumPy array or a bytes-like object (``bytes``,
+    ``bytearray``, ``memoryview``, ...). Use it for a task argument, on its own
+    or inside :class:`mqdm.args`, or for a task's return value. The task
+    receives an ndarray, or a writable ``memoryview`` for bytes-like values,
+    backed by shared memory, and :func:`mqdm.pool` returns results the same
+    way. One wrapped argument can be passed to many tasks and is copied only
+    once. Thread and sequential pools skip all of this: tasks and results get
+    the original object.
+
+    Example:
+        ```python
+        image = mqdm.shared(np.zeros((4096, 4096)))
+        mqdm.pool(process_tile, [mqdm.args(image, tile=i) for i in range(64)])
+
+        def render(i):
+            return mqdm.shared(make_frame(i))  # comes back as an ndarray
+        ```
+    """
+    return value if isinstance(value, SharedBuffer) else SharedBuffer(value)
+
+
+def unwrap(value: Any) -> Any:
+    """The wrapped object, for pools that don't pickle; anything else unchanged."""
+    return value.value if isinstance(value, SharedBuffer) else value
+
+
+class _SharedMemory(shared_memory.SharedMemory):
+    """SharedMemory whose close() leaves the mapping to the views still using it."""
+
+    def close(self) -> None:
+        try:
+            super().close()
+        except BufferError:
+            # An ndarray/memoryview still exports the mapping; it is unmapped
+            # when the last one is released. The descriptor isn't needed for that.
+            fd = getattr(self, '_fd', -1)
+            if fd >= 0:
+                os.close(fd)
+                self._fd = -1
+
+
+def _is_ndarray(value: Any) -> bool:
+    np = sys.modules.get('numpy')  # an ndarray means numpy is already imported
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def _copy_into(buf: memoryview, value: Any, meta: tuple | None) -> None:
+    if meta is None:
+        view = memoryview(value).cast('B')
+        buf[:view.nbytes] = view
+    else:
+        import numpy as np
+
+        dtype, shape = meta
+        np.ndarray(shape, dtype, buffer=buf)[...] = value
+
+
+# Tracking: whichever process unlinks a block keeps it registered with its
+# resource tracker (which would otherwise unlink it when the process exits), and
+# nobody else does. Before 3.13 attaching always registers, so a worker with a
+# tracker of its own takes its registration back. Workers that share the owner's
+# tracker (forked after it started, or handed its fd under spawn/forkserver)
+# must not: their unregister would drop the owner's registration.
+
+
+def _tracker_pid() -> int | None:
+    """Pid of the tracker this process started, or inherited by fork; None if handed only its fd."""
+    return getattr(resource_tracker._resource_tracker, '_pid', None)
+
+
+def _has_own_tracker(owner_tracker: int | None) -> bool:
+    pid = _tracker_pid()
+    return pid is not None and pid != owner_tracker
+
+
+def _create_shared_memory(size: int, track: bool) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(create=True, size=size, track=track)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    if not track:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _attach_buffer(name: str, meta: tuple | None, nbytes: int, handoff: bool, tracker: int | None) -> Any:
+    if sys.version_info >= (3, 13):
+        shm = _SharedMemory(name=name, track=handoff)
+    else:
+        shm = _SharedMemory(name=name)
+        if not handoff and _has_own_tracker(tracker):
+            resource_tracker.unregister(shm._name, "shared_memory")
+    if meta is None:
+        view = shm.buf[:nbytes]
+    else:
+        import numpy as np
+
+        dtype, shape = meta
+        view = np.ndarray(shape, dtype, buffer=shm.buf)
+    if handoff:
+        shm.unlink()
+    return view
+
+
+def _unlink(shm: shared_memory.SharedMemory) -> None:
+    try:
+        shm.unlink()
+    except (FileNotFoundError, OSError):
+        pass
@@ -0,0 +1,108 @@
+"""Optional instrumentation for the process-mode command transport.
+
+With ``transport_options={'stats': True}`` every worker transport keeps a
+:class:`TransportStats` — messages and serialized bytes per method, plus a
+histogram of request round-trip latency — and ships a cumulative snapshot to
+the owner's dispatch every few seconds (and once more when the worker exits).
+The dispatch adds what only it can see, the depth of its queue, and merges it
+all with :func:`merge_snapshots` into the dict ``Runtime.transport_stats()``
+returns.
+
+Byte counts are the size of what goes on the wire: the packed form for compact
+messages, otherwise the pickled tuple — which the transport pickles one extra
+time to measure, so leave stats off when you aren't looking at them.
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Any
+
+# Upper bounds (seconds) of the request latency buckets; the last bucket is
+# everything slower.
+LATENCY_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 1.0, float('inf'),
+)
+
+
+class TransportStats:
+    """Message counts, bytes and request latency recorded by one worker transport."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # method -> [messages, bytes]
+        self.methods: dict[str, list[int]] = {}
+        self.latency = [0] * len(LATENCY_BUCKETS)
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def record(self, method: str, message: Any) -> None:
+        """Count one message as sent, measuring its serialized size."""
+        if message.__class__ is bytes:
+            size = len(message)
+        else:
+            from multiprocessing.reduction import ForkingPickler
+
+            size = len(ForkingPickler.dumps(message))
+        with self._lock:
+            counts = self.methods.get(method)
+            if counts is None:
+                counts = self.methods[method] = [0, 0]
+            counts[0] += 1
+            counts[1] += size
+
+    def record_latency(self, seconds: float) -> None:
+        """Count one request round trip."""
+        with self._lock:
+            self.latency[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            self.latency_total += seconds
+            self.latency_max = max(self.latency_max, seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the totals so far as a plain (picklable) dict."""
+        with self._lock:
+            return {
+                "methods": {name: {"messages": n, "bytes": b} for name, (n, b) in self.methods.items()},
+                "requests": {
+                    "count": sum(self.latency),
+                    "total_s": self.latency_total,
+                    "max_s": self.latency_max,
+                    "histogram": list(self.latency),
+                },
+            }
+
+
+def merge_snapshots(snapshots: list[dict[str, Any]]) -> dict[str, Any]:
+    """Sum :meth:`TransportStats.snapshot` dicts into one summary.
+
+    The result has ``methods`` (per-method ``messages``/``bytes``), the overall
+    ``messages`` and ``bytes``, and ``requests`` with ``count``, ``mean_s``,
+    ``max_s`` and a ``histogram`` mapping each bucket's upper bound in seconds
+    to its count.
+    """
+    methods: dict[str, dict[str, int]] = {}
+    histogram = [0] * len(LATENCY_BUCKETS)
+    total_s = max_s = 0.0
+    for snap in snapshots:
+        for name, counts in snap["methods"].items():
+            merged = methods.setdefault(name, {"messages": 0, "bytes": 0})
+            merged["messages"] += counts["messages"]
+            merged["bytes"] += counts["bytes"]
+        requests = snap["requests"]
+        for i, n in enumerate(requests["histogram"]):
+            histogram[i] += n
+        total_s += requests["total_s"]
+        max_s = max(max_s, requests["max_s"])
+    count = sum(histogram)
+    return {
+        "methods": methods,
+        "messages": sum(m["messages"] for m in methods.values()),
+        "bytes": sum(m["bytes"] for m in methods.values()),
+        "requests": {
+            "count": count,
+            "mean_s": total_s / count if count else 0.0,
+            "max_s": max_s,
+            "histogram": dict(zip(LATENCY_BUCKETS, histogram)),
+        },
+    }
@@ -0,0 +1,222 @@
+"""Compact binary encoding for hot proxy commands.
+
+Queue transports normally pickle ``("send", target_id, method, args, kwargs)``
+tuples. For the commands a worker sends over and over — batched updates, output,
+task creation and teardown — this module packs the same information with
+``struct``: one opcode byte for the method, interned ids for the common task
+fields, and tagged scalar values. Anything it can't represent (custom fields,
+arbitrary objects, non-integer target ids) makes :func:`encode` return ``None``
+and the caller sends the plain tuple, which gets pickled as before.
+
+:func:`decode` turns the bytes back into the exact tuple the dispatch already
+understands, so the two forms can be mixed freely on one queue.
+
+Pure-Python packing is not faster than C pickling per se; it pays off where a
+fixed layout avoids per-value work, above all for update batches that only
+advance counters (see ``benchmark_ipc.py --bench wire-advances ...``).
+"""
+from __future__ import annotations
+
+import struct
+from typing import Any
+
+# Methods with an opcode (i.e. that :func:`encode` can pack). Order is the
+# wire format: append, never reorder.
+METHODS = (
+    'apply_updates', 'try_update', 'write', 'insert_task', 'add_task',
+    'pop_task', 'dump_task', 'claim_counter', 'reserve_task_ids',
+    'start', 'stop', 'refresh',
+)
+_OPCODES = {name: i for i, name in enumerate(METHODS)}
+
+# Keyword names with a field id. Order is the wire format: append, never reorder.
+_FIELDS = (
+    'advance', 'completed', 'total', 'description', 'visible', 'refresh',
+    'start', 'transient', 'bytes', 'remove', 'markup', 'highlight', 'end', 'sep',
+)
+_FIELD_IDS = {name: i for i, name in enumerate(_FIELDS)}
+
+# flags, opcode, target id
+_HEAD = struct.Struct('<BBq')
+_REQUEST = 1
+_REPLY_ID = 4  # a request that names its reply channel (pipe requests reply on their own pipe)
+# apply_updates where every update is a plain integer ``advance`` — the shape
+# nearly all worker batches have — packed as one run of (task id, advance) pairs.
+_ADVANCES = 2
+_ADVANCES_HEAD = struct.Struct('<BBqI')
+_advance_structs: dict[int, struct.Struct] = {}
+# reply id: (pid, thread ident, transport id)
+_REPLY = struct.Struct('<qQQ')
+_INT = struct.Struct('<q')
+_FLOAT = struct.Struct('<d')
+_LEN = struct.Struct('<I')
+# tag byte + payload in one pack call
+_TAGGED_INT = struct.Struct('<Bq')
+_TAGGED_FLOAT = struct.Struct('<Bd')
+_TAGGED_LEN = struct.Struct('<BI')
+
+# value tags
+_NONE, _FALSE, _TRUE, _INT_TAG, _FLOAT_TAG, _STR, _UPDATES = range(7)
+
+
+class _Unencodable(Exception):
+    pass
+
+
+def encode(
+    kind: str,
+    target_id: Any,
+    method: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    reply_id: tuple[int, int, int] | None = None,
+) -> bytes | None:
+    """Pack a command, or return ``None`` if it needs the pickled tuple form."""
+    op = _OPCODES.get(method)
+    if op is None or type(target_id) is not int or len(args) > 255 or len(kwargs) > 255:
+        return None
+    try:
+        if op == 0 and kind == 'send' and len(args) == 1 and not kwargs:
+            data = _encode_advances(target_id, args[0])
+            if data is not None:
+                return data
+        flags = 0
+        if kind == 'request':
+            flags = _REQUEST if reply_id is None else _REQUEST | _REPLY_ID
+        out = bytearray(_HEAD.pack(flags, op, target_id))
+        if reply_id is not None:
+            out += _REPLY.pack(*reply_id)
+        out.append(len(args))
+        for value in args:
+            _put(out, value)
+        _put_fields(out, kwargs)
+    except (_Unencodable, KeyError, struct.error, TypeError, OverflowError):
+        return None
+    return bytes(out)
+
+
+def decode(data: bytes) -> tuple[Any, ...]:
+    """Unpack :func:`encode` output into the dispatch's tuple form."""
+    flags, op, target_id = _HEAD.unpack_from(data, 0)
+    if flags & _ADVANCES:
+        return ("send", target_id, METHODS[op], (_decode_advances(data),), {})
+    pos = _HEAD.size
+    reply_id = None
+    if flags & _REPLY_ID:
+        reply_id = _REPLY.unpack_from(data, pos)
+        pos += _REPLY.size
+    n_args = data[pos]
+    pos += 1
+    args = []
+    for _ in range(n_args):
+        value, pos = _get(data, pos)
+        args.append(value)
+    kwargs, pos = _get_fields(data, pos)
+    if not flags & _REQUEST:
+        return ("send", target_id, METHODS[op], tuple(args), kwargs)
+    return ("request", target_id, METHODS[op], tuple(args), kwargs, reply_id)
+
+
+def _advances_struct(n: int) -> struct.Struct:
+    packer = _advance_structs.get(n)
+    if packer is None:
+        packer = struct.Struct(f'<BBqI{2 * n}q')
+        if n <= 256:  # keep the cache small; huge batches are rare
+            _advance_structs[n] = packer
+    return packer
+
+
+def _encode_advances(target_id: int, updates: Any) -> bytes | None:
+    if type(updates) is not list:
+        return None
+    flat = []
+    for task_id, fields in updates:
+        if len(fields) != 1:
+            return None
+        advance = fields.get('advance')
+        if type(advance) is not int:
+            return None
+        flat.append(task_id)
+        flat.append(advance)
+    return _advances_struct(len(updates)).pack(_ADVANCES, 0, target_id, len(updates), *flat)
+
+
+def _decode_advances(data: bytes) -> list[tuple[int, dict[str, Any]]]:
+    n = _ADVANCES_HEAD.unpack_from(data, 0)[3]
+    values = iter(_advances_struct(n).unpack(data)[4:])
+    return [(task_id, {'advance': advance}) for task_id, advance in zip(values, values)]
+
+
+# --------------------------------- Values ---------------------------------- #
+
+
+def _put_fields(out: bytearray, fields: dict[str, Any]) -> None:
+    out.append(len(fields))
+    for key, value in fields.items():
+        out.append(_FIELD_IDS[key])
+        _put(out, value)
+
+
+def _get_fields(data: bytes, pos: int) -> tuple[dict[str, Any], int]:
+    n = data[pos]
+    pos += 1
+    fields = {}
+    for _ in range(n):
+        key = _FIELDS[data[pos]]
+        fields[key], pos = _get(data, pos + 1)
+    return fields, pos
+
+
+def _put(out: bytearray, value: Any) -> None:
+    cls = type(value)
+    if cls is int:
+        out += _TAGGED_INT.pack(_INT_TAG, value)
+    elif cls is str:
+        raw = value.encode('utf-8', 'surrogatepass')
+        out += _TAGGED_LEN.pack(_STR, len(raw))
+        out += raw
+    elif cls is bool:
+        out.append(_TRUE if value else _FALSE)
+    elif value is None:
+        out.append(_NONE)
+    elif cls is float:
+        out += _TAGGED_FLOAT.pack(_FLOAT_TAG, value)
+    elif cls is list:
+        # apply_updates batches: [(task_id, {field: value}), ...]
+        out += _TAGGED_LEN.pack(_UPDATES, len(value))
+        for task_id, fields in value:
+            if type(task_id) is not int or len(fields) > 255:
+                raise _Unencodable
+            out += _INT.pack(task_id)
+            _put_fields(out, fields)
+    else:
+        raise _Unencodable
+
+
+def _get(data: bytes, pos: int) -> tuple[Any, int]:
+    tag = data[pos]
+    pos += 1
+    if tag == _INT_TAG:
+        return _INT.unpack_from(data, pos)[0], pos + 8
+    if tag == _STR:
+        (n,) = _LEN.unpack_from(data, pos)
+        pos += 4
+        return data[pos:pos + n].decode('utf-8', 'surrogatepass'), pos + n
+    if tag == _TRUE:
+        return True, pos
+    if tag == _FALSE:
+        return False, pos
+    if tag == _NONE:
+        return None, pos
+    if tag == _FLOAT_TAG:
+        return _FLOAT.unpack_from(data, pos)[0], pos + 8
+    if tag == _UPDATES:
+        (n,) = _LEN.unpack_from(data, pos)
+        pos += 4
+        updates = []
+        for _ in range(n):
+            (task_id,) = _INT.unpack_from(data, pos)
+            fields, pos = _get_fields(data, pos + 8)
+            updates.append((task_id, fields))
+        return updates, pos
+    raise ValueError(f"Unknown wire value tag {tag}.")
@@ -67,6 +67,36 @@ def test_bar_open_close_tracks_runtime_instances():
         bar.close()
 
 
+def test_instance_registry_indexes_and_drops_dead_bars():
+    import gc
+    from mqdm.runtime import InstanceRegistry
+
+    registry = InstanceRegistry()
+    bars = [M.mqdm(disable=True) for _ in range(6)]
+    for bar in bars:
+        registry.add(bar)
+    registry.add(bars[0])  # re-adding keeps the original position
+
+    assert len(registry) == 6
+    assert registry.get() is bars[-1]
+    assert registry.get(0) is bars[0]
+
+    registry.remove(bars[-1])
+    registry.remove(bars[1])
+    assert registry.get() is bars[-2]
+    assert registry.get(1) is bars[2]
+    assert registry.get(-4) is bars[0]
+    assert registry._holes == 1  # lookups don't compact around the removed bar
+
+    del bars[2]
+    gc.collect()
+    assert len(registry) == 3
+    assert registry.bars() == [bars[0], bars[2], bars[3]]
+    assert hash(bars[0]) in registry
+    with pytest.raises(IndexError):
+        registry.get(3)
+
+
 def test_bar_close_flushes_buffered_fast_advance():
     runtime = M.Runtime(backend_options={'refresh_per_second': 0.1})
     bar = M.mqdm(total=5, runtime=runtime)
@@ -221,12 +251,71 @@ def test_constructor_leave_overrides_conflicting_transient():
     assert bar._process_args(leave=False, transient=False)["transient"] is True
 
 
-def test_bar_del_swallows_late_close_errors():
+def test_bar_del_swallows_late_close_errors(monkeypatch):
     bar = M.mqdm(disable=True)
 
-    def fail_close(remove=None):
+    def fail_close(self, remove=None):
         raise KeyError(1)
 
-    bar.close = fail_close
+    monkeypatch.setattr(type(bar), "close", fail_close)
 
     bar.__del__()
+
+
+def test_fast_advance_samples_clock_instead_of_every_call(monkeypatch):
+    import mqdm.bar as bar_module
+    from time import monotonic
+
+    reads = []
+    monkeypatch.setattr(bar_module, "monotonic", lambda: reads.append(1) or monotonic())
+    runtime = M.Runtime(backend_options={'refresh_per_second': 0.1})
+    bar = M.mqdm(total=10_000, runtime=runtime)
+
+    try:
+        for _ in range(10_000):
+            bar.advance()
+        assert len(reads) < 100
+
+        bar.close()
+        assert bar._task_dict["completed"] == 10_000
+    finally:
+        bar.close()
+
+
+def test_fast_advance_flushes_within_a_frame_when_a_fast_loop_slows_down(monkeypatch):
+    import time
+    import mqdm.bar as bar_module
+
+    flushed = []
+    flush = bar_module._FastAdvance.flush
+    monkeypatch.setattr(bar_module._FastAdvance, "flush", lambda self, *a: flushed.append(self.bar._n + self.n_acc) or flush(self, *a))
+    bar = M.mqdm(total=None, runtime=M.Runtime(create_backend='headless', backend_options={'refresh_per_second': 20}))
+
+    try:
+        for _ in range(200_000):
+            bar.advance()
+        assert bar._fast_advance.n_sample == bar_module.MAX_CLOCK_SKIP  # skipping as much as it can
+        flushed.clear()
+        for _ in range(30):  # 0.3s of slow items is far fewer calls than the skip
+            time.sleep(0.01)
+            bar.advance()
+        assert len(flushed) >= 2 and flushed[0] < 200_030
+    finally:
+        bar.close()
+
+
+def test_fast_advance_max_clock_skip_bounds_sampling(monkeypatch):
+    import mqdm.bar as bar_module
+    from time import monotonic
+
+    reads = []
+    monkeypatch.setattr(bar_module, "monotonic", lambda: reads.append(1) or monotonic())
+    monkeypatch.setattr(bar_module, "MAX_CLOCK_SKIP", 1)
+    bar = M.mqdm(total=100, runtime=M.Runtime(backend_options={'refresh_per_second': 0.1}))
+
+    try:
+        for _ in range(100):
+            bar.advance()
+        assert len(reads) == 100
+    finally:
+        bar.close()
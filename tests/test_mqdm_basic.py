@@ -17,6 +17,26 @@ def _boom(_):
     raise ValueError("boom")
 
 
+def test_import_mqdm_defers_heavy_modules():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, mqdm\n"
+        "heavy = ('rich', 'asyncio', 'concurrent.futures', 'multiprocessing', 'mqdm.events', 'mqdm.utils._dev')\n"
+        "print(' '.join(m for m in heavy if m in sys.modules))\n"
+        "mqdm.configure(create_backend='headless')\n"
+        "assert list(mqdm.mqdm(range(3))) == [0, 1, 2] and 'rich' not in sys.modules\n"
+        "assert mqdm.ipool is mqdm.parallel.pool.ipool and 'concurrent.futures' in sys.modules\n"
+        "assert mqdm.events.EventStream and 'pool' in dir(mqdm)\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert proc.stdout.strip() == ""
+
+    with pytest.raises(AttributeError):
+        M.not_an_attribute
+
+
 def test_mqdm_string_argument_sets_description():
     bar = M.mqdm("hello", disable=True)
 
@@ -37,6 +57,33 @@ def test_mqdm_iter_counts_when_disabled():
     assert bar.total == n_total
 
 
+def test_mqdm_disabled_iter_hands_out_bare_iterator_and_counts_lazily():
+    items = [1, 2, 3, 4]
+    bar = M.mqdm(items, disable=True)
+    it = iter(bar)
+
+    assert type(it) is type(iter(items))  # no per-item wrapper
+    assert bar.n == 0
+    next(it), next(it)
+    assert bar.n == 2
+    for _ in it:
+        pass
+    assert bar.n == 4
+    assert bar.total == 4
+    assert pickle.loads(pickle.dumps(bar)).n == 4
+
+
+def test_mqdm_disabled_iter_counts_unsized_generators():
+    bar = M.mqdm((i for i in range(3)), disable=True)
+    assert list(bar) == [0, 1, 2]
+    assert bar.n == 3
+    assert bar.total is None
+
+    bar.update(2)
+    bar.advance()
+    assert bar.n == 6
+
+
 def test_mqdm_async_iter_counts_when_disabled():
     async def source():
         for i in range(5):
@@ -175,6 +222,53 @@ def test_ipool_as_result_suppresses_raising(pool_mode):
         assert type(results[1].error) is ValueError
 
 
+def _odd_fails(x):
+    if x % 2:
+        raise ValueError(f"odd {x}")
+    return x * 10
+
+
+@pytest.mark.parametrize('pool_mode', ['thread', 'process'])
+def test_ipool_chunks_keep_per_item_outcomes(pool_mode):
+    from mqdm.parallel.pool import _traceback_text
+
+    try:
+        results = list(M.ipool(
+            _odd_fails, range(7), pool_mode=pool_mode, n_workers=2,
+            chunksize_=3, ordered_=True, as_result_=True,
+        ))
+    except (EOFError, PermissionError, OSError) as exc:
+        pytest.skip(f"process pools unavailable in this environment: {exc}")
+    assert [r.index for r in results] == list(range(7))
+    assert [r.value for r in results if r.ok] == [0, 20, 40, 60]
+    assert [str(r.error) for r in results if not r.ok] == ["odd 1", "odd 3", "odd 5"]
+    assert "_odd_fails" in _traceback_text(results[1].error)  # the worker's traceback survives
+
+    with pytest.raises(M.PoolError) as ei:
+        list(M.ipool(_odd_fails, range(7), pool_mode=pool_mode, n_workers=2, chunksize_=3, on_error='finish'))
+    assert sorted(r.index for r in ei.value.results) == [1, 3, 5]
+    assert sorted(M.pool(_odd_fails, range(0, 8, 2), pool_mode=pool_mode, n_workers=2, chunksize_='auto')) == [0, 20, 40, 60]
+
+
+def test_ipool_chunks_emit_task_events_per_item():
+    events = []
+    runtime = M.Runtime(on_event=events.append)
+    assert sorted(M.ipool(lambda x: x, range(5), pool_mode='thread', n_workers=2, chunksize_=2, runtime=runtime)) == list(range(5))
+    finished = sorted(e["context"]["task_index"] for e in events if e["type"] == "task_finished")
+    assert finished == list(range(5))
+
+
+def test_auto_chunksize_scales_with_input_and_workers():
+    from mqdm.parallel.pool import _auto_chunksize
+
+    assert _auto_chunksize(10, 8) == 1
+    assert _auto_chunksize(3200, 8) == 100
+    assert _auto_chunksize(10**6, 8) == 256  # capped so the bar keeps moving
+    assert _auto_chunksize(-1, 8) == 16  # unknown length
+    with pytest.raises(ValueError):
+        list(M.ipool(lambda x: x, range(3), pool_mode='thread', chunksize_=0))
+
+
 def test_ipool_threaded_generator_streams_without_eager_submission():
     submitted = []
 
@@ -198,6 +292,213 @@ def test_ipool_threaded_generator_streams_without_eager_submission():
     assert sorted([first, *rest]) == list(range(5))
 
 
+def test_ipool_prefetch_bounds_submissions_ahead_of_workers():
+    from mqdm.parallel.pool import _make_pool_plan
+
+    submitted = []
+
+    def source():
+        for i in range(8):
+            submitted.append(i)
+            yield i
+
+    def work(x):
+        time.sleep(0.01)
+        return x
+
+    results = M.ipool(work, source(), pool_mode='thread', n_workers=2, prefetch_=4)
+    first = next(results)
+    assert 4 <= len(submitted) <= 5
+    assert sorted([first, *results]) == list(range(8))
+
+    plan_kw = dict(
+        fn=work, iterable=[], desc='', bar_kw=None, n_workers=3, ordered=False, squeeze=False,
+        on_error='cancel', on_interrupt='terminate', interrupt_grace=0, fn_kw={}, runtime=M.Runtime(),
+    )
+    assert _make_pool_plan(pool_mode='process', **plan_kw).max_in_flight == 6
+    assert _make_pool_plan(pool_mode='thread', **plan_kw).max_in_flight == 3
+    with pytest.raises(ValueError):
+        _make_pool_plan(pool_mode='thread', prefetch=0, **plan_kw)
+
+
+def _worker_pid(x):
+    import os
+    for _ in M.mqdm(range(2), desc=f"item {x}"):
+        pass
+    return os.getpid()
+
+
+@pytest.mark.parametrize('pool_mode', ['thread', 'process'])
+def test_pool_object_reuses_workers_across_calls(pool_mode):
+    runtime = M.Runtime(create_backend='headless')
+    try:
+        with M.Pool(2, pool_mode, runtime=runtime) as pool:
+            first = pool.map(_worker_pid, range(6))
+            with pytest.raises(ValueError, match="odd"):
+                pool.map(_odd_fails, range(4))
+            results = pool.map(_odd_fails, range(4), as_result_=True)
+            second = pool.map(_worker_pid, range(6), desc="again")
+            assert pool.submit(_odd_fails, 4).result() == 40
+    except (EOFError, PermissionError, OSError) as exc:
+        pytest.skip(f"process pools unavailable in this environment: {exc}")
+    assert [r.ok for r in results] == [True, False, True, False]
+    if pool_mode == 'process':
+        assert len(set(first) | set(second)) <= 2  # no new processes for later calls
+    assert runtime.pbar is None and runtime.command_dispatch is None  # display closed with the pool
+    with pytest.raises(RuntimeError):
+        pool.map(_worker_pid, range(2))
+
+
+def test_pool_object_dropped_without_close_releases_workers_and_display():
+    import gc
+
+    runtime = M.Runtime(create_backend='headless')
+    pool = M.Pool(2, 'thread', runtime=runtime)
+    assert pool.map(_worker_pid, range(4))
+    executor = pool._executor
+    assert runtime._sustain_depth == 1
+    del pool
+    gc.collect()
+    assert executor._shutdown and runtime._sustain_depth == 0 and runtime.pbar is None
+
+
+def test_ipool_bootstraps_workers_of_a_foreign_executor():
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+    from mqdm.utils._local import _get_local
+
+    events = []
+    runtime = M.Runtime(create_backend='headless', on_event=events.append)
+    with ThreadPoolExecutor(2) as executor:
+        assert sorted(M.ipool(_odd_fails, range(0, 8, 2), pool_mode=executor, runtime=runtime)) == [0, 20, 40, 60]
+        assert M.pool(_worker_pid, range(3), pool_mode=executor, runtime=runtime)
+        assert executor.submit(_odd_fails, 2).result() == 20  # still running
+        # other work on the executor's threads doesn't inherit mqdm's runtime or bar defaults
+        assert executor.submit(lambda: (_get_local('runtime'), _get_local('defaults'))).result() == (None, None)
+    finished = [e["context"] for e in events if e["type"] == "task_finished"]
+    assert len(finished) == 7 and all(isinstance(ctx["worker"], int) for ctx in finished)
+
+    with ProcessPoolExecutor(2) as executor:
+        runtime = M.Runtime(create_backend='headless')  # workers connect over a socket on their own
+        try:
+            first = M.pool(_worker_pid, range(4), pool_mode=executor, runtime=runtime)
+            second = M.pool(_worker_pid, range(4), pool_mode=executor, runtime=runtime, chunksize_=2)
+        except (EOFError, PermissionError, OSError) as exc:
+            pytest.skip(f"process pools unavailable in this environment: {exc}")
+        assert runtime.command_dispatch is None and runtime._transport_options == {}  # only for that display
+
+        runtime.get_pbar(pool_mode='process')  # the display already serves a queue-channel pool
+        try:
+            with pytest.raises(RuntimeError, match="'queue' channel"):
+                M.pool(_odd_fails, range(2), pool_mode=executor, runtime=runtime)
+        finally:
+            runtime.clear_pbar(force=True)
+    assert len(set(first) | set(second)) <= 2
+
+
+def test_ipool_reports_futures_cancelled_by_their_executor():
+    from concurrent.futures import CancelledError, Executor, Future
+
+    class CancellingExecutor(Executor):  # like a shutdown(cancel_futures=True) from elsewhere
+        _max_workers = 2
+
+        def submit(self, fn, *args, **kw):
+            future = Future()
+            future.cancel()
+            return future
+
+    runtime = M.Runtime(create_backend='headless', transport_options={'channel': 'socket'})
+    results = list(M.ipool(_odd_fails, range(3), pool_mode=CancellingExecutor(), runtime=runtime, as_result_=True))
+    assert len(results) == 3 and all(isinstance(r.error, CancelledError) for r in results)
+
+
+def _scaled(x, factor=1, table=()):
+    return x * factor + len(table)
+
+
+def test_process_pools_send_fn_and_shared_kwargs_once_per_worker():
+    from mqdm.parallel.executor import SharedCall, SharedCallMissing
+
+    table = list(range(10_000))
+    shared = SharedCall(_scaled, {'table': table})
+    assert len(pickle.dumps(shared)) < 200 < len(pickle.dumps(shared.inline()))
+    stub = pickle.loads(pickle.dumps(SharedCall(_scaled, {})))  # this process never registered it
+    with pytest.raises(SharedCallMissing):
+        stub(1)
+
+    try:
+        items = [0, 1, M.args(2, factor=10)]
+        assert M.pool(_scaled, items, pool_mode='process', n_workers=2, factor=3, table=table) == [10_000, 10_003, 10_020]
+        with M.Pool(2) as pool:  # workers started before the calls: fetched on a miss
+            assert pool.map(_scaled, items, factor=3) == [0, 3, 20]
+            assert pool.map(_scaled, items, factor=5, chunksize_=2) == [0, 5, 20]
+    except (EOFError, PermissionError, OSError) as exc:
+        pytest.skip(f"process pools unavailable in this environment: {exc}")
+
+
+def _flip_bytes(data, n=1):
+    assert isinstance(data, (bytes, bytearray, memoryview))  # never the wrapper
+    return M.shared(bytes(memoryview(data)[::-1]) * n)
+
+
+@pytest.mark.parametrize('pool_mode', ['thread', 'process'])
+def test_shared_buffers_round_trip_through_pools(pool_mode):
+    import gc
+    import os
+
+    blocks = set(os.listdir('/dev/shm')) if os.path.isdir('/dev/shm') else None
+    data = M.shared(b'abc' * 1000)
+    try:
+        results = M.pool(_flip_bytes, [data, M.args(data, n=2), M.shared(bytearray(b'xy'))], pool_mode=pool_mode, n_workers=2)
+    except (EOFError, PermissionError, OSError) as exc:
+        pytest.skip(f"process pools unavailable in this environment: {exc}")
+    assert [bytes(out) for out in results] == [b'cba' * 1000, b'cba' * 2000, b'yx']
+    assert all(isinstance(out, memoryview if pool_mode == 'process' else bytes) for out in results)
+
+    del data, results
+    gc.collect()
+    if blocks is not None:
+        assert set(os.listdir('/dev/shm')) <= blocks  # arguments and results all unlinked
+    with pytest.raises(TypeError):
+        M.shared([1, 2, 3])
+
+
+@pytest.mark.parametrize('start_method', ['spawn', 'fork'])
+@pytest.mark.parametrize('workers_first', [False, True])
+def test_shared_buffers_keep_the_resource_tracker_quiet(start_method, workers_first):
+    import subprocess
+    import sys
+
+    # Workers that share the parent's resource tracker must leave its
+    # registration alone, or the parent's unlink makes the tracker complain;
+    # workers started before it (with trackers of their own) must drop theirs.
+    code = (
+        "import multiprocessing as mp, os\n"
+        "from concurrent.futures import ProcessPoolExecutor\n"
+        "import mqdm\n"
+        "if __name__ == '__main__':\n"
+        f"    executor = ProcessPoolExecutor(2, mp_context=mp.get_context({start_method!r}))\n"
+        f"    if {workers_first}:\n"
+        "        assert list(executor.map(abs, range(4))) == [0, 1, 2, 3]\n"
+        "    data = mqdm.shared(b'abc' * 100)\n"
+        "    name = data._block_name()\n"
+        "    with executor:\n"
+        "        assert list(executor.map(len, [data] * 4)) == [300] * 4\n"
+        "    data.close()\n"
+        "    assert not os.path.exists(os.path.join('/dev/shm', name))\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr
+    assert "resource_tracker" not in proc.stderr and "KeyError" not in proc.stderr, proc.stderr
+
+
+def test_shared_numpy_arrays_keep_dtype_and_shape():
+    np = pytest.importorskip("numpy")
+    a = np.arange(12, dtype=np.float32).reshape(3, 4).T
+    view = pickle.loads(pickle.dumps(M.shared(a)))
+    assert view.dtype == a.dtype and view.shape == a.shape
+    assert (view == a).all()
+
+
 def test_ipool_threaded_ordered_mode_buffers_completed_results():
     def work(x):
         time.sleep(0.01 * (3 - x))
@@ -342,6 +643,21 @@ def test_disabled_mqdm_is_pickleable():
     assert restored._fast_advance is None
 
 
+def test_mqdm_is_slotted_and_round_trips_state():
+    import weakref
+
+    bar = M.mqdm(total=10, desc="hello", disable=True)
+    bar.advance(3)
+
+    assert not hasattr(bar, "__dict__")
+    assert not hasattr(bar._fast_advance, "__dict__")
+    assert weakref.ref(bar)() is bar
+
+    restored = pickle.loads(pickle.dumps(bar))
+    assert (restored.n, restored.total, restored._desc) == (3, 10, "hello")
+    assert restored.entered is False and restored.get_desc is None
+
+
 def test_runtime_backend_options_are_runtime_scoped():
     runtime = M.Runtime(backend_options={'refresh_per_second': 0.5, 'expand': True})
 
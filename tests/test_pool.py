@@ -20,7 +20,7 @@ class _DummyBar:
 def test_submit_next_does_not_grow_total_when_plan_total_is_known():
     pbar = _DummyBar()
     executor = _DummyExecutor()
-    plan = SimpleNamespace(fn=lambda x: x, fn_kw={}, total=4, submitted=0)
+    plan = SimpleNamespace(fn=lambda x: x, fn_kw={}, total=4, submitted=0, chunksize=1, bootstrap=None, shared=None, pool_mode="thread")
 
     task = _submit_next(executor, plan, pbar, iter(enumerate([1, 2, 3, 4])))
 
@@ -32,7 +32,7 @@ def test_submit_next_does_not_grow_total_when_plan_total_is_known():
 def test_submit_next_grows_total_when_plan_total_is_unknown():
     pbar = _DummyBar()
     executor = _DummyExecutor()
-    plan = SimpleNamespace(fn=lambda x: x, fn_kw={}, total=-1, discovered_total=0, submitted=0)
+    plan = SimpleNamespace(fn=lambda x: x, fn_kw={}, total=-1, discovered_total=0, submitted=0, chunksize=1, bootstrap=None, shared=None, pool_mode="thread")
 
     task = _submit_next(executor, plan, pbar, iter(enumerate([1])))
 
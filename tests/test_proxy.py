@@ -1,3 +1,4 @@
+import os
 from types import SimpleNamespace
 
 import pytest
@@ -5,8 +6,9 @@ from rich.console import Console
 
 import mqdm as M
 from mqdm.backend.protocols import TaskState
-from mqdm.utils.proxy import CommandHandler, CommandProxyMixin, CommandTransportClosed, LocalTransport, QueueCommandDispatch, QueueTransport, TransportProxy, exposed_methods_for, proxymethod
+from mqdm.utils.proxy import CommandHandler, CommandProxyMixin, CommandTransportClosed, LaneTransport, LocalTransport, PipeTransport, QueueCommandDispatch, QueueTransport, RingTransport, TransportProxy, exposed_methods_for, merge_task_update, proxymethod
 from mqdm.backend.rich import Progress, ProgressProxy
+from mqdm.utils import wire
 
 
 def test_load_task_restores_finished_metadata():
@@ -183,6 +185,62 @@ def test_runtime_process_mode_rejects_non_convertible_backend():
         runtime.get_pbar(pool_mode="process")
 
 
+def _headless_worker(x):
+    for _ in M.mqdm(range(x), desc=f"w{x}"):
+        pass
+    return x
+
+
+def test_headless_backend_tracks_counters_and_round_trips_tasks():
+    from mqdm.backend.headless import HeadlessProgress
+
+    runtime = M.Runtime(create_backend='headless', backend_options={'refresh_per_second': 4, 'expand': True})
+    bar = M.mqdm(total=5, desc="work", runtime=runtime, leave=False)
+    try:
+        pbar = runtime.pbar
+        assert isinstance(pbar, HeadlessProgress)
+        bar.update(2)
+        bar.set(custom="x")
+        task = pbar.dump_task(bar.task_id)
+        assert (task["completed"], task["total"], task["description"]) == (2, 5, "work")
+        assert task["fields"]["custom"] == "x"
+
+        bar.close()
+        assert bar._task_dict["completed"] == 2
+        bar.open()
+        bar.update(3)
+        assert runtime.pbar.dump_task(bar.task_id)["finished_time"] is not None
+    finally:
+        bar.close()
+
+    # snapshots interoperate with the Rich backend
+    restored = Progress(disable=True)
+    restored.load_task(bar._task_dict)
+    assert restored.tasks[0].completed == 5
+
+    with pytest.raises(ValueError, match="Unknown progress backend"):
+        M.Runtime(create_backend='nope')
+
+
+def test_headless_backend_promotes_for_process_pools():
+    from mqdm.backend.headless import HeadlessProgressProxy
+
+    runtime = M.Runtime(create_backend='headless')
+    proxy = runtime.get_pbar(pool_mode="process")
+    try:
+        assert isinstance(proxy, HeadlessProgressProxy)
+        assert proxy.multiprocess
+    finally:
+        runtime.clear_pbar(force=True)
+
+    runtime = M.Runtime(create_backend='headless')
+    try:
+        results = list(M.ipool(_headless_worker, [3, 4], runtime=runtime, pool_mode='process', n_workers=2))
+    except (EOFError, PermissionError, OSError) as exc:
+        pytest.skip(f"process pools unavailable in this environment: {exc}")
+    assert sorted(results) == [3, 4]
+
+
 def test_queue_progress_proxy_rich_console_uses_owner_renderable():
     progress = Progress(disable=True)
     progress.add_task("demo", total=1, completed=0)
@@ -234,6 +292,55 @@ def test_queue_command_dispatch_replays_commands():
     assert target.calls == [(("hello",), {"markup": False})]
 
 
+def test_wire_round_trips_hot_commands_and_falls_back_for_the_rest():
+    messages = [
+        ("send", 7, "apply_updates", ([(1, {"advance": 2}), (2, {"advance": -1})],), {}),
+        ("send", 7, "apply_updates", ([(1, {"advance": 0.5, "description": "é"}), (2, {"completed": 3, "total": None})],), {}),
+        ("send", 7, "insert_task", (4, "x", True, 10, 0, True), {"transient": False}),
+        ("send", 7, "write", ("hello",), {"end": ""}),
+        ("request", 7, "pop_task", (4,), {"remove": True}, (123, 2**63 + 1, 99)),
+    ]
+    for msg in messages:
+        data = wire.encode(*msg[:5], *msg[5:])
+        assert type(data) is bytes
+        assert wire.decode(data) == msg
+
+    assert wire.encode("send", 7, "apply_updates", ([(1, {"custom": 1})],), {}) is None
+    assert wire.encode("send", 7, "write", (object(),), {}) is None
+    assert wire.encode("send", None, "write", ("hi",), {}) is None
+    assert wire.encode("send", 7, "load_task", ({},), {}) is None
+
+
+def test_queue_command_dispatch_replays_compact_messages():
+    import time
+
+    target = SimpleNamespace(batches=[], writes=[])
+    target.apply_updates = target.batches.append
+    target.write = lambda *a, **kw: target.writes.append((a, kw))
+    q = __import__("queue").Queue()
+    dispatch = QueueCommandDispatch(q)
+    target_id = dispatch.register(target)
+    transport = QueueTransport(q, target_id=target_id, closed=dispatch.closed)
+    dispatch.start()
+    try:
+        transport.send("apply_updates", ([(1, {"advance": 3})],), {})
+        transport.send("apply_updates", ([(1, {"mood": "ok"})],), {})  # pickled fallback
+        transport.send("write", ("hi",), {})
+        deadline = time.time() + 1
+        while not target.writes and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        dispatch.stop()
+
+    # (the dispatch may merge both batches into one when it drains them together)
+    merged = {}
+    for batch in target.batches:
+        for task_id, update in batch:
+            merge_task_update(merged.setdefault(task_id, {}), update)
+    assert merged == {1: {"advance": 3, "mood": "ok"}}
+    assert target.writes == [(("hi",), {})]
+
+
 def test_queue_command_dispatch_survives_failing_send():
     # A fire-and-forget send that raises must not kill the dispatch thread, or
     # every later command would be silently dropped (and request-callers hang).
@@ -276,6 +383,301 @@ def test_queue_transport_reuses_one_reply_channel():
         dispatch.stop()
 
 
+def test_pipe_channel_gives_each_thread_its_own_pipe():
+    import threading
+    import time
+
+    target = SimpleNamespace(echo=lambda v: v, calls=[])
+    target.write = lambda v: target.calls.append(v)
+    dispatch = QueueCommandDispatch(channel="pipe")
+    target_id = dispatch.register(target)
+    dispatch.start()
+    transport = dispatch.create_transport(target_id=target_id)  # no target -> worker path
+    try:
+        assert isinstance(transport, PipeTransport)
+        transport.send("write", (1,), {})
+        assert transport.request("echo", (2,), {}) == 2
+        thread = threading.Thread(target=transport.send, args=("write", (3,), {}))
+        thread.start()
+        thread.join()
+        deadline = time.time() + 1
+        while (len(target.calls) < 2 or len(dispatch._pipes) > 1) and time.time() < deadline:
+            time.sleep(0.01)
+        assert target.calls == [1, 3]
+        # the finished thread's pipe closed with it and was dropped; no queue replies
+        assert len(dispatch._pipes) == 1 and not dispatch._reply_ends
+    finally:
+        dispatch.stop()
+
+    with pytest.raises(CommandTransportClosed):
+        transport.request("echo", (4,), {})
+    with pytest.raises(ValueError, match="Unknown command channel"):
+        QueueCommandDispatch(channel="carrier-pigeon")
+
+
+def test_lanes_channel_keeps_sender_order_across_lanes():
+    calls = []
+    tasks = {}
+
+    def apply_updates(updates):
+        calls.append("apply")
+        for task_id, update in updates:
+            if task_id in tasks:
+                tasks[task_id] += update.get("advance", 0)
+
+    def insert_task(task_id):
+        calls.append("insert")
+        tasks[task_id] = 0
+
+    target = SimpleNamespace(apply_updates=apply_updates, insert_task=insert_task, dump=lambda: dict(tasks))
+    dispatch = QueueCommandDispatch(channel="lanes")
+    target_id = dispatch.register(target)
+    transport = dispatch.create_transport(target_id=target_id)
+    assert isinstance(transport, LaneTransport)
+
+    # An update that overtakes the insert_task sent before it waits for it.
+    sender = ("w", 1)
+    batch = []
+    dispatch._accept_progress((sender, 1, 1, ("send", target_id, "apply_updates", ([(5, {"advance": 2})],), {})), batch)
+    assert not batch and calls == []
+    dispatch._handle_control((sender, 0, ("send", target_id, "insert_task", (5,), {})))
+    assert calls == ["insert", "apply"] and tasks == {5: 2}
+
+    # A request sees every update its sender sent before it.
+    dispatch.start()
+    try:
+        transport.send("insert_task", (1,), {})
+        for _ in range(50):
+            transport.send("apply_updates", ([(1, {"advance": 1})],), {})
+        assert transport.request("dump", (), {}) == {1: 50, 5: 2}
+    finally:
+        dispatch.stop()
+
+
+@pytest.mark.parametrize("channel", ["pipe", "lanes", "socket", "ring"])
+def test_alternate_channels_run_process_pools(channel):
+    runtime = M.Runtime(create_backend='headless', transport_options={'channel': channel})
+    try:
+        results = list(M.ipool(_headless_worker, [3, 4], runtime=runtime, pool_mode='process', n_workers=2))
+    except (EOFError, PermissionError, OSError) as exc:
+        pytest.skip(f"process pools unavailable in this environment: {exc}")
+    assert sorted(results) == [3, 4]
+
+
+@pytest.mark.parametrize("channel", ["queue", "lanes"])
+def test_bounded_queue_merges_or_drops_updates_but_keeps_control(channel):
+    tasks = {1: 0}
+    lines = []
+
+    def apply_updates(updates):
+        for task_id, update in updates:
+            tasks[task_id] += update.get("advance", 0)
+
+    target = SimpleNamespace(apply_updates=apply_updates, write=lines.append, dump=lambda: dict(tasks))
+
+    # merge: updates that find the queue full are held and folded together, and
+    # go out ahead of the next control message
+    dispatch = QueueCommandDispatch(channel=channel, maxsize=2)
+    transport = dispatch.create_transport(target_id=dispatch.register(target))
+    for _ in range(5):
+        transport.send("apply_updates", ([(1, {"advance": 1})],), {})
+    assert dispatch.overflow_stats() == {"dropped": 0, "merged": 3}
+    dispatch.start()
+    try:
+        transport.send("write", ("done",), {})
+        assert transport.request("dump", (), {}) == {1: 5}
+        assert lines == ["done"]
+    finally:
+        dispatch.stop()
+
+    # drop: they are discarded
+    tasks[1] = 0
+    dispatch = QueueCommandDispatch(channel=channel, maxsize=1, overflow="drop")
+    transport = dispatch.create_transport(target_id=dispatch.register(target))
+    for _ in range(3):
+        transport.send("apply_updates", ([(1, {"advance": 1})],), {})
+    assert dispatch.overflow_stats() == {"dropped": 2, "merged": 0}
+    dispatch.start()
+    try:
+        assert transport.request("dump", (), {}) == {1: 1}
+    finally:
+        dispatch.stop()
+
+    with pytest.raises(ValueError):
+        QueueCommandDispatch(channel="pipe", maxsize=1)
+    with pytest.raises(ValueError):
+        QueueCommandDispatch(overflow="block")
+
+
+def test_runtime_reports_overflow_across_dispatches():
+    runtime = M.Runtime(create_backend='headless', transport_options={'maxsize': 1})
+    dispatch = runtime._ensure_command_dispatch()
+    dispatch.overflow_counts[1] = 4
+    runtime.shutdown_command_dispatch()
+    dispatch = runtime._ensure_command_dispatch()
+    dispatch.overflow_counts[0] = 1
+    try:
+        assert runtime.overflow_stats() == {"dropped": 1, "merged": 4}
+    finally:
+        runtime.shutdown_command_dispatch()
+    assert runtime.overflow_stats() == {"dropped": 1, "merged": 4}
+    assert M.Runtime().overflow_stats() == {"dropped": 0, "merged": 0}
+
+
+def test_transport_stats_count_methods_bytes_and_request_latency():
+    target = SimpleNamespace(apply_updates=lambda updates: None, write=lambda text: None, echo=lambda v: v)
+    reports = []
+    dispatch = QueueCommandDispatch(stats=True, stats_interval=0.0)
+    dispatch.on_stats = reports.append
+    transport = dispatch.create_transport(target_id=dispatch.register(target))
+    dispatch.start()
+    try:
+        transport.send("write", ("x" * 100,), {})
+        transport.send("apply_updates", ([(1, {"advance": 1})],), {})
+        assert transport.request("echo", (1,), {}) == 1
+        assert transport.request("echo", (2,), {}) == 2  # the stats sent with echo(1) are in
+        stats = dispatch.transport_stats()
+    finally:
+        dispatch.stop()
+
+    assert stats["workers"] == 1
+    assert stats["methods"]["write"]["messages"] == 1
+    assert stats["methods"]["write"]["bytes"] > 100
+    assert stats["methods"]["apply_updates"]["messages"] == 1
+    assert stats["requests"]["count"] >= 1 and stats["requests"]["max_s"] > 0
+    assert sum(stats["requests"]["histogram"].values()) == stats["requests"]["count"]
+    assert stats["queue_depth"]["max"] >= 1
+    assert stats["overflow"] == {"dropped": 0, "merged": 0}
+    assert reports and reports[-1]["workers"] == 1
+    assert QueueCommandDispatch().transport_stats() is None
+
+
+def test_runtime_transport_stats_from_process_pool():
+    events = []
+    runtime = M.Runtime(events.append, create_backend='headless', transport_options={'stats': True})
+    assert runtime.transport_stats() is None
+    try:
+        results = list(M.ipool(_headless_worker, [3, 4], runtime=runtime, pool_mode='process', n_workers=2))
+    except (EOFError, PermissionError, OSError) as exc:
+        pytest.skip(f"process pools unavailable in this environment: {exc}")
+    assert sorted(results) == [3, 4]
+    runtime.shutdown_command_dispatch()
+    stats = runtime.transport_stats()
+    assert stats["workers"] >= 1
+    assert stats["methods"]["reserve_task_ids"]["messages"] >= 1
+    assert stats["methods"]["insert_task"]["messages"] == 2  # reported at worker exit
+    assert stats["requests"]["count"] >= 1
+    assert any(event["type"] == "transport_stats" for event in events)
+
+
+def test_socket_channel_serves_processes_by_address():
+    import subprocess
+    import sys
+    from multiprocessing import AuthenticationError
+    from mqdm.backend.headless import HeadlessProgressProxy
+
+    runtime = M.Runtime(create_backend='headless', transport_options={
+        'channel': 'socket', 'address': ('127.0.0.1', 0), 'authkey': b'mqdm-test'})
+    with runtime.sustain():
+        address = runtime.listen()
+        # a process mqdm didn't start, knowing only the address and key
+        code = (
+            "from mqdm.backend.headless import HeadlessProgressProxy\n"
+            f"proxy = HeadlessProgressProxy.connect({address!r}, authkey=b'mqdm-test')\n"
+            "task_id = proxy.add_task('remote', total=3)\n"
+            "proxy.try_update(task_id, advance=3)\n"
+            "print(proxy.dump_task(task_id)['completed'])\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = {**os.environ, "PYTHONPATH": root}
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60, env=env)
+        assert out.returncode == 0, out.stderr
+        assert float(out.stdout) == 3
+        assert [task.description for task in runtime.pbar.target.tasks] == ["remote"]
+
+        with pytest.raises(AuthenticationError):
+            HeadlessProgressProxy.connect(address, authkey=b'wrong').dump_tasks()
+        # the listener keeps serving after a rejected client
+        assert len(HeadlessProgressProxy.connect(address, authkey=b'mqdm-test').dump_tasks()) == 1
+    assert runtime.command_dispatch is None
+
+    with pytest.raises(ValueError):
+        QueueCommandDispatch(channel="socket", maxsize=4)
+
+
+def test_command_ring_wraps_and_reports_full():
+    import pickle
+    from mqdm.utils.ring import CommandRing
+
+    ring = CommandRing(32)
+    owner = pickle.loads(pickle.dumps(ring))  # attaches by name
+    try:
+        assert ring.write(b"a" * 10) and ring.write(b"b" * 10)
+        assert not ring.write(b"c" * 10)  # 3 x (4 + 10) > 32
+        assert owner.read() == [b"a" * 10, b"b" * 10]
+        assert owner.empty() and owner.read() == []
+        for chunk in (b"x" * 9, b"y" * 13, b"z" * 3):  # the second record wraps around
+            assert ring.write(chunk)
+            assert owner.read() == [chunk]
+    finally:
+        ring.close()
+        owner.close()
+
+
+def test_ring_channel_keeps_sends_ahead_of_requests():
+    lines = []
+    tasks = {}
+
+    def apply_updates(updates):
+        for task_id, update in updates:
+            tasks[task_id] += update.get("advance", 0)
+
+    def insert_task(task_id):
+        tasks[task_id] = 0
+
+    target = SimpleNamespace(apply_updates=apply_updates, insert_task=insert_task, write=lines.append, dump=lambda: dict(tasks))
+    dispatch = QueueCommandDispatch(channel="ring", poll_interval=0.01)
+    transport = dispatch.create_transport(target_id=dispatch.register(target))
+    assert isinstance(transport, RingTransport)
+    transport.ring_size = 256
+    dispatch.start()
+    try:
+        transport.send("insert_task", (1,), {})
+        for _ in range(200):  # more than the ring holds at once
+            transport.send("apply_updates", ([(1, {"advance": 1})],), {})
+        transport.send("write", ("x" * 1000,), {})  # too big for the ring: goes on the queue, in order
+        transport.send("write", ("done",), {})
+        assert transport.request("dump", (), {}) == {1: 200}
+        assert lines == ["x" * 1000, "done"]
+    finally:
+        dispatch.stop()
+    assert not dispatch._rings
+
+    with pytest.raises(ValueError):
+        QueueCommandDispatch(channel="ring", maxsize=4)
+
+
+def test_queue_command_dispatch_stop_wakes_dispatch_and_waiting_requests():
+    import time
+
+    target = SimpleNamespace(echo=lambda v: v)
+    q = __import__("queue").Queue()
+    dispatch = QueueCommandDispatch(q, CommandHandler(target), target_id="t")
+    dispatch.start()
+    transport = QueueTransport(q, target_id="t")
+    assert transport.request("echo", (1,), {}) == 1
+    _, recv_end = transport._reply_channel()
+
+    t0 = time.monotonic()
+    dispatch.stop()  # the sentinel wakes the blocking get; no poll interval to wait out
+    assert time.monotonic() - t0 < 0.5
+
+    # a worker blocked on a reply is told right away instead of at its next poll
+    assert recv_end.poll(0)
+    ok, payload = recv_end.recv()
+    assert not ok and isinstance(payload, CommandTransportClosed)
+
+
 def test_queue_command_dispatch_routes_multiple_targets_over_one_queue():
     first = SimpleNamespace(calls=[])
     second = SimpleNamespace(calls=[])
@@ -460,3 +862,138 @@ def test_exposed_methods_for_uses_proxy_wrapped_methods():
         ask = proxymethod(Target.ask)
 
     assert exposed_methods_for(Proxy) == ("send_only", "ask")
+
+
+def test_merge_task_update_sums_advances_and_keeps_last_fields():
+    pending = {}
+    merge_task_update(pending, {"advance": 2, "description": "a"})
+    merge_task_update(pending, {"advance": 3, "description": None, "started": 1})
+    assert pending == {"advance": 5, "description": "a", "started": 1}
+
+    merge_task_update(pending, {"completed": 10})
+    merge_task_update(pending, {"advance": 1, "started": 2})
+    assert pending == {"completed": 11, "description": "a", "started": 2}
+
+
+def test_worker_progress_proxy_batches_updates_per_frame():
+    q = __import__("queue").SimpleQueue()
+    proxy = ProgressProxy(QueueTransport(q, target_id="t"))  # no target -> worker side
+    proxy.update_interval = 60  # only explicit flushes in this test
+
+    proxy.try_update(1, advance=1)
+    proxy.try_update(2, advance=1, description="two")
+    proxy.try_update(1, advance=4)
+    assert q.empty()
+
+    proxy.write("hello")  # other commands flush pending updates first
+
+    assert q.get() == ("send", "t", "apply_updates", ([(1, {"advance": 5}), (2, {"advance": 1, "description": "two"})],), {})
+    assert q.get() == ("send", "t", "write", ("hello",), {})
+
+
+def test_worker_add_task_reserves_id_blocks_and_inserts_without_waiting():
+    runtime = M.Runtime()
+    progress = Progress(disable=True)
+    owner = progress.convert_proxy(command_dispatch=runtime._ensure_command_dispatch())
+    transport = owner._transport
+    worker = ProgressProxy(QueueTransport(transport.queue, target_id=transport.target_id, closed=transport.closed))
+    worker.task_id_block = 4
+    requests = []
+    request = worker._proxy_request
+    worker._proxy_request = lambda method, args, kwargs: requests.append(method) or request(method, args, kwargs)
+    try:
+        local_id = progress.add_task("owner")
+        ids = [worker.add_task(description=f"w{i}", total=3) for i in range(6)]
+        assert ids == [1, 2, 3, 4, 5, 6]
+        assert requests == ["reserve_task_ids", "reserve_task_ids"]  # one round trip per block
+
+        # commands sent after the fire-and-forget insert see the task
+        assert worker.dump_task(ids[-1])["description"] == "w5"
+        assert progress.add_task("owner again") == 9  # past both reserved blocks
+        assert local_id == 0
+    finally:
+        runtime.shutdown_command_dispatch()
+
+
+def test_progress_apply_updates_replays_batch():
+    progress = Progress(disable=True)
+    first = progress.add_task("one", total=10)
+    second = progress.add_task("two", total=10)
+
+    progress.apply_updates([(first, {"advance": 3}), (second, {"completed": 7, "description": "done"}), (99, {"advance": 1})])
+
+    assert progress.tasks[first].completed == 3
+    assert progress.tasks[second].completed == 7
+    assert progress.tasks[second].description == "done"
+
+
+def test_queue_command_dispatch_coalesces_drained_updates_between_barriers():
+    calls = []
+    target = SimpleNamespace(
+        apply_updates=lambda updates: calls.append(("apply", updates)),
+        write=lambda text: calls.append(("write", text)),
+    )
+    dispatch = QueueCommandDispatch(__import__("queue").Queue())
+    t = dispatch.register(target)
+
+    dispatch._handle_batch([
+        ("send", t, "try_update", (1,), {"advance": 1}),
+        wire.encode("send", t, "apply_updates", ([(1, {"advance": 2}), (2, {"completed": 5})],), {}),
+        ("send", t, "update_", (2,), {"advance": 1, "description": "b"}),
+        ("send", t, "write", ("mid",), {}),
+        ("send", t, "try_update", (1,), {"completed": 9}),
+        ("send", t, "try_update", (1,), {"advance": 1}),
+    ])
+
+    assert calls == [
+        ("apply", [(1, {"advance": 3}), (2, {"completed": 6, "description": "b"})]),
+        ("write", "mid"),
+        ("apply", [(1, {"completed": 10})]),
+    ]
+
+
+def test_worker_counter_slot_writes_through_shared_memory():
+    import pickle
+    import time
+
+    runtime = M.Runtime()
+    progress = Progress(disable=True, shared_counters=8)
+    owner = progress.convert_proxy(command_dispatch=runtime._ensure_command_dispatch())
+    transport = owner._transport
+    worker = ProgressProxy(QueueTransport(transport.queue, target_id=transport.target_id, closed=transport.closed))
+    worker.counters = pickle.loads(pickle.dumps(owner.counters))  # attaches by name
+    try:
+        assert owner.counter(0) is None  # the owner updates its Progress directly
+        task_id = worker.add_task(description="shm", total=10)
+        counter = worker.counter(task_id)
+        deadline = time.time() + 1
+        while not counter.set(4) and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert progress.dump_task(task_id)["completed"] == 4
+        counter.set(7, total=20)
+        popped = worker.pop_task(task_id)
+        assert (popped["completed"], popped["total"]) == (7, 20)
+        assert not counter.set(8)  # slot released with the task
+    finally:
+        runtime.shutdown_command_dispatch()
+
+
+def _counting_worker(i):
+    for _ in M.mqdm(range(500), desc=f"w{i}", transient=False):
+        pass
+    return i
+
+
+def test_shared_counters_keep_final_counts_of_process_workers():
+    # Updates sent before a slot is claimed must not be overwritten by the empty slot.
+    runtime = M.Runtime(create_backend='headless', backend_options={'shared_counters': 64})
+    try:
+        with runtime.sustain():
+            M.pool(_counting_worker, range(8), pool_mode='process', n_workers=4, runtime=runtime)
+            tasks = runtime.pbar.dump_tasks()
+    except (EOFError, PermissionError, OSError) as exc:
+        pytest.skip(f"process pools unavailable in this environment: {exc}")
+    counts = {t["description"]: t["completed"] for t in tasks.values() if t["description"].startswith("w")}
+    assert counts == {f"w{i}": 500 for i in range(8)}
+    assert all(type(n) is int for n in counts.values())  # not float64 from the table